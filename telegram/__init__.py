@@ -17,113 +17,9 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """A library that provides a Python interface to the Telegram Bot API"""
+import importlib
+import sys
 
-from .base import TelegramObject
-from .botcommand import BotCommand
-from .user import User
-from .files.chatphoto import ChatPhoto
-from .chat import Chat
-from .chatmember import ChatMember
-from .chatpermissions import ChatPermissions
-from .files.photosize import PhotoSize
-from .files.audio import Audio
-from .files.voice import Voice
-from .files.document import Document
-from .files.animation import Animation
-from .files.sticker import Sticker, StickerSet, MaskPosition
-from .files.video import Video
-from .files.contact import Contact
-from .files.location import Location
-from .files.venue import Venue
-from .files.videonote import VideoNote
-from .chataction import ChatAction
-from .dice import Dice
-from .userprofilephotos import UserProfilePhotos
-from .keyboardbutton import KeyboardButton
-from .keyboardbuttonpolltype import KeyboardButtonPollType
-from .replymarkup import ReplyMarkup
-from .replykeyboardmarkup import ReplyKeyboardMarkup
-from .replykeyboardremove import ReplyKeyboardRemove
-from .forcereply import ForceReply
-from .error import TelegramError
-from .files.inputfile import InputFile
-from .files.file import File
-from .parsemode import ParseMode
-from .messageentity import MessageEntity
-from .games.game import Game
-from .poll import Poll, PollOption, PollAnswer
-from .loginurl import LoginUrl
-from .games.callbackgame import CallbackGame
-from .payment.shippingaddress import ShippingAddress
-from .payment.orderinfo import OrderInfo
-from .payment.successfulpayment import SuccessfulPayment
-from .payment.invoice import Invoice
-from .passport.credentials import EncryptedCredentials
-from .passport.passportfile import PassportFile
-from .passport.data import IdDocumentData, PersonalDetails, ResidentialAddress
-from .passport.encryptedpassportelement import EncryptedPassportElement
-from .passport.passportdata import PassportData
-from .inline.inlinekeyboardbutton import InlineKeyboardButton
-from .inline.inlinekeyboardmarkup import InlineKeyboardMarkup
-from .message import Message
-from .callbackquery import CallbackQuery
-from .choseninlineresult import ChosenInlineResult
-from .inline.inputmessagecontent import InputMessageContent
-from .inline.inlinequery import InlineQuery
-from .inline.inlinequeryresult import InlineQueryResult
-from .inline.inlinequeryresultarticle import InlineQueryResultArticle
-from .inline.inlinequeryresultaudio import InlineQueryResultAudio
-from .inline.inlinequeryresultcachedaudio import InlineQueryResultCachedAudio
-from .inline.inlinequeryresultcacheddocument import InlineQueryResultCachedDocument
-from .inline.inlinequeryresultcachedgif import InlineQueryResultCachedGif
-from .inline.inlinequeryresultcachedmpeg4gif import InlineQueryResultCachedMpeg4Gif
-from .inline.inlinequeryresultcachedphoto import InlineQueryResultCachedPhoto
-from .inline.inlinequeryresultcachedsticker import InlineQueryResultCachedSticker
-from .inline.inlinequeryresultcachedvideo import InlineQueryResultCachedVideo
-from .inline.inlinequeryresultcachedvoice import InlineQueryResultCachedVoice
-from .inline.inlinequeryresultcontact import InlineQueryResultContact
-from .inline.inlinequeryresultdocument import InlineQueryResultDocument
-from .inline.inlinequeryresultgif import InlineQueryResultGif
-from .inline.inlinequeryresultlocation import InlineQueryResultLocation
-from .inline.inlinequeryresultmpeg4gif import InlineQueryResultMpeg4Gif
-from .inline.inlinequeryresultphoto import InlineQueryResultPhoto
-from .inline.inlinequeryresultvenue import InlineQueryResultVenue
-from .inline.inlinequeryresultvideo import InlineQueryResultVideo
-from .inline.inlinequeryresultvoice import InlineQueryResultVoice
-from .inline.inlinequeryresultgame import InlineQueryResultGame
-from .inline.inputtextmessagecontent import InputTextMessageContent
-from .inline.inputlocationmessagecontent import InputLocationMessageContent
-from .inline.inputvenuemessagecontent import InputVenueMessageContent
-from .inline.inputcontactmessagecontent import InputContactMessageContent
-from .payment.labeledprice import LabeledPrice
-from .payment.shippingoption import ShippingOption
-from .payment.precheckoutquery import PreCheckoutQuery
-from .payment.shippingquery import ShippingQuery
-from .webhookinfo import WebhookInfo
-from .games.gamehighscore import GameHighScore
-from .update import Update
-from .files.inputmedia import (InputMedia, InputMediaVideo, InputMediaPhoto, InputMediaAnimation,
-                               InputMediaAudio, InputMediaDocument)
-from .bot import Bot
-from .constants import (MAX_MESSAGE_LENGTH, MAX_CAPTION_LENGTH, SUPPORTED_WEBHOOK_PORTS,
-                        MAX_FILESIZE_DOWNLOAD, MAX_FILESIZE_UPLOAD,
-                        MAX_MESSAGES_PER_SECOND_PER_CHAT, MAX_MESSAGES_PER_SECOND,
-                        MAX_MESSAGES_PER_MINUTE_PER_GROUP)
-from .passport.passportelementerrors import (PassportElementError,
-                                             PassportElementErrorDataField,
-                                             PassportElementErrorFile,
-                                             PassportElementErrorFiles,
-                                             PassportElementErrorFrontSide,
-                                             PassportElementErrorReverseSide,
-                                             PassportElementErrorSelfie,
-                                             PassportElementErrorTranslationFile,
-                                             PassportElementErrorTranslationFiles,
-                                             PassportElementErrorUnspecified)
-from .passport.credentials import (Credentials,
-                                   DataCredentials,
-                                   SecureData,
-                                   FileCredentials,
-                                   TelegramDecryptionError)
 from .version import __version__  # noqa: F401
 
 __author__ = 'devs@python-telegram-bot.org'
@@ -162,3 +58,129 @@ __all__ = [
     'PollOption', 'PollAnswer', 'LoginUrl', 'KeyboardButton', 'KeyboardButtonPollType', 'Dice',
     'BotCommand'
 ]
+
+# The modules defining the public names. A module is imported when one of its names is accessed for
+# the first time, so that e.g. the inline query results or the passport and payment types don't
+# slow down importing telegram if they are not used.
+_MODULES = {
+    '.base': ('TelegramObject',),
+    '.botcommand': ('BotCommand',),
+    '.user': ('User',),
+    '.files.chatphoto': ('ChatPhoto',),
+    '.chat': ('Chat',),
+    '.chatmember': ('ChatMember',),
+    '.chatpermissions': ('ChatPermissions',),
+    '.files.photosize': ('PhotoSize',),
+    '.files.audio': ('Audio',),
+    '.files.voice': ('Voice',),
+    '.files.document': ('Document',),
+    '.files.animation': ('Animation',),
+    '.files.sticker': ('Sticker', 'StickerSet', 'MaskPosition'),
+    '.files.video': ('Video',),
+    '.files.contact': ('Contact',),
+    '.files.location': ('Location',),
+    '.files.venue': ('Venue',),
+    '.files.videonote': ('VideoNote',),
+    '.chataction': ('ChatAction',),
+    '.dice': ('Dice',),
+    '.userprofilephotos': ('UserProfilePhotos',),
+    '.keyboardbutton': ('KeyboardButton',),
+    '.keyboardbuttonpolltype': ('KeyboardButtonPollType',),
+    '.replymarkup': ('ReplyMarkup',),
+    '.replykeyboardmarkup': ('ReplyKeyboardMarkup',),
+    '.replykeyboardremove': ('ReplyKeyboardRemove',),
+    '.forcereply': ('ForceReply',),
+    '.error': ('TelegramError',),
+    '.files.inputfile': ('InputFile',),
+    '.files.file': ('File',),
+    '.parsemode': ('ParseMode',),
+    '.messageentity': ('MessageEntity',),
+    '.games.game': ('Game',),
+    '.poll': ('Poll', 'PollOption', 'PollAnswer'),
+    '.loginurl': ('LoginUrl',),
+    '.games.callbackgame': ('CallbackGame',),
+    '.payment.shippingaddress': ('ShippingAddress',),
+    '.payment.orderinfo': ('OrderInfo',),
+    '.payment.successfulpayment': ('SuccessfulPayment',),
+    '.payment.invoice': ('Invoice',),
+    '.passport.credentials': ('EncryptedCredentials', 'Credentials', 'DataCredentials',
+                              'SecureData', 'FileCredentials', 'TelegramDecryptionError'),
+    '.passport.passportfile': ('PassportFile',),
+    '.passport.data': ('IdDocumentData', 'PersonalDetails', 'ResidentialAddress'),
+    '.passport.encryptedpassportelement': ('EncryptedPassportElement',),
+    '.passport.passportdata': ('PassportData',),
+    '.inline.inlinekeyboardbutton': ('InlineKeyboardButton',),
+    '.inline.inlinekeyboardmarkup': ('InlineKeyboardMarkup',),
+    '.message': ('Message',),
+    '.callbackquery': ('CallbackQuery',),
+    '.choseninlineresult': ('ChosenInlineResult',),
+    '.inline.inputmessagecontent': ('InputMessageContent',),
+    '.inline.inlinequery': ('InlineQuery',),
+    '.inline.inlinequeryresult': ('InlineQueryResult',),
+    '.inline.inlinequeryresultarticle': ('InlineQueryResultArticle',),
+    '.inline.inlinequeryresultaudio': ('InlineQueryResultAudio',),
+    '.inline.inlinequeryresultcachedaudio': ('InlineQueryResultCachedAudio',),
+    '.inline.inlinequeryresultcacheddocument': ('InlineQueryResultCachedDocument',),
+    '.inline.inlinequeryresultcachedgif': ('InlineQueryResultCachedGif',),
+    '.inline.inlinequeryresultcachedmpeg4gif': ('InlineQueryResultCachedMpeg4Gif',),
+    '.inline.inlinequeryresultcachedphoto': ('InlineQueryResultCachedPhoto',),
+    '.inline.inlinequeryresultcachedsticker': ('InlineQueryResultCachedSticker',),
+    '.inline.inlinequeryresultcachedvideo': ('InlineQueryResultCachedVideo',),
+    '.inline.inlinequeryresultcachedvoice': ('InlineQueryResultCachedVoice',),
+    '.inline.inlinequeryresultcontact': ('InlineQueryResultContact',),
+    '.inline.inlinequeryresultdocument': ('InlineQueryResultDocument',),
+    '.inline.inlinequeryresultgif': ('InlineQueryResultGif',),
+    '.inline.inlinequeryresultlocation': ('InlineQueryResultLocation',),
+    '.inline.inlinequeryresultmpeg4gif': ('InlineQueryResultMpeg4Gif',),
+    '.inline.inlinequeryresultphoto': ('InlineQueryResultPhoto',),
+    '.inline.inlinequeryresultvenue': ('InlineQueryResultVenue',),
+    '.inline.inlinequeryresultvideo': ('InlineQueryResultVideo',),
+    '.inline.inlinequeryresultvoice': ('InlineQueryResultVoice',),
+    '.inline.inlinequeryresultgame': ('InlineQueryResultGame',),
+    '.inline.inputtextmessagecontent': ('InputTextMessageContent',),
+    '.inline.inputlocationmessagecontent': ('InputLocationMessageContent',),
+    '.inline.inputvenuemessagecontent': ('InputVenueMessageContent',),
+    '.inline.inputcontactmessagecontent': ('InputContactMessageContent',),
+    '.payment.labeledprice': ('LabeledPrice',),
+    '.payment.shippingoption': ('ShippingOption',),
+    '.payment.precheckoutquery': ('PreCheckoutQuery',),
+    '.payment.shippingquery': ('ShippingQuery',),
+    '.webhookinfo': ('WebhookInfo',),
+    '.games.gamehighscore': ('GameHighScore',),
+    '.update': ('Update',),
+    '.files.inputmedia': ('InputMedia', 'InputMediaVideo', 'InputMediaPhoto',
+                          'InputMediaAnimation', 'InputMediaAudio', 'InputMediaDocument'),
+    '.bot': ('Bot',),
+    '.constants': ('MAX_MESSAGE_LENGTH', 'MAX_CAPTION_LENGTH', 'SUPPORTED_WEBHOOK_PORTS',
+                   'MAX_FILESIZE_DOWNLOAD', 'MAX_FILESIZE_UPLOAD',
+                   'MAX_MESSAGES_PER_SECOND_PER_CHAT', 'MAX_MESSAGES_PER_SECOND',
+                   'MAX_MESSAGES_PER_MINUTE_PER_GROUP'),
+    '.passport.passportelementerrors': ('PassportElementError', 'PassportElementErrorDataField',
+                                        'PassportElementErrorFile', 'PassportElementErrorFiles',
+                                        'PassportElementErrorFrontSide',
+                                        'PassportElementErrorReverseSide',
+                                        'PassportElementErrorSelfie',
+                                        'PassportElementErrorTranslationFile',
+                                        'PassportElementErrorTranslationFiles',
+                                        'PassportElementErrorUnspecified'),
+}
+_LAZY_NAMES = {name: module for module, names in _MODULES.items() for name in names}
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported since Python 3.7 (PEP 562)
+    for _name in _LAZY_NAMES:
+        __getattr__(_name)
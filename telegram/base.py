@@ -17,23 +17,333 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Base class for Telegram Objects."""
+import copy
+import sys
 
 try:
     import ujson as json
 except ImportError:
     import json
 
+from telegram.utils.helpers import from_timestamp, to_timestamp
+
+
+_ATTRIBUTES = {}
+_PUBLIC_ATTRIBUTES = {}
+_LAZY_CLASSES = {}
+_FROZEN_CLASSES = {}
+_VARIANT_BASES = {}
+_SERIALIZERS = {}
+
+# Values of these types are put into the result of to_dict as they are
+_PLAIN_TYPES = frozenset((str, int, float, bool, list, tuple, dict))
+
+# The code generated for each kind of attribute in TelegramObject._FIELD_KINDS, see _serializer
+_VALUE = "{0} if {0}.__class__ in plain else {0}.to_dict() if hasattr({0}, 'to_dict') else {0}"
+_KIND_CODE = {
+    None: _VALUE.format('value'),
+    'list': '[{} for item in value]'.format(_VALUE.format('item')),
+    'lists': '[[{} for item in row] for row in value]'.format(_VALUE.format('item')),
+    'timestamp': 'value if value.__class__ is int else to_timestamp(value)',
+}
+
+
+class _Timestamp:
+    """An attribute holding a :obj:`datetime.datetime`, that may be set to the unix timestamp it
+    was decoded from. The timestamp is converted when the attribute is read for the first time, so
+    that decoding and serializing objects needs no datetime conversions. The value is stored in
+    the slot ``slot``, :meth:`TelegramObject.to_dict` uses it as is, if it's still a timestamp."""
+
+    __slots__ = ('slot',)
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if value.__class__ is int:
+            value = from_timestamp(value)
+            # Also for frozen objects, as the value doesn't change
+            object.__setattr__(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
+    def __delete__(self, obj):
+        delattr(obj, self.slot)
+
+
+def _attributes(cls):
+    """Returns the names of the slots of a class and its bases, base classes first."""
+    names = _ATTRIBUTES.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and name not in names:
+                    names.append(name)
+        names = _ATTRIBUTES[cls] = tuple(names)
+    return names
+
+
+def _skip_slotnames(cls):
+    """Makes ``object.__getstate__`` return only the ``__dict__`` of the instances of a class. It
+    also collects the slots listed in ``__slotnames__``, which :meth:`TelegramObject.__getstate__`
+    and :meth:`TelegramObject.to_dict` read themselves."""
+    if '__slotnames__' not in cls.__dict__:
+        cls.__slotnames__ = []
+
+
+if sys.version_info >= (3, 11):
+    def _instance_dict(obj):
+        """Returns the ``__dict__`` of an object, or :obj:`None` if no attribute is stored in it.
+        Unlike reading ``__dict__``, this doesn't create an empty dict for slotted objects."""
+        _skip_slotnames(type(obj))
+        return object.__getstate__(obj)
+
+    _INSTANCE_DICT_CODE = 'getstate(self)'
+else:
+    def _instance_dict(obj):
+        # Before Python 3.11, there is no way to tell without creating the dict
+        return obj.__dict__
+
+    _INSTANCE_DICT_CODE = 'self.__dict__'
+
+
+def _new(cls):
+    return cls.__new__(cls)
+
+
+def _variant(cls, methods):
+    """Returns a subclass of a class with additional methods. Its instances compare, hash, copy
+    and pickle like instances of the class."""
+    def __eq__(self, other):
+        if isinstance(other, cls):
+            return self._id_attrs == other._id_attrs
+        return NotImplemented
+
+    def __hash__(self):
+        if self._id_attrs:
+            return hash((cls, self._id_attrs))
+        return object.__hash__(self)
+
+    def __reduce_ex__(self, protocol):
+        # Copied and pickled as instance of cls
+        return _new, (cls,), self.__getstate__()
+
+    namespace = {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__qualname__': cls.__qualname__,
+        '__eq__': __eq__,
+        '__hash__': __hash__,
+        '__reduce_ex__': __reduce_ex__,
+    }
+    namespace.update(methods)
+    variant = type(cls.__name__, (cls,), namespace)
+    _VARIANT_BASES[variant] = _VARIANT_BASES.get(cls, cls)
+    return variant
+
+
+def _public_type(obj):
+    """Returns the type of an object. For the subclasses created by :func:`_variant`, e.g. for
+    lazily decoded or frozen objects, that's the class they were derived from."""
+    cls = type(obj)
+    return _VARIANT_BASES.get(cls, cls)
+
+
+def _lazy_class(cls):
+    """Returns the subclass of a class that :meth:`TelegramObject._de_json_lazy` creates. Only it
+    defines ``__getattr__``, which would slow down every attribute access of the class itself."""
+    lazy_cls = _LAZY_CLASSES.get(cls)
+    if lazy_cls is None:
+        timestamps = _timestamp_slots(cls)
+
+        def __getattr__(self, name):
+            # Only called for attributes that are not set, i.e. not decoded yet. The slot of a
+            # _Timestamp is read directly by to_dict and pickle
+            attribute = timestamps.get(name, name)
+            decode = cls._LAZY_ATTRIBUTES.get(attribute)
+            if decode is None:
+                raise AttributeError('{!r} object has no attribute {!r}'.format(
+                    cls.__name__, name))
+            data, bot = self._lazy
+            setattr(self, attribute, decode(data, bot))
+            # Read again, as e.g. a _Timestamp converts the value
+            return getattr(self, name)
+
+        lazy_cls = _LAZY_CLASSES[cls] = _variant(cls, {'__getattr__': __getattr__})
+    return lazy_cls
+
+
+def _frozen_class(cls):
+    """Returns the subclass of a class whose instances can not be changed, see :func:`_freeze`."""
+    frozen_cls = _FROZEN_CLASSES.get(cls)
+    if frozen_cls is None:
+        message = '{} objects that are frozen or shared by an InternCache can not be changed, ' \
+                  'use a copy made with copy.copy() instead'.format(cls.__name__)
+
+        def __setattr__(self, name, value):
+            raise AttributeError(message)
+
+        def __delattr__(self, name):
+            raise AttributeError(message)
+
+        frozen_cls = _FROZEN_CLASSES[cls] = _variant(cls, {'__setattr__': __setattr__,
+                                                           '__delattr__': __delattr__})
+    return frozen_cls
+
+
+def _freeze(obj):
+    """Makes an object immutable, so that it can be shared. Copies made with :func:`copy.copy`
+    and unpickled objects can be changed again."""
+    if type(obj) not in _FROZEN_CLASSES.values():
+        obj.__class__ = _frozen_class(type(obj))
+    return obj
+
+
+def _frozen_copy(value):
+    """Returns a frozen copy of a value, in which all lists are replaced by tuples and all
+    :class:`TelegramObject` s by frozen copies."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen_copy(item) for item in value)
+    if not isinstance(value, TelegramObject):
+        return value
+
+    obj = copy.copy(value)
+    for name in _public_attributes(type(obj)):
+        try:
+            setattr(obj, name, _frozen_copy(getattr(obj, name)))
+        except AttributeError:
+            pass
+    return _freeze(obj)
+
+
+def _add_undeclared(undeclared, data):
+    """Adds the attributes of an object that are not declared in ``__slots__``, as returned by
+    :func:`_instance_dict`, to the result of :meth:`TelegramObject.to_dict`."""
+    for key, value in undeclared.items():
+        if key == 'bot' or key.startswith('_'):
+            continue
+
+        if value is not None:
+            if hasattr(value, 'to_dict'):
+                data[key] = value.to_dict()
+            else:
+                data[key] = value
+
+    if data.get('from_user'):
+        data['from'] = data.pop('from_user', None)
+
+
+def _serializer(cls):
+    """Returns the function that :meth:`TelegramObject.to_dict` uses for a class. Its code is
+    generated once per class from the slot names and ``_FIELD_KINDS``, so that serializing needs
+    neither a loop over the attribute names nor any post-processing."""
+    serialize = _SERIALIZERS.get(cls)
+    if serialize is None:
+        lines = ['def to_dict(self):', '    data = {}']
+        for name in _public_attributes(cls):
+            attribute = getattr(cls, name, None)
+            lines.extend([
+                '    try:',
+                '        value = self.{}'.format(
+                    attribute.slot if isinstance(attribute, _Timestamp) else name),
+                '    except AttributeError:',
+                '        value = None',
+                '    if value is not None:',
+                '        data[{!r}] = {}'.format('from' if name == 'from_user' else name,
+                                                 _KIND_CODE[cls._FIELD_KINDS.get(name)]),
+            ])
+        _skip_slotnames(cls)
+        lines.extend(['    undeclared = {}'.format(_INSTANCE_DICT_CODE),
+                      '    if undeclared:',
+                      '        _add_undeclared(undeclared, data)',
+                      '    return data'])
+        namespace = {'plain': _PLAIN_TYPES, 'to_timestamp': to_timestamp,
+                     'getstate': getattr(object, '__getstate__', None),
+                     '_add_undeclared': _add_undeclared}
+        exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+        serialize = _SERIALIZERS[cls] = namespace['to_dict']
+    return serialize
+
+
+def _timestamp_slots(cls):
+    """Returns a dict mapping the slots holding the values of the :class:`_Timestamp` s of a
+    class to the names of the timestamps."""
+    return {attribute.slot: name for klass in cls.__mro__
+            for name, attribute in vars(klass).items() if isinstance(attribute, _Timestamp)}
+
+
+def _public_attributes(cls):
+    """Returns the names of the slots that :meth:`TelegramObject.to_dict` includes. For slots
+    holding the value of a :class:`_Timestamp`, that's the name of the timestamp attribute."""
+    names = _PUBLIC_ATTRIBUTES.get(cls)
+    if names is None:
+        timestamps = _timestamp_slots(cls)
+        names = _PUBLIC_ATTRIBUTES[cls] = tuple(
+            timestamps.get(name, name) for name in _attributes(cls)
+            if name != 'bot' and (name in timestamps or not name.startswith('_')))
+    return names
+
 
 class TelegramObject:
-    """Base class for most telegram objects."""
+    """Base class for most telegram objects.
+
+    The attributes of the subclasses are declared in ``__slots__``, which saves the per instance
+    ``__dict__``. Attributes that are not declared, e.g. those set by subclasses defined outside
+    of this library, are stored in ``__dict__`` as usual.
+
+    """
+
+    __slots__ = ('__dict__',)
 
     _id_attrs = ()
 
+    # How to_dict serializes attributes that are not plain values or TelegramObjects, by attribute
+    # name: 'list' for lists and 'lists' for lists of lists of such values, 'timestamp' for
+    # datetimes, which are converted to unix timestamps
+    _FIELD_KINDS = {}
+
+    # Functions decoding the attributes of objects created by _de_json_lazy from the data and the
+    # bot, by attribute name
+    _LAZY_ATTRIBUTES = {}
+
     def __str__(self):
         return str(self.to_dict())
 
     def __getitem__(self, item):
-        return self.__dict__[item]
+        # getattr also finds the attributes stored in __dict__, but doesn't create it. Methods
+        # and other class attributes are no items
+        if (item in _attributes(type(self)) or item in _public_attributes(type(self))
+                or isinstance(item, str) and not hasattr(type(self), item)):
+            try:
+                return getattr(self, item)
+            except AttributeError:
+                pass
+        raise KeyError(item)
+
+    def __getstate__(self):
+        state = {}
+        for name in _attributes(type(self)):
+            if name in ('_lazy', '_json'):
+                continue
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        undeclared = _instance_dict(self)
+        if undeclared:
+            state.update(undeclared)
+        return state
+
+    def __setstate__(self, state):
+        # Also restores objects pickled before the attributes were declared in __slots__
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @classmethod
     def de_json(cls, data, bot):
@@ -44,6 +354,23 @@ class TelegramObject:
 
         return data
 
+    @classmethod
+    def _de_json_lazy(cls, data, bot):
+        """Like :meth:`de_json`, but keeps ``data`` and decodes the attributes listed in
+        ``_LAZY_ATTRIBUTES`` only when they are accessed for the first time. The class must declare
+        a ``_lazy`` slot."""
+        if not data:
+            return None
+
+        lazy = cls._LAZY_ATTRIBUTES
+        kwargs = dict.fromkeys(lazy)
+        kwargs.update((key, value) for key, value in data.items() if key not in lazy)
+        obj = _lazy_class(cls)(bot=bot, **kwargs)
+        for name in lazy:
+            delattr(obj, name)
+        obj._lazy = (data, bot)
+        return obj
+
     def to_json(self):
         """
         Returns:
@@ -54,22 +381,7 @@ class TelegramObject:
         return json.dumps(self.to_dict())
 
     def to_dict(self):
-        data = dict()
-
-        for key in iter(self.__dict__):
-            if key == 'bot' or key.startswith('_'):
-                continue
-
-            value = self.__dict__[key]
-            if value is not None:
-                if hasattr(value, 'to_dict'):
-                    data[key] = value.to_dict()
-                else:
-                    data[key] = value
-
-        if data.get('from_user'):
-            data['from'] = data.pop('from_user', None)
-        return data
+        return _serializer(type(self))(self)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -29,18 +29,20 @@ try:
 except ImportError:
     import json
 import logging
+import os
 import warnings
 from datetime import datetime
-
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
+from queue import Queue
+from threading import Thread, Lock
 
 from telegram import (User, Message, Update, Chat, ChatMember, UserProfilePhotos, File,
                       ReplyMarkup, TelegramObject, WebhookInfo, GameHighScore, StickerSet,
                       PhotoSize, Audio, Document, Sticker, Video, Animation, Voice, VideoNote,
                       Location, Venue, Contact, InputFile, Poll, BotCommand)
 from telegram.error import InvalidToken, TelegramError
-from telegram.utils.helpers import to_timestamp, DEFAULT_NONE
+from telegram.utils.helpers import to_timestamp, DEFAULT_NONE, DefaultValue
+from telegram.utils.preparedrequest import PreparedRequest
+from telegram.utils.promise import Promise
 from telegram.utils.request import Request
 
 
@@ -49,9 +51,8 @@ def info(func):
     def decorator(self, *args, **kwargs):
         if not self.bot:
             self.get_me()
-
-        if self._commands is None:
-            self.get_my_commands()
+        elif self._identity_stale:
+            self._refresh_identity()
 
         result = func(self, *args, **kwargs)
         return result
@@ -59,16 +60,44 @@ def info(func):
     return decorator
 
 
+# Arguments of the bot methods that telegram.ext.Defaults can set
+DEFAULTABLE_ARGUMENTS = ('parse_mode', 'disable_notification', 'disable_web_page_preview',
+                         'timeout')
+
+
 def log(func, *args, **kwargs):
     logger = logging.getLogger(func.__module__)
 
-    def decorator(self, *args, **kwargs):
+    # Mark the defaults of arguments that telegram.ext.Defaults can set, so that they can be told
+    # apart from explicitly passed values. This is done once per method, not per call or per bot.
+    argspec = inspect.getfullargspec(func)
+    first_default = len(argspec.args) - len(argspec.defaults or ())
+    defaultable = []
+    if argspec.defaults:
+        func_defaults = list(argspec.defaults)
+        for index, name in enumerate(argspec.args[first_default:], first_default):
+            if name in DEFAULTABLE_ARGUMENTS:
+                if not isinstance(func_defaults[index - first_default], DefaultValue):
+                    func_defaults[index - first_default] = DefaultValue(
+                        func_defaults[index - first_default])
+                defaultable.append((index, name))
+        func.__defaults__ = tuple(func_defaults)
+
+    def call(*args, **kwargs):
         logger.debug('Entering: %s', func.__name__)
         result = func(*args, **kwargs)
         logger.debug(result)
         logger.debug('Exiting: %s', func.__name__)
         return result
 
+    def decorator(self, *args, **kwargs):
+        # args[0] is the bot, all named arguments are passed positionally
+        if defaultable:
+            args = args[0]._insert_defaults(args, defaultable)
+        if not kwargs.pop('block', True):
+            return args[0]._run_async(call, args, kwargs)
+        return call(*args, **kwargs)
+
     return decorate(func, decorator)
 
 
@@ -85,40 +114,42 @@ class Bot(TelegramObject):
         private_key_password (:obj:`bytes`, optional): Password for above private key.
         defaults (:class:`telegram.ext.Defaults`, optional): An object containing default values to
             be used if not set explicitly in the bot methods.
+        rate_limiter (:class:`telegram.ext.AdaptiveRateLimiter`, optional): An object throttling
+            the requests made by this bot and retrying them on flood control errors.
+        upload_cache (:class:`telegram.ext.UploadCache`, optional): A cache of the ``file_id`` s
+            of uploaded files, used to avoid uploading the same content again.
+        download_cache (:class:`telegram.ext.DownloadCache`, optional): A cache of downloaded
+            files and of the results of :meth:`get_file`.
+        identity_file (:obj:`str`, optional): Path of a JSON file to keep the results of
+            :meth:`get_me` and :meth:`get_my_commands` in. If the file exists, properties like
+            :attr:`username` are read from it without a request and refreshed in the background
+            on first access.
+        lazy_updates (:obj:`bool`, optional): Whether the sub-objects of the updates returned by
+            :meth:`get_updates` or received by webhook are decoded only when they are accessed
+            for the first time. Defaults to ``False``.
+        intern_cache (:class:`telegram.ext.InternCache`, optional): A cache sharing the
+            :class:`telegram.User` and :class:`telegram.Chat` objects decoded from updates and
+            results, instead of decoding each of them again.
+        keep_raw_updates (:obj:`bool`, optional): Whether the updates returned by
+            :meth:`get_updates` or received by webhook keep the data they were decoded from, see
+            :attr:`telegram.Update.raw_data`. Defaults to ``False``.
+
+    Note:
+        All methods that call the Bot API accept a ``block`` keyword argument. If ``block=False``
+        is passed, the request is sent in the background and a
+        :class:`telegram.utils.promise.Promise` is returned immediately. This allows starting
+        several requests at once, see :meth:`telegram.utils.promise.Promise.gather`. The requests
+        are sent by one thread per connection of the connection pool of :attr:`request`.
+
+        With :attr:`lazy_updates`, :class:`telegram.Update` and the :class:`telegram.Message`
+        objects in it keep the received data and decode attributes like
+        :attr:`telegram.Message.chat`, :attr:`telegram.Message.entities` or
+        :attr:`telegram.Message.reply_to_message` on first access. Handlers that only look at a
+        few attributes, e.g. ``text``, ``chat.id`` and ``from_user.id``, save most of the decoding
+        time. Comparing, :meth:`to_dict` and pickling are not affected.
 
     """
 
-    def __new__(cls, *args, **kwargs):
-        # Get default values from kwargs
-        defaults = kwargs.get('defaults')
-
-        # Make an instance of the class
-        instance = super().__new__(cls)
-
-        if not defaults:
-            return instance
-
-        # For each method ...
-        for method_name, method in inspect.getmembers(instance, predicate=inspect.ismethod):
-            # ... get kwargs
-            argspec = inspect.getargspec(method)
-            kwarg_names = argspec.args[-len(argspec.defaults or []):]
-            # ... check if Defaults has a attribute that matches the kwarg name
-            needs_default = [
-                kwarg_name for kwarg_name in kwarg_names if hasattr(defaults, kwarg_name)
-            ]
-            # ... make a dict of kwarg name and the default value
-            default_kwargs = {
-                kwarg_name: getattr(defaults, kwarg_name) for kwarg_name in needs_default if (
-                    getattr(defaults, kwarg_name) is not DEFAULT_NONE
-                )
-            }
-            # ... apply the defaults using a partial
-            if default_kwargs:
-                setattr(instance, method_name, functools.partial(method, **default_kwargs))
-
-        return instance
-
     def __init__(self,
                  token,
                  base_url=None,
@@ -126,11 +157,27 @@ class Bot(TelegramObject):
                  request=None,
                  private_key=None,
                  private_key_password=None,
-                 defaults=None):
+                 defaults=None,
+                 rate_limiter=None,
+                 upload_cache=None,
+                 download_cache=None,
+                 identity_file=None,
+                 lazy_updates=False,
+                 intern_cache=None,
+                 keep_raw_updates=False):
         self.token = self._validate_token(token)
 
         # Gather default
         self.defaults = defaults
+        self.rate_limiter = rate_limiter
+        self.upload_cache = upload_cache
+        self.download_cache = download_cache
+        self.identity_file = identity_file
+        self.lazy_updates = lazy_updates
+        self.intern_cache = intern_cache
+        self.keep_raw_updates = keep_raw_updates
+        self._async_queue = None
+        self._async_lock = Lock()
 
         if base_url is None:
             base_url = 'https://api.telegram.org/bot'
@@ -142,14 +189,41 @@ class Bot(TelegramObject):
         self.base_file_url = str(base_file_url) + str(self.token)
         self.bot = None
         self._commands = None
+        self._identity_stale = False
+        self._identity_lock = Lock()
         self._request = request or Request()
         self.logger = logging.getLogger(__name__)
 
+        if identity_file and os.path.exists(identity_file):
+            self._load_identity()
+
+        if getattr(self._request, 'prewarm_connections', 0):
+            thread = Thread(target=self._request.warm_up, args=(self.base_url,),
+                            name='Bot:{}:warm_up'.format(self.id))
+            thread.daemon = True
+            thread.start()
+
         if private_key:
+            # cryptography is only imported if needed, as it is slow to import
+            from cryptography.hazmat.backends import default_backend
+            from cryptography.hazmat.primitives import serialization
+
             self.private_key = serialization.load_pem_private_key(private_key,
                                                                   password=private_key_password,
                                                                   backend=default_backend())
 
+    def _insert_defaults(self, args, defaultable):
+        """Replaces the arguments at the (index, name) pairs in defaultable that were not passed
+        explicitly by the value from :attr:`defaults` or the default of the method."""
+        args = list(args)
+        defaults = self.defaults
+        for index, name in defaultable:
+            value = args[index]
+            if isinstance(value, DefaultValue):
+                default = getattr(defaults, name, DEFAULT_NONE) if defaults else DEFAULT_NONE
+                args[index] = value.value if default is DEFAULT_NONE else default
+        return args
+
     def _message(self, url, data, reply_to_message_id=None, disable_notification=None,
                  reply_markup=None, timeout=None, **kwargs):
         if reply_to_message_id is not None:
@@ -159,7 +233,10 @@ class Bot(TelegramObject):
             data['disable_notification'] = disable_notification
 
         if reply_markup is not None:
-            if isinstance(reply_markup, ReplyMarkup):
+            if isinstance(reply_markup, ReplyMarkup) and getattr(reply_markup, '_json', None):
+                # utils.request puts the JSON cached by frozen reply markups into the body as is
+                data['reply_markup'] = reply_markup
+            elif isinstance(reply_markup, ReplyMarkup):
                 # We need to_json() instead of to_dict() here, because reply_markups may be
                 # attached to media messages, which aren't json dumped by utils.request
                 data['reply_markup'] = reply_markup.to_json()
@@ -172,20 +249,139 @@ class Bot(TelegramObject):
             else:
                 data['media'].parse_mode = None
 
-        result = self._request.post(url, data, timeout=timeout)
+        return self._message_result(self._upload(url, data, timeout=timeout))
 
+    def _message_result(self, result):
         if result is True:
             return result
 
-        if self.defaults:
-            result['default_quote'] = self.defaults.quote
-
         return Message.de_json(result, self)
 
+    def _run_async(self, func, args, kwargs):
+        with self._async_lock:
+            if self._async_queue is None:
+                self._async_queue = Queue()
+                for i in range(self._request.con_pool_size):
+                    thread = Thread(target=self._pooled,
+                                    name='Bot:{}:worker:{}'.format(self.token.partition(':')[0],
+                                                                   i))
+                    thread.daemon = True
+                    thread.start()
+        promise = Promise(func, args, kwargs)
+        self._async_queue.put(promise)
+        return promise
+
+    def _pooled(self):
+        while True:
+            self._async_queue.get().run()
+
+    def _post(self, url, data, timeout=None):
+        if self.rate_limiter is None or url.endswith('/getUpdates'):
+            return self._request.post(url, data, timeout=timeout)
+
+        # Request.post converts the values of data in place, so every try needs a fresh copy
+        return self.rate_limiter.process(
+            lambda: self._request.post(url, data.copy(), timeout=timeout),
+            chat_id=data.get('chat_id'))
+
+    def _post_json(self, url, body, timeout=None, chat_id=None):
+        if self.rate_limiter is None:
+            return self._request.post_json(url, body, timeout=timeout)
+
+        return self.rate_limiter.process(
+            lambda: self._request.post_json(url, body, timeout=timeout), chat_id=chat_id)
+
+    def _upload(self, url, data, timeout=None):
+        if self.upload_cache is None:
+            return self._post(url, data, timeout=timeout)
+
+        return self.upload_cache.process(self.token.partition(':')[0], data,
+                                         lambda payload: self._post(url, payload, timeout=timeout))
+
+    def _load_identity(self):
+        try:
+            with open(self.identity_file, 'r') as file:
+                snapshot = json.load(file)
+        except (OSError, ValueError):
+            self.logger.warning('Could not read the identity file %s', self.identity_file)
+            return
+
+        # The file may belong to another bot
+        if (snapshot.get('bot') or {}).get('id') != self.id:
+            return
+        self.bot = User.de_json(snapshot['bot'], self)
+        if snapshot.get('commands') is not None:
+            self._commands = [BotCommand.de_json(c, self) for c in snapshot['commands']]
+        self._identity_stale = True
+
+    def _save_identity(self):
+        if not self.identity_file:
+            return
+        snapshot = {
+            'bot': self.bot.to_dict() if self.bot else None,
+            'commands': ([c.to_dict() for c in self._commands]
+                         if self._commands is not None else None)
+        }
+        with self._identity_lock:
+            tmp_file = '{}.tmp'.format(self.identity_file)
+            try:
+                with open(tmp_file, 'w') as file:
+                    json.dump(snapshot, file)
+                os.replace(tmp_file, self.identity_file)
+            except OSError:
+                self.logger.warning('Could not write the identity file %s', self.identity_file)
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+
+    def _refresh_identity(self):
+        with self._identity_lock:
+            if not self._identity_stale:
+                return
+            self._identity_stale = False
+
+        def refresh():
+            try:
+                self.get_me()
+                self.get_my_commands()
+            except Exception as exc:
+                self.logger.warning('Could not refresh the identity of the bot: %s', exc)
+
+        thread = Thread(target=refresh, name='Bot:{}:identity'.format(self.id))
+        thread.daemon = True
+        thread.start()
+
     @property
     def request(self):
         return self._request
 
+    def prepare(self, method, **kwargs):
+        """Prepares a request to a method sending or editing a message, that is sent repeatedly
+        with only few arguments changing. The passed arguments are validated and encoded once.
+
+        Example:
+            .. code:: python
+
+                welcome = bot.prepare('send_message', text='Welcome!', reply_markup=keyboard)
+                welcome.send(chat_id=chat_id)
+
+        Args:
+            method (:obj:`str`): The name of the method, e.g. ``'send_message'``.
+            **kwargs (:obj:`dict`): The arguments that are the same for every call. The required
+                arguments that are not passed have to be passed to
+                :meth:`telegram.utils.preparedrequest.PreparedRequest.send`.
+
+        Returns:
+            :class:`telegram.utils.preparedrequest.PreparedRequest`
+
+        Raises:
+            TypeError: If an argument is passed that the method does not take.
+            ValueError: If the method does not send or edit a message or uploads files.
+
+        """
+        return PreparedRequest(self, method, kwargs)
+
     @staticmethod
     def _validate_token(token):
         """A very basic validation on token."""
@@ -199,11 +395,11 @@ class Bot(TelegramObject):
         return token
 
     @property
-    @info
     def id(self):
-        """:obj:`int`: Unique identifier for this bot."""
+        """:obj:`int`: Unique identifier for this bot. Taken from the token, so reading it never
+        makes a request."""
 
-        return self.bot.id
+        return int(self.token.partition(':')[0])
 
     @property
     @info
@@ -255,10 +451,14 @@ class Bot(TelegramObject):
         return self.bot.supports_inline_queries
 
     @property
-    @info
     def commands(self):
         """List[:class:`BotCommand`]: Bot's commands."""
 
+        if self._commands is None:
+            self.get_my_commands()
+        elif self._identity_stale:
+            self._refresh_identity()
+
         return self._commands
 
     @property
@@ -289,6 +489,7 @@ class Bot(TelegramObject):
         result = self._request.get(url, timeout=timeout)
 
         self.bot = User.de_json(result, self)
+        self._save_identity()
 
         return self.bot
 
@@ -383,7 +584,7 @@ class Bot(TelegramObject):
 
         data = {'chat_id': chat_id, 'message_id': message_id}
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -1102,11 +1303,7 @@ class Bot(TelegramObject):
         if disable_notification:
             data['disable_notification'] = disable_notification
 
-        result = self._request.post(url, data, timeout=timeout)
-
-        if self.defaults:
-            for res in result:
-                res['default_quote'] = self.defaults.quote
+        result = self._upload(url, data, timeout=timeout)
 
         return [Message.de_json(res, self) for res in result]
 
@@ -1512,7 +1709,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'action': action}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -1611,7 +1808,7 @@ class Bot(TelegramObject):
 
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -1647,7 +1844,7 @@ class Bot(TelegramObject):
             data['limit'] = limit
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return UserProfilePhotos.de_json(result, self)
 
@@ -1692,14 +1889,22 @@ class Bot(TelegramObject):
         except AttributeError:
             pass
 
+        if self.download_cache is not None:
+            result = self.download_cache.get_file_info(file_id)
+            if result is not None:
+                return File.de_json(result, self)
+
         data = {'file_id': file_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         if result.get('file_path'):
             result['file_path'] = '{}/{}'.format(self.base_file_url, result['file_path'])
 
+        if self.download_cache is not None:
+            self.download_cache.put_file_info(file_id, result)
+
         return File.de_json(result, self)
 
     @log
@@ -1739,7 +1944,7 @@ class Bot(TelegramObject):
                 until_date = to_timestamp(until_date)
             data['until_date'] = until_date
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -1771,7 +1976,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'user_id': user_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -1832,7 +2037,7 @@ class Bot(TelegramObject):
             data['cache_time'] = cache_time
         data.update(kwargs)
 
-        result = self._request.post(url_, data, timeout=timeout)
+        result = self._post(url_, data, timeout=timeout)
 
         return result
 
@@ -2135,17 +2340,13 @@ class Bot(TelegramObject):
         # * Long polling poses a different problem: the connection might have been dropped while
         #   waiting for the server to return and there's no way of knowing the connection had been
         #   dropped in real time.
-        result = self._request.post(url, data, timeout=float(read_latency) + float(timeout))
+        result = self._post(url, data, timeout=float(read_latency) + float(timeout))
 
         if result:
             self.logger.debug('Getting updates: %s', [u['update_id'] for u in result])
         else:
             self.logger.debug('No new updates found.')
 
-        if self.defaults:
-            for u in result:
-                u['default_quote'] = self.defaults.quote
-
         return [Update.de_json(u, self) for u in result]
 
     @log
@@ -2239,7 +2440,7 @@ class Bot(TelegramObject):
             data['allowed_updates'] = allowed_updates
         data.update(kwargs)
 
-        result = self._request.post(url_, data, timeout=timeout)
+        result = self._post(url_, data, timeout=timeout)
 
         return result
 
@@ -2266,7 +2467,7 @@ class Bot(TelegramObject):
 
         data = kwargs
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -2294,7 +2495,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -2324,10 +2525,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
-
-        if self.defaults:
-            result['default_quote'] = self.defaults.quote
+        result = self._post(url, data, timeout=timeout)
 
         return Chat.de_json(result, self)
 
@@ -2359,7 +2557,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return [ChatMember.de_json(x, self) for x in result]
 
@@ -2387,7 +2585,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -2416,7 +2614,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'user_id': user_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return ChatMember.de_json(result, self)
 
@@ -2446,7 +2644,7 @@ class Bot(TelegramObject):
 
         data = {'chat_id': chat_id, 'sticker_set_name': sticker_set_name}
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -2473,10 +2671,11 @@ class Bot(TelegramObject):
 
         data = {'chat_id': chat_id}
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
+    @log
     def get_webhook_info(self, timeout=None, **kwargs):
         """Use this method to get current webhook status. Requires no parameters.
 
@@ -2496,7 +2695,7 @@ class Bot(TelegramObject):
 
         data = kwargs
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return WebhookInfo.de_json(result, self)
 
@@ -2602,7 +2801,7 @@ class Bot(TelegramObject):
             data['inline_message_id'] = inline_message_id
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return [GameHighScore.de_json(hs, self) for hs in result]
 
@@ -2793,7 +2992,7 @@ class Bot(TelegramObject):
             data['error_message'] = error_message
         data.update(kwargs)
 
-        result = self._request.post(url_, data, timeout=timeout)
+        result = self._post(url_, data, timeout=timeout)
 
         return result
 
@@ -2846,7 +3045,7 @@ class Bot(TelegramObject):
             data['error_message'] = error_message
         data.update(kwargs)
 
-        result = self._request.post(url_, data, timeout=timeout)
+        result = self._post(url_, data, timeout=timeout)
 
         return result
 
@@ -2893,7 +3092,7 @@ class Bot(TelegramObject):
             data['until_date'] = until_date
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -2964,7 +3163,7 @@ class Bot(TelegramObject):
             data['can_promote_members'] = can_promote_members
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -2996,7 +3195,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'permissions': permissions.to_dict()}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3034,7 +3233,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'user_id': user_id, 'custom_title': custom_title}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3065,7 +3264,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3100,7 +3299,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'photo': photo}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3131,7 +3330,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3163,7 +3362,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'title': title}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3195,7 +3394,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id, 'description': description}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3235,7 +3434,7 @@ class Bot(TelegramObject):
             data['disable_notification'] = disable_notification
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3267,7 +3466,7 @@ class Bot(TelegramObject):
         data = {'chat_id': chat_id}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3294,7 +3493,7 @@ class Bot(TelegramObject):
         data = {'name': name}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return StickerSet.de_json(result, self)
 
@@ -3334,7 +3533,7 @@ class Bot(TelegramObject):
         data = {'user_id': user_id, 'png_sticker': png_sticker}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return File.de_json(result, self)
 
@@ -3413,7 +3612,7 @@ class Bot(TelegramObject):
             data['mask_position'] = mask_position.to_json()
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3483,7 +3682,7 @@ class Bot(TelegramObject):
             data['mask_position'] = mask_position.to_json()
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3511,7 +3710,7 @@ class Bot(TelegramObject):
         data = {'sticker': sticker, 'position': position}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3538,7 +3737,7 @@ class Bot(TelegramObject):
         data = {'sticker': sticker}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3580,7 +3779,7 @@ class Bot(TelegramObject):
         data = {'name': name, 'user_id': user_id, 'thumb': thumb}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return result
 
@@ -3617,7 +3816,7 @@ class Bot(TelegramObject):
         data = {'user_id': user_id, 'errors': [error.to_dict() for error in errors]}
         data.update(kwargs)
 
-        result = self._request.post(url_, data, timeout=timeout)
+        result = self._post(url_, data, timeout=timeout)
 
         return result
 
@@ -3765,14 +3964,17 @@ class Bot(TelegramObject):
         }
 
         if reply_markup:
-            if isinstance(reply_markup, ReplyMarkup):
+            if isinstance(reply_markup, ReplyMarkup) and getattr(reply_markup, '_json', None):
+                # utils.request puts the JSON cached by frozen reply markups into the body as is
+                data['reply_markup'] = reply_markup
+            elif isinstance(reply_markup, ReplyMarkup):
                 # We need to_json() instead of to_dict() here, because reply_markups may be
                 # attached to media messages, which aren't json dumped by utils.request
                 data['reply_markup'] = reply_markup.to_json()
             else:
                 data['reply_markup'] = reply_markup
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         return Poll.de_json(result, self)
 
@@ -3849,6 +4051,7 @@ class Bot(TelegramObject):
         result = self._request.get(url, timeout=timeout)
 
         self._commands = [BotCommand.de_json(c, self) for c in result]
+        self._save_identity()
 
         return self._commands
 
@@ -3880,11 +4083,12 @@ class Bot(TelegramObject):
         data = {'commands': [c.to_dict() for c in cmds]}
         data.update(kwargs)
 
-        result = self._request.post(url, data, timeout=timeout)
+        result = self._post(url, data, timeout=timeout)
 
         # Set commands. No need to check for outcome.
         # If request failed, we won't come this far
-        self._commands = commands
+        self._commands = cmds
+        self._save_identity()
 
         return result
 
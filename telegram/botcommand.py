@@ -34,6 +34,9 @@ class BotCommand(TelegramObject):
             English letters, digits and underscores.
         description (:obj:`str`): Description of the command, 3-256 characters.
     """
+
+    __slots__ = ('command', 'description')
+
     def __init__(self, command, description, **kwargs):
         self.command = command
         self.description = description
@@ -70,6 +70,9 @@ class CallbackQuery(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'from_user', 'chat_instance', 'message', 'data', 'inline_message_id',
+                 'game_short_name', 'bot', '_id_attrs')
+
     def __init__(self,
                  id,
                  from_user,
@@ -102,10 +105,7 @@ class CallbackQuery(TelegramObject):
         data = super().de_json(data, bot)
 
         data['from_user'] = User.de_json(data.get('from'), bot)
-        message = data.get('message')
-        if message:
-            message['default_quote'] = data.get('default_quote')
-        data['message'] = Message.de_json(message, bot)
+        data['message'] = Message.de_json(data.get('message'), bot)
 
         return cls(bot=bot, **data)
 
@@ -78,6 +78,11 @@ class Chat(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'type', 'title', 'username', 'first_name', 'last_name',
+                 'all_members_are_administrators', 'photo', 'description', 'invite_link',
+                 'pinned_message', 'permissions', 'slow_mode_delay', 'sticker_set_name',
+                 'can_set_sticker_set', 'bot', '_id_attrs')
+
     PRIVATE = 'private'
     """:obj:`str`: 'private'"""
     GROUP = 'group'
@@ -139,15 +144,22 @@ class Chat(TelegramObject):
         if not data:
             return None
 
-        data['photo'] = ChatPhoto.de_json(data.get('photo'), bot)
+        cache = getattr(bot, 'intern_cache', None)
+        if cache is not None:
+            chat = cache.get(cls, data)
+            if chat is not None:
+                return chat
+
+        kwargs = super().de_json(data, bot)
+        kwargs['photo'] = ChatPhoto.de_json(data.get('photo'), bot)
         from telegram import Message
-        pinned_message = data.get('pinned_message')
-        if pinned_message:
-            pinned_message['default_quote'] = data.get('default_quote')
-        data['pinned_message'] = Message.de_json(pinned_message, bot)
-        data['permissions'] = ChatPermissions.de_json(data.get('permissions'), bot)
+        kwargs['pinned_message'] = Message.de_json(data.get('pinned_message'), bot)
+        kwargs['permissions'] = ChatPermissions.de_json(data.get('permissions'), bot)
+        chat = cls(bot=bot, **kwargs)
 
-        return cls(bot=bot, **data)
+        if cache is not None:
+            cache.put(cls, data, chat)
+        return chat
 
     def send_action(self, *args, **kwargs):
         """Shortcut for::
@@ -19,7 +19,7 @@
 """This module contains an object that represents a Telegram ChatMember."""
 
 from telegram import User, TelegramObject
-from telegram.utils.helpers import to_timestamp, from_timestamp
+from telegram.utils.helpers import from_timestamp
 
 
 class ChatMember(TelegramObject):
@@ -102,6 +102,16 @@ class ChatMember(TelegramObject):
             web page previews to his messages, implies can_send_media_messages.
 
     """
+
+    __slots__ = ('user', 'status', 'custom_title', 'until_date', 'can_be_edited',
+                 'can_change_info', 'can_post_messages', 'can_edit_messages',
+                 'can_delete_messages', 'can_invite_users', 'can_restrict_members',
+                 'can_pin_messages', 'can_promote_members', 'can_send_messages',
+                 'can_send_media_messages', 'can_send_polls', 'can_send_other_messages',
+                 'can_add_web_page_previews', 'is_member', '_id_attrs')
+
+    _FIELD_KINDS = {'until_date': 'timestamp'}
+
     ADMINISTRATOR = 'administrator'
     """:obj:`str`: 'administrator'"""
     CREATOR = 'creator'
@@ -156,10 +166,3 @@ class ChatMember(TelegramObject):
         data['until_date'] = from_timestamp(data.get('until_date', None))
 
         return cls(**data)
-
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['until_date'] = to_timestamp(self.until_date)
-
-        return data
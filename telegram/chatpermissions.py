@@ -71,6 +71,10 @@ class ChatPermissions(TelegramObject):
 
     """
 
+    __slots__ = ('can_send_messages', 'can_send_media_messages', 'can_send_polls',
+                 'can_send_other_messages', 'can_add_web_page_previews', 'can_change_info',
+                 'can_invite_users', 'can_pin_messages')
+
     def __init__(self, can_send_messages=None, can_send_media_messages=None, can_send_polls=None,
                  can_send_other_messages=None, can_add_web_page_previews=None,
                  can_change_info=None, can_invite_users=None, can_pin_messages=None, **kwargs):
@@ -50,6 +50,8 @@ class ChosenInlineResult(TelegramObject):
 
     """
 
+    __slots__ = ('result_id', 'from_user', 'query', 'location', 'inline_message_id', '_id_attrs')
+
     def __init__(self,
                  result_id,
                  from_user,
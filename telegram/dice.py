@@ -44,6 +44,9 @@ class Dice(TelegramObject):
         value (:obj:`int`): Value of the dice. 1-6 for dice and darts, 1-5 for basketball.
         emoji (:obj:`str`): Emoji on which the dice throw animation is based.
     """
+
+    __slots__ = ('value', 'emoji')
+
     def __init__(self, value, emoji, **kwargs):
         self.value = value
         self.emoji = emoji
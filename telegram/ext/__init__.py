@@ -17,33 +17,8 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """Extensions over the Telegram Bot API to facilitate bot making"""
-
-from .basepersistence import BasePersistence
-from .picklepersistence import PicklePersistence
-from .dictpersistence import DictPersistence
-from .handler import Handler
-from .callbackcontext import CallbackContext
-from .dispatcher import Dispatcher, DispatcherHandlerStop, run_async
-from .jobqueue import JobQueue, Job
-from .updater import Updater
-from .callbackqueryhandler import CallbackQueryHandler
-from .choseninlineresulthandler import ChosenInlineResultHandler
-from .inlinequeryhandler import InlineQueryHandler
-from .filters import BaseFilter, Filters
-from .messagehandler import MessageHandler
-from .commandhandler import CommandHandler, PrefixHandler
-from .regexhandler import RegexHandler
-from .stringcommandhandler import StringCommandHandler
-from .stringregexhandler import StringRegexHandler
-from .typehandler import TypeHandler
-from .conversationhandler import ConversationHandler
-from .precheckoutqueryhandler import PreCheckoutQueryHandler
-from .shippingqueryhandler import ShippingQueryHandler
-from .messagequeue import MessageQueue
-from .messagequeue import DelayQueue
-from .pollanswerhandler import PollAnswerHandler
-from .pollhandler import PollHandler
-from .defaults import Defaults
+import importlib
+import sys
 
 __all__ = ('Dispatcher', 'JobQueue', 'Job', 'Updater', 'CallbackQueryHandler',
            'ChosenInlineResultHandler', 'CommandHandler', 'Handler', 'InlineQueryHandler',
@@ -52,4 +27,63 @@ __all__ = ('Dispatcher', 'JobQueue', 'Job', 'Updater', 'CallbackQueryHandler',
            'PreCheckoutQueryHandler', 'ShippingQueryHandler', 'MessageQueue', 'DelayQueue',
            'DispatcherHandlerStop', 'run_async', 'CallbackContext', 'BasePersistence',
            'PicklePersistence', 'DictPersistence', 'PrefixHandler', 'PollAnswerHandler',
-           'PollHandler', 'Defaults')
+           'PollHandler', 'Defaults', 'AdaptiveRateLimiter', 'Broadcast',
+           'EditCoalescer', 'UploadCache', 'DownloadCache', 'InternCache',
+           'UpdateArchive')
+
+# The modules defining the public names, imported when one of their names is accessed for the first
+# time, see telegram.__getattr__
+_MODULES = {
+    '.basepersistence': ('BasePersistence',),
+    '.picklepersistence': ('PicklePersistence',),
+    '.dictpersistence': ('DictPersistence',),
+    '.handler': ('Handler',),
+    '.callbackcontext': ('CallbackContext',),
+    '.dispatcher': ('Dispatcher', 'DispatcherHandlerStop', 'run_async'),
+    '.jobqueue': ('JobQueue', 'Job'),
+    '.updater': ('Updater',),
+    '.callbackqueryhandler': ('CallbackQueryHandler',),
+    '.choseninlineresulthandler': ('ChosenInlineResultHandler',),
+    '.inlinequeryhandler': ('InlineQueryHandler',),
+    '.filters': ('BaseFilter', 'Filters'),
+    '.messagehandler': ('MessageHandler',),
+    '.commandhandler': ('CommandHandler', 'PrefixHandler'),
+    '.regexhandler': ('RegexHandler',),
+    '.stringcommandhandler': ('StringCommandHandler',),
+    '.stringregexhandler': ('StringRegexHandler',),
+    '.typehandler': ('TypeHandler',),
+    '.conversationhandler': ('ConversationHandler',),
+    '.precheckoutqueryhandler': ('PreCheckoutQueryHandler',),
+    '.shippingqueryhandler': ('ShippingQueryHandler',),
+    '.messagequeue': ('MessageQueue', 'DelayQueue'),
+    '.pollanswerhandler': ('PollAnswerHandler',),
+    '.pollhandler': ('PollHandler',),
+    '.defaults': ('Defaults',),
+    '.ratelimiter': ('AdaptiveRateLimiter',),
+    '.broadcast': ('Broadcast',),
+    '.editcoalescer': ('EditCoalescer',),
+    '.uploadcache': ('UploadCache',),
+    '.downloadcache': ('DownloadCache',),
+    '.interncache': ('InternCache',),
+    '.updatearchive': ('UpdateArchive',),
+}
+_LAZY_NAMES = {name: module for module, names in _MODULES.items() for name in names}
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported since Python 3.7 (PEP 562)
+    for _name in _LAZY_NAMES:
+        __getattr__(_name)
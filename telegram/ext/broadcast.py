@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the Broadcast class."""
+import itertools
+import logging
+import os
+import time
+from threading import Lock, Event, BoundedSemaphore, Condition
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+from telegram import TelegramObject, InputFile
+from telegram.error import Unauthorized, ChatMigrated, RetryAfter, TelegramError
+from telegram.ext.messagequeue import DelayQueue
+from telegram.utils.helpers import encode_json
+
+
+class Broadcast:
+    """
+    Sends the same message to a (possibly very large) number of chats.
+
+    The JSON body of the request is serialized once, only the ``chat_id`` is spliced in for each
+    chat. The requests are sent by :attr:`workers` threads in parallel while a
+    :class:`telegram.ext.DelayQueue` keeps them within the global rate limit.
+
+    * Chats that blocked the bot or were deactivated (:class:`telegram.error.Unauthorized`) are
+      collected in :attr:`blocked`.
+    * Groups that were migrated to a supergroup (:class:`telegram.error.ChatMigrated`) are sent to
+      the new chat and collected in :attr:`migrated`.
+    * On :class:`telegram.error.RetryAfter` the request is retried after the requested time.
+    * Any other :class:`telegram.TelegramError` is collected in :attr:`failed`.
+
+    If :attr:`checkpoint_file` is passed, the progress is saved there regularly. Running a
+    broadcast with the same ``chat_ids`` (in the same order) and the same checkpoint file again
+    skips the chats that were already handled and resumes the statistics.
+
+    Example:
+        .. code:: python
+
+            broadcast = Broadcast(bot, user_ids, 'sendMessage', {'text': 'Hello everyone!'},
+                                  checkpoint_file='announcement.json')
+            broadcast.run()
+            remove_users(broadcast.blocked)
+
+    Note:
+        * The parameters are sent as they are, i.e. :class:`telegram.ext.Defaults` of the bot are
+          not applied. Uploading files is not supported, use a ``file_id`` or URL instead.
+        * The checkpoint stores the position of the first chat that was not handled yet. When
+          resuming, chats behind that position that were already handled before the interruption
+          (at most a few times :attr:`workers`) receive the message again.
+
+    Attributes:
+        bot (:class:`telegram.Bot`): The bot sending the messages.
+        chat_ids (iterable): The chats to send the message to.
+        method (:obj:`str`): The Bot API method.
+        checkpoint_file (:obj:`str`): Optional. Path of the checkpoint file.
+        offset (:obj:`int`): Number of leading chats of :attr:`chat_ids` that were handled.
+        sent (:obj:`int`): Number of successfully sent messages.
+        blocked (List[:obj:`int` | :obj:`str`]): Chats that blocked the bot.
+        migrated (Dict[:obj:`int`, :obj:`int`]): Old and new ids of migrated chats.
+        failed (Dict[:obj:`int` | :obj:`str`, :obj:`str`]): Chats that could not be sent to and
+            the error.
+
+    Args:
+        bot (:class:`telegram.Bot`): The bot sending the messages.
+        chat_ids (iterable): The chats to send the message to. May be a generator.
+        method (:obj:`str`): The Bot API method to call, e.g. ``'sendMessage'`` or
+            ``'sendPhoto'``.
+        data (:obj:`dict`): The parameters of the method except ``chat_id``. Telegram objects,
+            like reply markups, are serialized.
+        workers (:obj:`int`, optional): Number of requests sent in parallel. Defaults to 8. The
+            connection pool of the bot should be at least this large.
+        burst_limit (:obj:`int`, optional): Number of maximum requests per time-window. Defaults
+            to 30.
+        time_limit_ms (:obj:`int`, optional): Width of the time-window in milliseconds. Defaults to
+            1000.
+        checkpoint_file (:obj:`str`, optional): Path of the file to save the progress to.
+        checkpoint_interval (:obj:`float`, optional): Minimal time in seconds between saving the
+            progress. Defaults to 5.
+        max_retries (:obj:`int`, optional): How often a request is retried after a
+            ``RetryAfter``. Defaults to 5.
+
+    """
+
+    def __init__(self,
+                 bot,
+                 chat_ids,
+                 method,
+                 data,
+                 workers=8,
+                 burst_limit=30,
+                 time_limit_ms=1000,
+                 checkpoint_file=None,
+                 checkpoint_interval=5,
+                 max_retries=5):
+        self.bot = bot
+        self.chat_ids = chat_ids
+        self.method = method
+        self.workers = workers
+        self.burst_limit = burst_limit
+        self.time_limit_ms = time_limit_ms
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_interval = checkpoint_interval
+        self.max_retries = max_retries
+        self.logger = logging.getLogger(__name__)
+
+        self.offset = 0
+        self.sent = 0
+        self.blocked = []
+        self.migrated = {}
+        self.failed = {}
+
+        self._url = '{}/{}'.format(bot.base_url, method)
+        self._body_tail = self._serialize(data)
+        self._lock = Lock()
+        # Notified when the last chat in flight is handled or the broadcast is stopped
+        self._done = Condition(self._lock)
+        self._save_lock = Lock()
+        self._stop_event = Event()
+        self._in_flight = set()
+        self._next_index = 0
+        self._last_checkpoint = 0
+
+        if checkpoint_file and os.path.exists(checkpoint_file):
+            self._load_checkpoint()
+
+    @staticmethod
+    def _serialize(data):
+        data = {key: value for key, value in data.items() if key != 'chat_id'}
+        for key, value in data.items():
+            if isinstance(value, InputFile):
+                raise ValueError('Broadcasting file uploads is not supported')
+            if isinstance(value, TelegramObject):
+                data[key] = value.to_dict()
+        body = encode_json(data)
+        # Strip the opening brace, the chat_id is put in front of the other parameters
+        return b'}' if body == b'{}' else b',' + body[1:]
+
+    def _body(self, chat_id):
+        return b'{"chat_id":' + encode_json(chat_id) + self._body_tail
+
+    def _load_checkpoint(self):
+        with open(self.checkpoint_file, 'r') as file:
+            checkpoint = json.load(file)
+        self.offset = checkpoint['offset']
+        self.sent = checkpoint['sent']
+        self.blocked = checkpoint['blocked']
+        self.migrated = dict(checkpoint['migrated'])
+        self.failed = dict(checkpoint['failed'])
+        self.logger.info('Resuming broadcast from chat #%s', self.offset)
+
+    def save_checkpoint(self):
+        """Saves the progress to :attr:`checkpoint_file`. The file is replaced atomically, so an
+        interruption while saving never leaves a corrupted checkpoint behind."""
+        with self._lock:
+            checkpoint = {
+                'offset': min(self._in_flight) if self._in_flight else self._next_index,
+                'sent': self.sent,
+                'blocked': list(self.blocked),
+                'migrated': list(self.migrated.items()),
+                'failed': list(self.failed.items())
+            }
+        with self._save_lock:
+            tmp_file = '{}.tmp'.format(self.checkpoint_file)
+            with open(tmp_file, 'w') as file:
+                json.dump(checkpoint, file)
+            os.replace(tmp_file, self.checkpoint_file)
+
+    def _post(self, chat_id):
+        for attempt in itertools.count():
+            try:
+                return self.bot.request.post_json(self._url, self._body(chat_id))
+            except RetryAfter as exc:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(exc.retry_after)
+
+    def _send(self, index, chat_id):
+        if self._stop_event.is_set():
+            # Not handled, so it stays in flight and is sent when resuming
+            self._slots.release()
+            return
+
+        try:
+            try:
+                self._post(chat_id)
+            except ChatMigrated as exc:
+                with self._lock:
+                    self.migrated[chat_id] = exc.new_chat_id
+                self._post(exc.new_chat_id)
+        except Unauthorized:
+            with self._lock:
+                self.blocked.append(chat_id)
+        except TelegramError as exc:
+            with self._lock:
+                self.failed[chat_id] = exc.message
+        else:
+            with self._lock:
+                self.sent += 1
+        finally:
+            with self._lock:
+                self._in_flight.discard(index)
+                if not self._in_flight:
+                    self._done.notify_all()
+            self._slots.release()
+
+        if self.checkpoint_file:
+            with self._lock:
+                now = time.time()
+                due = now - self._last_checkpoint > self.checkpoint_interval
+                if due:
+                    self._last_checkpoint = now
+            if due:
+                self.save_checkpoint()
+
+    def run(self):
+        """Sends the message to all chats and blocks until done or :meth:`stop` is called.
+
+        Returns:
+            :class:`telegram.ext.Broadcast`: This broadcast, to access the statistics.
+
+        """
+        self._next_index = self.offset
+        self._stop_event.clear()
+        # Limiting the chats in flight keeps huge chat id generators from being read into memory
+        # at once
+        self._slots = BoundedSemaphore(4 * self.workers)
+        delay_queue = DelayQueue(burst_limit=self.burst_limit,
+                                 time_limit_ms=self.time_limit_ms,
+                                 exc_route=lambda exc: self.logger.exception(
+                                     'Error while broadcasting', exc_info=exc),
+                                 workers=self.workers)
+        try:
+            for index, chat_id in enumerate(itertools.islice(self.chat_ids, self.offset, None),
+                                            self.offset):
+                self._slots.acquire()
+                if self._stop_event.is_set():
+                    break
+                with self._lock:
+                    self._in_flight.add(index)
+                    self._next_index = index + 1
+                delay_queue(self._send, index, chat_id)
+            # Wait for the queued requests before stopping the workers
+            with self._lock:
+                while self._in_flight and not self._stop_event.is_set():
+                    self._done.wait()
+        finally:
+            # Requests that are still queued are not sent and stay in flight, so the offset of
+            # the checkpoint points at the first of them
+            delay_queue.stop()
+            if self.checkpoint_file:
+                self.save_checkpoint()
+
+        self.offset = min(self._in_flight) if self._in_flight else self._next_index
+        return self
+
+    def stop(self):
+        """Stops a running broadcast after the requests that are currently being sent. The
+        progress is saved, so :meth:`run` can resume the broadcast."""
+        self._stop_event.set()
+        with self._lock:
+            self._done.notify_all()
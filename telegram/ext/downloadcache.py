@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the DownloadCache class."""
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class DownloadCache:
+    """
+    Caches downloaded files on disk, keyed by their ``file_unique_id``, and the results of
+    :meth:`telegram.Bot.get_file`.
+
+    Once a file was downloaded with :meth:`telegram.File.download` or
+    :meth:`telegram.File.download_as_bytearray`, later downloads of the same file (even with a
+    different ``file_id``) are served from disk. The total size of the cached files is bounded by
+    :attr:`max_bytes`, the least recently used files are evicted first. Files are written to a
+    temporary file first and then renamed, so a crash never leaves a partial file behind.
+
+    The ``file_path`` returned by ``getFile`` is valid for at least one hour, so
+    :meth:`telegram.Bot.get_file` answers repeated calls for the same ``file_id`` from memory for
+    :attr:`file_path_ttl` seconds.
+
+    Example:
+        .. code:: python
+
+            bot = Bot(TOKEN, download_cache=DownloadCache('/var/cache/mybot'))
+            data = bot.get_file(message.sticker).download_as_bytearray()
+
+    Attributes:
+        directory (:obj:`str`): The directory the files are stored in.
+        max_bytes (:obj:`int`): Maximum total size of the cached files.
+        file_path_ttl (:obj:`float`): Time in seconds the results of ``getFile`` are cached.
+        max_file_infos (:obj:`int`): Maximum number of cached ``getFile`` results.
+
+    Args:
+        directory (:obj:`str`): The directory to store the files in. Created if it does not exist.
+            Files already in the directory are picked up again.
+        max_bytes (:obj:`int`, optional): Maximum total size of the cached files. Defaults to
+            100 MB.
+        file_path_ttl (:obj:`float`, optional): Time in seconds the results of ``getFile`` are
+            cached. Defaults to 3000. Set to 0 to disable.
+        max_file_infos (:obj:`int`, optional): Maximum number of cached ``getFile`` results.
+            Defaults to 10000.
+
+    """
+
+    def __init__(self, directory, max_bytes=100 * 1024 * 1024, file_path_ttl=3000,
+                 max_file_infos=10000):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.file_path_ttl = file_path_ttl
+        self.max_file_infos = max_file_infos
+        self.logger = logging.getLogger(__name__)
+        self._files = OrderedDict()  # name -> size, least recently used first
+        self._size = 0
+        self._file_infos = OrderedDict()  # file_id -> (expiry, getFile result)
+        self._lock = Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        entries = []
+        for entry in os.scandir(directory):
+            if entry.is_file() and not entry.name.startswith('.'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._files[name] = size
+            self._size += size
+        with self._lock:
+            self._evict()
+
+    @property
+    def size(self):
+        """:obj:`int`: Total size of the cached files in bytes."""
+        return self._size
+
+    def __len__(self):
+        return len(self._files)
+
+    @staticmethod
+    def _name(file_unique_id):
+        return hashlib.sha1(file_unique_id.encode('utf-8')).hexdigest()
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._files:
+            name, size = self._files.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def get(self, file_unique_id):
+        """Returns the content of a cached file.
+
+        Args:
+            file_unique_id (:obj:`str`): The ``file_unique_id`` of the file.
+
+        Returns:
+            :obj:`bytes`: The content or :obj:`None`, if the file is not cached.
+
+        """
+        name = self._name(file_unique_id)
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            if name not in self._files:
+                return None
+            self._files.move_to_end(name)
+        try:
+            with open(path, 'rb') as file:
+                content = file.read()
+            # The modification time keeps track of the usage across restarts
+            os.utime(path)
+        except OSError:
+            # Evicted meanwhile
+            return None
+        return content
+
+    def put(self, file_unique_id, content):
+        """Caches the content of a file. Files larger than :attr:`max_bytes` are not cached.
+
+        Args:
+            file_unique_id (:obj:`str`): The ``file_unique_id`` of the file.
+            content (:obj:`bytes`): The content of the file.
+
+        """
+        if len(content) > self.max_bytes:
+            return
+        name = self._name(file_unique_id)
+        fd, tmp_file = tempfile.mkstemp(dir=self.directory, prefix='.')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(content)
+            os.replace(tmp_file, os.path.join(self.directory, name))
+        except OSError:
+            self.logger.exception('Could not cache file %s', file_unique_id)
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._size += len(content) - self._files.pop(name, 0)
+            self._files[name] = len(content)
+            self._evict()
+
+    def retrieve(self, file_unique_id, fetch):
+        """Returns the content of a file from the cache or, if it is not cached, fetches and
+        caches it.
+
+        Args:
+            file_unique_id (:obj:`str`): The ``file_unique_id`` of the file.
+            fetch (:obj:`callable`): Called without arguments to download the file. Must return
+                :obj:`bytes`.
+
+        Returns:
+            :obj:`bytes`: The content of the file.
+
+        """
+        content = self.get(file_unique_id)
+        if content is None:
+            content = fetch()
+            self.put(file_unique_id, content)
+        return content
+
+    def get_file_info(self, file_id):
+        """Returns the cached result of ``getFile``.
+
+        Args:
+            file_id (:obj:`str`): The ``file_id`` passed to ``getFile``.
+
+        Returns:
+            :obj:`dict`: A copy of the result or :obj:`None`, if not cached or expired.
+
+        """
+        with self._lock:
+            info = self._file_infos.get(file_id)
+            if info is None:
+                return None
+            if info[0] <= time.time():
+                del self._file_infos[file_id]
+                return None
+            return dict(info[1])
+
+    def put_file_info(self, file_id, result):
+        """Caches the result of ``getFile`` for :attr:`file_path_ttl` seconds.
+
+        Args:
+            file_id (:obj:`str`): The ``file_id`` passed to ``getFile``.
+            result (:obj:`dict`): The result of ``getFile``.
+
+        """
+        if not self.file_path_ttl or not result.get('file_path'):
+            return
+        with self._lock:
+            self._file_infos.pop(file_id, None)
+            self._file_infos[file_id] = (time.time() + self.file_path_ttl, dict(result))
+            while len(self._file_infos) > self.max_file_infos:
+                self._file_infos.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached files and ``getFile`` results."""
+        with self._lock:
+            for name in self._files:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            self._files.clear()
+            self._size = 0
+            self._file_infos.clear()
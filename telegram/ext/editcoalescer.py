@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the EditCoalescer class."""
+import heapq
+import itertools
+import logging
+import queue as q
+import threading
+import time
+
+from telegram.error import RetryAfter
+from telegram.ext.messagequeue import DelayQueueError
+from telegram.utils.promise import Promise
+
+
+class _Slot:
+    __slots__ = ('waiters', 'last_sent', 'in_flight')
+
+    def __init__(self):
+        self.waiters = []  # promises of all pending edits, the newest one last
+        self.last_sent = None
+        self.in_flight = False
+
+
+class EditCoalescer(threading.Thread):
+    """
+    Coalesces repeated edits of the same message, so that only the latest one is sent.
+
+    Each message (identified by the edit method and either ``chat_id`` and ``message_id`` or
+    ``inline_message_id``) is edited at most once per :attr:`interval`. Edits that are queued
+    while the message has to wait are superseded by newer ones: only the newest edit is sent and
+    the :class:`telegram.utils.promise.Promise` of every superseded edit resolves to the result
+    (or exception) of that edit. On :class:`telegram.error.RetryAfter`, the message waits for the
+    requested time and the newest edit is sent then.
+
+    This is useful for live updating messages like progress bars, dashboards or live locations,
+    which would otherwise produce far more edits than Telegram accepts.
+
+    Example:
+        .. code:: python
+
+            coalescer = EditCoalescer()
+            for percent in range(101):
+                promise = coalescer(bot.edit_message_text, text='{}%'.format(percent),
+                                    chat_id=chat_id, message_id=message_id)
+            message = promise.result()
+
+    Attributes:
+        interval (:obj:`float`): Minimal time in seconds between two edits of the same message.
+        workers (:obj:`int`): Number of worker threads sending the edits.
+        name (:obj:`str`): Thread's name.
+
+    Args:
+        interval (:obj:`float`, optional): Minimal time in seconds between two edits of the same
+            message. Defaults to 1.
+        workers (:obj:`int`, optional): Number of worker threads sending the edits. Defaults to 4.
+        autostart (:obj:`bool`, optional): If True, processor is started immediately after object's
+            creation; if ``False``, should be started manually by `start` method. Defaults to True.
+        name (:obj:`str`, optional): Thread's name. Defaults to ``'EditCoalescer-N'``, where N is
+            sequential number of object created.
+        max_messages (:obj:`int`, optional): Number of known messages above which finished
+            messages are dropped. Defaults to 10000.
+
+    """
+
+    _instcnt = 0  # instance counter
+
+    def __init__(self, interval=1, workers=4, autostart=True, name=None, max_messages=10000):
+        self.interval = interval
+        self.workers = workers
+        self.max_messages = max_messages
+        self.logger = logging.getLogger(__name__)
+        self._slots = {}
+        self._heap = []  # (due time, sequence number, key) for messages with pending edits
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._work_queue = q.Queue()
+        self._prune_size = max_messages
+        self.__exit_req = False
+        self.__class__._instcnt += 1
+        if name is None:
+            name = '{}-{}'.format(self.__class__.__name__, self.__class__._instcnt)
+        super().__init__(name=name)
+        self.daemon = False
+        self._worker_threads = [
+            threading.Thread(target=self._work, name='{}:worker-{}'.format(name, i))
+            for i in range(workers)
+        ]
+        if autostart:
+            self.start()
+
+    @staticmethod
+    def _key(func, kwargs):
+        name = getattr(func, '__name__', func)
+        if kwargs.get('inline_message_id') is not None:
+            return name, kwargs['inline_message_id']
+        if kwargs.get('chat_id') is not None and kwargs.get('message_id') is not None:
+            return name, kwargs['chat_id'], kwargs['message_id']
+        raise ValueError('Either inline_message_id or chat_id and message_id must be passed as '
+                         'keyword arguments')
+
+    def _schedule(self, key, due):
+        heapq.heappush(self._heap, (due, next(self._sequence), key))
+        self._condition.notify()
+
+    def _prune(self, now):
+        for key in [key for key, slot in self._slots.items()
+                    if not slot.waiters and not slot.in_flight
+                    and (slot.last_sent is None or slot.last_sent + self.interval <= now)]:
+            del self._slots[key]
+        self._prune_size = max(self.max_messages, 2 * len(self._slots))
+
+    def start(self):
+        """Starts the worker threads and the processor thread."""
+        for thread in self._worker_threads:
+            thread.start()
+        super().start()
+
+    def run(self):
+        """
+        Do not use the method except for unthreaded testing purposes, the method normally is
+        automatically called by autostart argument.
+
+        """
+
+        while True:
+            with self._condition:
+                while True:
+                    if self.__exit_req:
+                        return
+                    if self._heap:
+                        delay = self._heap[0][0] - time.perf_counter()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                _, _, key = heapq.heappop(self._heap)
+                slot = self._slots[key]
+                waiters, slot.waiters = slot.waiters, []
+                slot.in_flight = True
+            self._work_queue.put((key, slot, waiters))
+
+    def _work(self):
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            key, slot, waiters = item
+            newest = waiters[-1]
+            try:
+                result = newest.pooled_function(*newest.args, **newest.kwargs)
+            except RetryAfter as exc:
+                with self._condition:
+                    # Newer edits that came in meanwhile supersede this one
+                    slot.waiters = waiters + slot.waiters
+                    slot.in_flight = False
+                    slot.last_sent = time.perf_counter()
+                    self._schedule(key, slot.last_sent + max(exc.retry_after, self.interval))
+                continue
+            except Exception as exc:
+                outcome = self._raiser(exc)
+            else:
+                outcome = self._returner(result)
+
+            with self._condition:
+                slot.in_flight = False
+                slot.last_sent = time.perf_counter()
+                if slot.waiters:
+                    self._schedule(key, slot.last_sent + self.interval)
+
+            for promise in waiters:
+                promise.pooled_function, promise.args, promise.kwargs = outcome, (), {}
+                promise.run()
+
+    @staticmethod
+    def _returner(result):
+        return lambda: result
+
+    @staticmethod
+    def _raiser(exc):
+        def raiser():
+            raise exc
+
+        return raiser
+
+    def stop(self, timeout=None):
+        """Used to gently stop processor and shutdown its threads. Edits that are still pending
+        are not sent.
+
+        Args:
+            timeout (:obj:`float`): Indicates maximum time to wait for processor to stop and its
+                threads to exit. If timeout exceeds and processor has not stopped, method silently
+                returns. :attr:`is_alive` could be used afterwards to check the actual status.
+                ``timeout`` set to None, blocks until processor is shut down. Defaults to None.
+
+        """
+
+        with self._condition:
+            self.__exit_req = True
+            self._condition.notify()
+        super().join(timeout=timeout)
+        for _ in self._worker_threads:
+            self._work_queue.put(None)
+        for thread in self._worker_threads:
+            thread.join(timeout=timeout)
+
+    def __call__(self, func, *args, **kwargs):
+        """Queues an edit.
+
+        Args:
+            func (:obj:`callable`): The edit method, e.g. :meth:`telegram.Bot.edit_message_text`.
+            *args (:obj:`list`): Variable-length `func` arguments.
+            **kwargs (:obj:`dict`): Arbitrary keyword-arguments to `func`. Must contain either
+                ``inline_message_id`` or ``chat_id`` and ``message_id``.
+
+        Returns:
+            :class:`telegram.utils.promise.Promise`: Resolves to the result of the edit that was
+            actually sent, which may be a newer one.
+
+        Raises:
+            ValueError: If the message to edit can not be determined from ``kwargs``.
+
+        """
+
+        key = self._key(func, kwargs)
+        if not self.is_alive() or self.__exit_req:
+            raise DelayQueueError('Could not process callback in stopped thread')
+        promise = Promise(func, args, kwargs)
+        with self._condition:
+            now = time.perf_counter()
+            slot = self._slots.get(key)
+            if slot is None:
+                if len(self._slots) >= self._prune_size:
+                    self._prune(now)
+                slot = self._slots[key] = _Slot()
+            slot.waiters.append(promise)
+            if len(slot.waiters) == 1 and not slot.in_flight:
+                due = now if slot.last_sent is None else max(now, slot.last_sent + self.interval)
+                self._schedule(key, due)
+        return promise
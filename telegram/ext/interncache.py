@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the InternCache class."""
+from collections import OrderedDict
+from threading import Lock
+
+from telegram.base import _freeze
+
+
+class InternCache:
+    """
+    Shares the :class:`telegram.User` and :class:`telegram.Chat` objects of updates and API
+    results, instead of decoding the same users and chats again and again.
+
+    The objects are cached by class and ``id``. An object is reused as long as the data received
+    for it is the same as the data it was decoded from, so e.g. a user that changed their name
+    gets a new object. At most :attr:`maxsize` objects are kept, the least recently used ones are
+    evicted first.
+
+    Since they are shared, the cached objects are immutable: setting an attribute raises
+    :exc:`AttributeError`. Use :func:`copy.copy` to get an object that can be changed. Copies and
+    unpickled objects are plain :class:`telegram.User` and :class:`telegram.Chat` objects. As the
+    objects hold a reference to the bot, a cache must not be shared by several bots.
+
+    Example:
+        .. code:: python
+
+            updater = Updater(TOKEN, use_context=True, intern_cache=InternCache())
+
+    Attributes:
+        maxsize (:obj:`int`): Maximum number of cached objects.
+        hits (:obj:`int`): Number of objects that were reused.
+        misses (:obj:`int`): Number of objects that had to be decoded.
+
+    Args:
+        maxsize (:obj:`int`, optional): Maximum number of cached objects. Defaults to 10000.
+
+    """
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (class, id) -> (data, object), least recently used first
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, cls, data):
+        """Returns the cached object for the given data.
+
+        Args:
+            cls (:obj:`type`): The class of the object.
+            data (:obj:`dict`): The data received for the object.
+
+        Returns:
+            :class:`telegram.TelegramObject`: The object or :obj:`None`, if no object of this
+            class with this ``id`` is cached or if it was decoded from different data.
+
+        """
+        key = (cls, data.get('id'))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == data:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        return None
+
+    def put(self, cls, data, obj):
+        """Caches an object.
+
+        Args:
+            cls (:obj:`type`): The class of the object.
+            data (:obj:`dict`): The data the object was decoded from. It must not be changed
+                afterwards.
+            obj (:class:`telegram.TelegramObject`): The object. It is made immutable.
+
+        Returns:
+            :class:`telegram.TelegramObject`: The object.
+
+        """
+        _freeze(obj)
+        key = (cls, data.get('id'))
+        with self._lock:
+            self._entries[key] = (data, obj)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return obj
+
+    def clear(self):
+        """Removes all cached objects."""
+        with self._lock:
+            self._entries.clear()
@@ -23,9 +23,12 @@
 from telegram.utils import promise
 
 import functools
+import heapq
+import itertools
 import time
 import threading
 import queue as q
+from collections import deque
 
 
 class DelayQueueError(RuntimeError):
@@ -38,6 +41,11 @@ class DelayQueue(threading.Thread):
     Processes callbacks from queue with specified throughput limits. Creates a separate thread to
     process callbacks with delays.
 
+    The thread only decides *when* a callback may run. By default the callback is then also called
+    on this thread, so the throughput is capped by the duration of each call (e.g. the round trip
+    of an HTTPS request). If :attr:`workers` is set, due callbacks are instead handed to a pool of
+    worker threads and the configured limits are reached regardless of the call duration.
+
     Attributes:
         burst_limit (:obj:`int`): Number of maximum callbacks to process per time-window.
         time_limit (:obj:`int`): Defines width of time-window used when each processing limit is
@@ -45,6 +53,7 @@ class DelayQueue(threading.Thread):
         exc_route (:obj:`callable`): A callable, accepting 1 positional argument; used to route
             exceptions from processor thread to main thread;
         name (:obj:`str`): Thread's name.
+        workers (:obj:`int`): Number of worker threads executing the callbacks.
 
     Args:
         queue (:obj:`Queue`, optional): Used to pass callbacks to thread. Creates ``Queue``
@@ -61,6 +70,9 @@ class DelayQueue(threading.Thread):
             creation; if ``False``, should be started manually by `start` method. Defaults to True.
         name (:obj:`str`, optional): Thread's name. Defaults to ``'DelayQueue-N'``, where N is
             sequential number of object created.
+        workers (:obj:`int`, optional): Number of worker threads executing the callbacks. If ``0``,
+            callbacks are executed on the thread of the ``DelayQueue`` itself, one after another.
+            Defaults to ``0``.
 
     """
 
@@ -72,19 +84,32 @@ class DelayQueue(threading.Thread):
                  time_limit_ms=1000,
                  exc_route=None,
                  autostart=True,
-                 name=None):
+                 name=None,
+                 workers=0):
         self._queue = queue if queue is not None else q.Queue()
         self.burst_limit = burst_limit
         self.time_limit = time_limit_ms / 1000
         self.exc_route = (exc_route if exc_route is not None else self._default_exception_handler)
+        self.workers = workers
         self.__exit_req = False  # flag to gently exit thread
         self.__class__._instcnt += 1
         if name is None:
             name = '{}-{}'.format(self.__class__.__name__, self.__class__._instcnt)
         super().__init__(name=name)
         self.daemon = False
+        self._work_queue = q.Queue()
+        self._worker_threads = [
+            threading.Thread(target=self._work, name='{}:worker-{}'.format(name, i))
+            for i in range(workers)
+        ]
         if autostart:  # immediately start processing
-            super().start()
+            self.start()
+
+    def start(self):
+        """Starts the worker threads and the processor thread."""
+        for thread in self._worker_threads:
+            thread.start()
+        super().start()
 
     def run(self):
         """
@@ -93,30 +118,38 @@ class DelayQueue(threading.Thread):
 
         """
 
-        times = []  # used to store each callable processing time
+        # Start times of the last ``burst_limit`` callables. The oldest one tells when the next
+        # callable may be started without exceeding the limit in any time-window.
+        times = deque(maxlen=self.burst_limit)
         while True:
             item = self._queue.get()
             if self.__exit_req:
                 return  # shutdown thread
             # delay routine
-            now = time.perf_counter()
-            t_delta = now - self.time_limit  # calculate early to improve perf.
-            if times and t_delta > times[-1]:
-                # if last call was before the limit time-window
-                # used to impr. perf. in long-interval calls case
-                times = [now]
-            else:
-                # collect last in current limit time-window
-                times = [t for t in times if t >= t_delta]
-                times.append(now)
-            if len(times) >= self.burst_limit:  # if throughput limit was hit
-                time.sleep(times[1] - t_delta)
+            if len(times) == self.burst_limit:  # if throughput limit was hit
+                delay = times[0] + self.time_limit - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            times.append(time.perf_counter())
             # finally process one
-            try:
-                func, args, kwargs = item
-                func(*args, **kwargs)
-            except Exception as exc:  # re-route any exceptions
-                self.exc_route(exc)  # to prevent thread exit
+            if self._worker_threads:
+                self._work_queue.put(item)
+            else:
+                self._process(item)
+
+    def _process(self, item):
+        try:
+            func, args, kwargs = item
+            func(*args, **kwargs)
+        except Exception as exc:  # re-route any exceptions
+            self.exc_route(exc)  # to prevent thread exit
+
+    def _work(self):
+        while True:
+            item = self._work_queue.get()
+            if item is None:
+                return
+            self._process(item)
 
     def stop(self, timeout=None):
         """Used to gently stop processor and shutdown its thread.
@@ -132,6 +165,11 @@ class DelayQueue(threading.Thread):
         self.__exit_req = True  # gently request
         self._queue.put(None)  # put something to unfreeze if frozen
         super().join(timeout=timeout)
+        # Let the workers finish the callables that were already due
+        for _ in self._worker_threads:
+            self._work_queue.put(None)
+        for thread in self._worker_threads:
+            thread.join(timeout=timeout)
 
     @staticmethod
     def _default_exception_handler(exc):
@@ -159,17 +197,173 @@ class DelayQueue(threading.Thread):
         self._queue.put((func, args, kwargs))
 
 
+class ChatDelayQueue(threading.Thread):
+    """
+    Processes callbacks with specified throughput limits that apply to each chat separately.
+    Callbacks of the same chat are processed in order, callbacks of different chats do not delay
+    each other. Creates a separate thread to process callbacks with delays.
+
+    Each chat keeps the start times of its last :attr:`burst_limit` callbacks. Chats with pending
+    callbacks are kept in a heap ordered by the time their next callback becomes due, so the cost
+    per callback is logarithmic in the number of *busy* chats. Chats without pending callbacks
+    whose time-window has passed are dropped.
+
+    Attributes:
+        burst_limit (:obj:`int`): Number of maximum callbacks to process per time-window and chat.
+        time_limit (:obj:`int`): Defines width of time-window used when each processing limit is
+            calculated.
+        exc_route (:obj:`callable`): A callable, accepting 1 positional argument; used to route
+            exceptions from processor thread to main thread;
+        name (:obj:`str`): Thread's name.
+
+    Args:
+        burst_limit (:obj:`int`, optional): Number of maximum callbacks to process per time-window
+            defined by :attr:`time_limit_ms` and chat. Defaults to 20.
+        time_limit_ms (:obj:`int`, optional): Defines width of time-window used when each
+            processing limit is calculated. Defaults to 60000.
+        exc_route (:obj:`callable`, optional): A callable, accepting 1 positional argument; used to
+            route exceptions from processor thread to main thread; is called on `Exception`
+            subclass exceptions. If not provided, exceptions are routed through dummy handler,
+            which re-raises them.
+        autostart (:obj:`bool`, optional): If True, processor is started immediately after object's
+            creation; if ``False``, should be started manually by `start` method. Defaults to True.
+        name (:obj:`str`, optional): Thread's name. Defaults to ``'ChatDelayQueue-N'``, where N is
+            sequential number of object created.
+        max_chats (:obj:`int`, optional): Number of known chats above which finished chats are
+            dropped. Defaults to 10000.
+
+    """
+
+    _instcnt = 0  # instance counter
+
+    def __init__(self,
+                 burst_limit=20,
+                 time_limit_ms=60000,
+                 exc_route=None,
+                 autostart=True,
+                 name=None,
+                 max_chats=10000):
+        self.burst_limit = burst_limit
+        self.time_limit = time_limit_ms / 1000
+        self.exc_route = (exc_route if exc_route is not None else
+                          DelayQueue._default_exception_handler)
+        self.max_chats = max_chats
+        self._chats = {}  # chat_id -> (start times, pending callbacks)
+        self._heap = []  # (due time, sequence number, chat_id) for chats with pending callbacks
+        self._sequence = itertools.count()  # keeps the heap stable for equal due times
+        self._condition = threading.Condition()
+        self._prune_size = max_chats
+        self.__exit_req = False  # flag to gently exit thread
+        self.__class__._instcnt += 1
+        if name is None:
+            name = '{}-{}'.format(self.__class__.__name__, self.__class__._instcnt)
+        super().__init__(name=name)
+        self.daemon = False
+        if autostart:  # immediately start processing
+            self.start()
+
+    def _due(self, times, now):
+        if len(times) == self.burst_limit:
+            return max(now, times[0] + self.time_limit)
+        return now
+
+    def _prune(self, now):
+        for chat_id in [chat_id for chat_id, (times, pending) in self._chats.items()
+                        if not pending and (not times or times[-1] + self.time_limit <= now)]:
+            del self._chats[chat_id]
+        # Amortize the cost of pruning if most chats are busy
+        self._prune_size = max(self.max_chats, 2 * len(self._chats))
+
+    def run(self):
+        """
+        Do not use the method except for unthreaded testing purposes, the method normally is
+        automatically called by autostart argument.
+
+        """
+
+        while True:
+            with self._condition:
+                while True:
+                    if self.__exit_req:
+                        return  # shutdown thread
+                    if self._heap:
+                        delay = self._heap[0][0] - time.perf_counter()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                _, _, chat_id = heapq.heappop(self._heap)
+                times, pending = self._chats[chat_id]
+                now = time.perf_counter()
+                times.append(now)
+                item = pending.popleft()
+                if pending:
+                    heapq.heappush(self._heap,
+                                   (self._due(times, now), next(self._sequence), chat_id))
+            # process outside of the lock, so new callbacks can be queued meanwhile
+            try:
+                func, args, kwargs = item
+                func(*args, **kwargs)
+            except Exception as exc:  # re-route any exceptions
+                self.exc_route(exc)  # to prevent thread exit
+
+    def stop(self, timeout=None):
+        """Used to gently stop processor and shutdown its thread.
+
+        Args:
+            timeout (:obj:`float`): Indicates maximum time to wait for processor to stop and its
+                thread to exit. If timeout exceeds and processor has not stopped, method silently
+                returns. :attr:`is_alive` could be used afterwards to check the actual status.
+                ``timeout`` set to None, blocks until processor is shut down. Defaults to None.
+
+        """
+
+        with self._condition:
+            self.__exit_req = True  # gently request
+            self._condition.notify()  # unfreeze if frozen
+        super().join(timeout=timeout)
+
+    def __call__(self, chat_id, func, *args, **kwargs):
+        """Used to process callbacks in throughput-limiting thread.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`): The chat whose limits apply to the callback.
+            func (:obj:`callable`): The actual function (or any callable) that is processed through
+                queue.
+            *args (:obj:`list`): Variable-length `func` arguments.
+            **kwargs (:obj:`dict`): Arbitrary keyword-arguments to `func`.
+
+        """
+
+        if not self.is_alive() or self.__exit_req:
+            raise DelayQueueError('Could not process callback in stopped thread')
+        with self._condition:
+            now = time.perf_counter()
+            chat = self._chats.get(chat_id)
+            if chat is None:
+                if len(self._chats) >= self._prune_size:
+                    self._prune(now)
+                chat = self._chats[chat_id] = (deque(maxlen=self.burst_limit), deque())
+            times, pending = chat
+            pending.append((func, args, kwargs))
+            if len(pending) == 1:
+                heapq.heappush(self._heap, (self._due(times, now), next(self._sequence), chat_id))
+                self._condition.notify()
+
+
 # The most straightforward way to implement this is to use 2 sequenital delay
 # queues, like on classic delay chain schematics in electronics.
 # So, message path is:
-# msg --> group delay if group msg, else no delay --> normal msg delay --> out
+# msg --> per chat group delay if group msg, else no delay --> normal msg delay --> out
 # This way OS threading scheduler cares of timings accuracy.
 # (see time.time, time.clock, time.perf_counter, time.sleep @ docs.python.org)
 class MessageQueue:
     """
     Implements callback processing with proper delays to avoid hitting Telegram's message limits.
-    Contains two ``DelayQueue``, for group and for all messages, interconnected in delay chain.
-    Callables are processed through *group* ``DelayQueue``, then through *all* ``DelayQueue`` for
+    Contains a :class:`ChatDelayQueue` for group messages and a ``DelayQueue`` for all messages,
+    interconnected in delay chain. Callables are processed through the *group* queue, which
+    applies the group limits to each group separately, then through *all* ``DelayQueue`` for
     group-type messages. For non-group messages, only the *all* ``DelayQueue`` is used.
 
     Args:
@@ -178,7 +372,8 @@ class MessageQueue:
         all_time_limit_ms (:obj:`int`, optional): Defines width of *all-type* time-window used when
             each processing limit is calculated. Defaults to 1000 ms.
         group_burst_limit (:obj:`int`, optional): Number of maximum *group-type* callbacks to
-            process per time-window defined by :attr:`group_time_limit_ms`. Defaults to 20.
+            process per time-window defined by :attr:`group_time_limit_ms` and group. Defaults to
+            20.
         group_time_limit_ms (:obj:`int`, optional): Defines width of *group-type* time-window used
             when each processing limit is calculated. Defaults to 60000 ms.
         exc_route (:obj:`callable`, optional): A callable, accepting one positional argument; used
@@ -188,6 +383,14 @@ class MessageQueue:
         autostart (:obj:`bool`, optional): If True, processors are started immediately after
             object's creation; if ``False``, should be started manually by :attr:`start` method.
             Defaults to ``True``.
+        workers (:obj:`int`, optional): Number of worker threads sending the messages, see
+            :class:`DelayQueue`. Use at least as many workers as messages are sent during one
+            round trip to Telegram to reach :attr:`all_burst_limit`. Defaults to ``0``, i.e. the
+            messages are sent one after another.
+
+    Note:
+        With more than one worker, messages to the same chat may arrive out of order if they are
+        queued faster than the round trip to Telegram.
 
     """
 
@@ -197,14 +400,16 @@ class MessageQueue:
                  group_burst_limit=20,
                  group_time_limit_ms=60000,
                  exc_route=None,
-                 autostart=True):
+                 autostart=True,
+                 workers=0):
         # create accoring delay queues, use composition
         self._all_delayq = DelayQueue(
             burst_limit=all_burst_limit,
             time_limit_ms=all_time_limit_ms,
             exc_route=exc_route,
-            autostart=autostart)
-        self._group_delayq = DelayQueue(
+            autostart=autostart,
+            workers=workers)
+        self._group_delayq = ChatDelayQueue(
             burst_limit=group_burst_limit,
             time_limit_ms=group_time_limit_ms,
             exc_route=exc_route,
@@ -221,7 +426,7 @@ class MessageQueue:
 
     stop.__doc__ = DelayQueue.stop.__doc__ or ''  # reuse docsting if any
 
-    def __call__(self, promise, is_group_msg=False):
+    def __call__(self, promise, is_group_msg=False, chat_id=None):
         """
         Processes callables in troughput-limiting queues to avoid hitting limits (specified with
         :attr:`burst_limit` and :attr:`time_limit`.
@@ -233,6 +438,9 @@ class MessageQueue:
                 group*+*all* ``DelayQueue``s (if set to ``True``), or only through *all*
                 ``DelayQueue`` (if set to ``False``), resulting in needed delays to avoid
                 hitting specified limits. Defaults to ``False``.
+            chat_id (:obj:`int` | :obj:`str`, optional): The group the message is sent to. Group
+                limits are applied per group. If not passed, all group messages without
+                ``chat_id`` share the same group limits.
 
         Note:
             Method is designed to accept ``telegram.utils.promise.Promise`` as ``promise``
@@ -249,10 +457,22 @@ class MessageQueue:
         if not is_group_msg:  # ignore middle group delay
             self._all_delayq(promise)
         else:  # use middle group delay
-            self._group_delayq(self._all_delayq, promise)
+            self._group_delayq(chat_id, self._all_delayq, promise)
         return promise
 
 
+def _is_group_chat(chat_id):
+    """Tells group, supergroup and channel ids (negative or ``@username``) from user ids."""
+    if isinstance(chat_id, str):
+        if chat_id.startswith('@'):
+            return True
+        try:
+            chat_id = int(chat_id)
+        except ValueError:
+            return False
+    return isinstance(chat_id, int) and chat_id < 0
+
+
 def queuedmessage(method):
     """A decorator to be used with :attr:`telegram.Bot` send* methods.
 
@@ -274,10 +494,10 @@ def queuedmessage(method):
     Args:
         queued (:obj:`bool`, optional): If set to ``True``, the ``MessageQueue`` is used to process
             output messages. Defaults to `self._is_queued_out`.
-        isgroup (:obj:`bool`, optional): If set to ``True``, the message is meant to be group-type
-            (as there's no obvious way to determine its type in other way at the moment).
+        isgroup (:obj:`bool`, optional): If set to ``True``, the message is meant to be group-type.
             Group-type messages could have additional processing delay according to limits set
-            in `self._out_queue`. Defaults to ``False``.
+            in `self._out_queue`. Defaults to ``True`` if the ``chat_id`` of the call is negative
+            or a channel username, ``False`` otherwise.
 
     Returns:
         ``telegram.utils.promise.Promise``: In case call is queued or original method's return
@@ -288,10 +508,13 @@ def queuedmessage(method):
     @functools.wraps(method)
     def wrapped(self, *args, **kwargs):
         queued = kwargs.pop('queued', self._is_messages_queued_default)
-        isgroup = kwargs.pop('isgroup', False)
+        chat_id = kwargs.get('chat_id', args[0] if args else None)
+        isgroup = kwargs.pop('isgroup', None)
+        if isgroup is None:
+            isgroup = _is_group_chat(chat_id)
         if queued:
             prom = promise.Promise(method, (self, ) + args, kwargs)
-            return self._msg_queue(prom, isgroup)
+            return self._msg_queue(prom, isgroup, chat_id=chat_id)
         return method(self, *args, **kwargs)
 
     return wrapped
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the AdaptiveRateLimiter class."""
+import logging
+import time
+from threading import Lock
+
+from telegram.error import RetryAfter
+
+
+class TokenBucket:
+    """
+    A token bucket whose refill rate can be adjusted at runtime. Tokens are *reserved* rather than
+    waited for: :meth:`reserve` always takes a token and returns the time the caller has to wait
+    until that token becomes valid, so the bucket itself never blocks.
+
+    This class is not thread safe on its own, callers are expected to hold a lock.
+
+    Attributes:
+        rate (:obj:`float`): Current refill rate in tokens per second.
+        base_rate (:obj:`float`): The rate the bucket was created with.
+        min_rate (:obj:`float`): Lower bound for :attr:`rate`.
+        max_rate (:obj:`float`): Upper bound for :attr:`rate`.
+        burst (:obj:`float`): Capacity of the bucket.
+        tokens (:obj:`float`): Currently available tokens. Negative if tokens are reserved ahead.
+        blocked_until (:obj:`float`): :func:`time.perf_counter` timestamp before which no token is
+            handed out.
+
+    Args:
+        rate (:obj:`float`): Initial refill rate in tokens per second.
+        burst (:obj:`float`, optional): Capacity of the bucket. Defaults to ``max(1, rate)``.
+        min_rate (:obj:`float`, optional): Lower bound for the rate. Defaults to ``rate / 16``.
+        max_rate (:obj:`float`, optional): Upper bound for the rate. Defaults to ``rate``.
+        now (:obj:`float`, optional): Creation timestamp. Defaults to :func:`time.perf_counter`.
+
+    """
+
+    __slots__ = ('rate', 'base_rate', 'min_rate', 'max_rate', 'burst', 'tokens', 'stamp',
+                 'blocked_until')
+
+    def __init__(self, rate, burst=None, min_rate=None, max_rate=None, now=None):
+        self.rate = float(rate)
+        self.base_rate = self.rate
+        self.min_rate = self.rate / 16 if min_rate is None else float(min_rate)
+        self.max_rate = self.rate if max_rate is None else float(max_rate)
+        self.burst = max(1., self.rate) if burst is None else float(burst)
+        self.tokens = self.burst
+        self.stamp = time.perf_counter() if now is None else now
+        self.blocked_until = 0.
+
+    def _refill(self, now):
+        if now > self.stamp:
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+
+    def delay(self, now):
+        """Returns the time in seconds until the next token would be valid, without taking it."""
+        self._refill(now)
+        wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.
+        return max(wait, self.blocked_until - now)
+
+    def reserve(self, now):
+        """Takes one token and returns the time in seconds until that token is valid."""
+        wait = self.delay(now)
+        self.tokens -= 1
+        return wait
+
+    def is_idle(self, now):
+        """:obj:`bool`: Whether the bucket is full, i.e. dropping it would not loose state."""
+        self._refill(now)
+        return self.tokens >= self.burst and self.blocked_until <= now
+
+    def increase(self, step):
+        """Additively increases the rate by ``step`` times :attr:`base_rate`."""
+        self.rate = min(self.max_rate, self.rate + step * self.base_rate)
+
+    def decrease(self, factor, now, retry_after=0.):
+        """Multiplicatively decreases the rate and blocks the bucket for ``retry_after`` seconds.
+        Tokens that were reserved ahead are kept, so waiting callers stay in order."""
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * factor)
+        self.tokens = min(self.tokens, 0.)
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class AdaptiveRateLimiter:
+    """
+    Throttles outgoing requests of a :class:`telegram.Bot` and learns the actual flood limits from
+    :class:`telegram.error.RetryAfter` responses.
+
+    Every request is admitted through a global token bucket and, if the request targets a chat
+    (i.e. has a ``chat_id`` parameter), through a token bucket of that chat. The rates of the
+    buckets follow an AIMD scheme (additive increase, multiplicative decrease): each successful
+    request raises the rate of the used buckets a little, up to the configured maximum, while a
+    ``RetryAfter`` halves the rate of the offending bucket and blocks it for the requested time.
+    Requests that were rejected with ``RetryAfter`` are transparently retried up to
+    :attr:`max_retries` times.
+
+    Example:
+        .. code:: python
+
+            bot = Bot(TOKEN, rate_limiter=AdaptiveRateLimiter())
+
+    Note:
+        Calls to ``getUpdates`` are never throttled. Flood control errors for requests that do not
+        target a chat are attributed to the global bucket, all others to the bucket of the chat.
+
+    Attributes:
+        max_retries (:obj:`int`): How often a request is retried after a ``RetryAfter``.
+        increase (:obj:`float`): Additive increase applied on success, as fraction of the initial
+            rate.
+        decrease (:obj:`float`): Multiplicative decrease applied on ``RetryAfter``.
+
+    Args:
+        global_rate (:obj:`float`, optional): Initial number of requests per second for the whole
+            bot. Defaults to 30.
+        private_chat_rate (:obj:`float`, optional): Initial number of requests per second for a
+            single private chat. Defaults to 1.
+        group_chat_rate (:obj:`float`, optional): Initial number of requests per second for a
+            single group, supergroup or channel (i.e. chats with negative ids or usernames).
+            Defaults to 20 per minute.
+        max_rate_factor (:obj:`float`, optional): How far the rates may grow above the initial
+            rates. Defaults to 1.5.
+        increase (:obj:`float`, optional): Additive increase applied on success, as fraction of
+            the initial rate. Defaults to 0.01.
+        decrease (:obj:`float`, optional): Multiplicative decrease applied on ``RetryAfter``.
+            Defaults to 0.5.
+        max_retries (:obj:`int`, optional): How often a request is retried after a
+            ``RetryAfter``. Defaults to 3.
+        max_idle_chats (:obj:`int`, optional): Number of chat buckets after which idle buckets are
+            dropped. Defaults to 10000.
+
+    """
+
+    def __init__(self,
+                 global_rate=30,
+                 private_chat_rate=1,
+                 group_chat_rate=20 / 60,
+                 max_rate_factor=1.5,
+                 increase=0.01,
+                 decrease=0.5,
+                 max_retries=3,
+                 max_idle_chats=10000):
+        self.private_chat_rate = private_chat_rate
+        self.group_chat_rate = group_chat_rate
+        self.max_rate_factor = max_rate_factor
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.max_idle_chats = max_idle_chats
+        self.logger = logging.getLogger(__name__)
+
+        self._global = TokenBucket(global_rate, max_rate=global_rate * max_rate_factor)
+        self._chats = {}
+        self._lock = Lock()
+
+    def _new_bucket(self, chat_id, now):
+        if isinstance(chat_id, str) or chat_id < 0:
+            rate = self.group_chat_rate
+        else:
+            rate = self.private_chat_rate
+        # Private chats get a small burst, groups have to be paced from the start
+        return TokenBucket(rate, burst=1, max_rate=rate * self.max_rate_factor, now=now)
+
+    def _get_bucket(self, chat_id, now):
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self.max_idle_chats:
+                self._prune(now)
+            bucket = self._chats[chat_id] = self._new_bucket(chat_id, now)
+        return bucket
+
+    def _prune(self, now):
+        for chat_id in [c for c, b in self._chats.items() if b.is_idle(now)]:
+            del self._chats[chat_id]
+
+    def reserve(self, chat_id=None):
+        """Reserves a slot for a request.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`, optional): The chat the request targets.
+
+        Returns:
+            :obj:`float`: The time in seconds the caller has to wait before sending the request.
+
+        """
+        with self._lock:
+            now = time.perf_counter()
+            wait = self._global.reserve(now)
+            if chat_id is not None:
+                wait = max(wait, self._get_bucket(chat_id, now).reserve(now))
+            return wait
+
+    def success(self, chat_id=None):
+        """Reports a successful request, which additively increases the involved rates.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`, optional): The chat the request targeted.
+
+        """
+        with self._lock:
+            self._global.increase(self.increase)
+            if chat_id is not None:
+                self._get_bucket(chat_id, time.perf_counter()).increase(self.increase)
+
+    def flood_wait(self, retry_after, chat_id=None):
+        """Reports a :class:`telegram.error.RetryAfter`, which multiplicatively decreases the rate
+        of the offending bucket and blocks it for ``retry_after`` seconds.
+
+        Args:
+            retry_after (:obj:`float`): The time in seconds Telegram asked us to wait.
+            chat_id (:obj:`int` | :obj:`str`, optional): The chat the request targeted.
+
+        """
+        with self._lock:
+            now = time.perf_counter()
+            if chat_id is None:
+                bucket = self._global
+            else:
+                bucket = self._get_bucket(chat_id, now)
+            bucket.decrease(self.decrease, now, retry_after)
+            self.logger.debug('Flood control for chat %s, rate lowered to %.3f/s', chat_id,
+                              bucket.rate)
+
+    def rate(self, chat_id=None):
+        """Returns the currently learned rate.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`, optional): The chat to get the rate for. If not
+                passed, the global rate is returned.
+
+        Returns:
+            :obj:`float`: The rate in requests per second.
+
+        """
+        with self._lock:
+            if chat_id is None:
+                return self._global.rate
+            return self._get_bucket(chat_id, time.perf_counter()).rate
+
+    def process(self, func, chat_id=None):
+        """Calls ``func`` as soon as the budgets allow it and retries it on flood control errors.
+
+        Args:
+            func (:obj:`callable`): A callable without arguments that performs the request. It may
+                be called more than once.
+            chat_id (:obj:`int` | :obj:`str`, optional): The chat the request targets.
+
+        Returns:
+            The return value of ``func``.
+
+        Raises:
+            :class:`telegram.error.RetryAfter`: If the request was still rejected after
+                :attr:`max_retries` retries.
+
+        """
+        attempt = 0
+        while True:
+            wait = self.reserve(chat_id)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                result = func()
+            except RetryAfter as exc:
+                self.flood_wait(exc.retry_after, chat_id)
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                continue
+            self.success(chat_id)
+            return result
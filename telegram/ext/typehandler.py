@@ -18,6 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the TypeHandler class."""
 
+from telegram.base import _public_type
 from .handler import Handler
 
 
@@ -85,4 +86,5 @@ class TypeHandler(Handler):
         if not self.strict:
             return isinstance(update, self.type)
         else:
-            return type(update) is self.type
+            # Lazily decoded updates are instances of a subclass of Update
+            return _public_type(update) is self.type
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the UpdateArchive class."""
+from threading import Lock
+
+from telegram.utils.helpers import encode_json
+
+
+class UpdateArchive:
+    """
+    Writes updates to a file in the JSON Lines format, one update per line.
+
+    Updates that kept the data they were decoded from, see :attr:`telegram.Bot.keep_raw_updates`,
+    are written as received from Telegram: the request body of updates received by webhook is
+    written as is, without encoding anything. Other updates are encoded from
+    :meth:`telegram.Update.to_dict`, which is slower and may differ from the data Telegram sent.
+
+    Example:
+        .. code:: python
+
+            archive = UpdateArchive('updates.jsonl')
+            updater = Updater(TOKEN, use_context=True, keep_raw_updates=True)
+            updater.dispatcher.add_handler(TypeHandler(Update, archive.callback), group=-1)
+
+    Attributes:
+        flush (:obj:`bool`): Whether the file is flushed after each update.
+        written (:obj:`int`): Number of updates written.
+        encoded (:obj:`int`): Number of updates that had to be encoded from
+            :meth:`telegram.Update.to_dict`.
+
+    Args:
+        file (:obj:`str` | :term:`file object`): The path of the file the updates are appended to
+            or a file object opened in binary mode.
+        flush (:obj:`bool`, optional): Whether the file is flushed after each update. Defaults to
+            ``True``.
+
+    """
+
+    def __init__(self, file, flush=True):
+        if isinstance(file, str):
+            self._file = open(file, 'ab')
+            self._close_file = True
+        else:
+            self._file = file
+            self._close_file = False
+        self.flush = flush
+        self.written = 0
+        self.encoded = 0
+        self._lock = Lock()
+
+    def write(self, update):
+        """Appends an update to the file.
+
+        Args:
+            update (:class:`telegram.Update`): The update.
+
+        """
+        line = update.raw_json
+        encoded = line is None
+        if encoded:
+            line = encode_json(update.to_dict())
+        elif b'\n' in line:
+            # Line breaks can only be whitespace between the tokens of a JSON document
+            line = line.replace(b'\n', b' ')
+
+        with self._lock:
+            self._file.write(line + b'\n')
+            self.encoded += encoded
+            if self.flush:
+                self._file.flush()
+            self.written += 1
+
+    def callback(self, update, context):
+        """Writes the update, for use as callback of a :class:`telegram.ext.TypeHandler`."""
+        self.write(update)
+
+    def close(self):
+        """Closes the file, if it was opened by the archive."""
+        with self._lock:
+            if self._close_file:
+                self._file.close()
@@ -30,7 +30,6 @@ from telegram.ext import Dispatcher, JobQueue
 from telegram.error import Unauthorized, InvalidToken, RetryAfter, TimedOut
 from telegram.utils.helpers import get_signal_name
 from telegram.utils.request import Request
-from telegram.utils.webhookhandler import (WebhookServer, WebhookAppClass)
 
 
 class Updater:
@@ -88,6 +87,23 @@ class Updater:
             used).
         defaults (:class:`telegram.ext.Defaults`, optional): An object containing default values to
             be used if not set explicitly in the bot methods.
+        rate_limiter (:class:`telegram.ext.AdaptiveRateLimiter`, optional): An object throttling
+            the requests made by the bot (ignored if `bot` or `dispatcher` argument is used).
+        upload_cache (:class:`telegram.ext.UploadCache`, optional): A cache of the ``file_id`` s
+            of uploaded files (ignored if `bot` or `dispatcher` argument is used).
+        download_cache (:class:`telegram.ext.DownloadCache`, optional): A cache of downloaded
+            files (ignored if `bot` or `dispatcher` argument is used).
+        identity_file (:obj:`str`, optional): Path of a JSON file to keep the bot's identity in,
+            so that it is known at startup without a request (ignored if `bot` or `dispatcher`
+            argument is used).
+        lazy_updates (:obj:`bool`, optional): Whether the sub-objects of updates are decoded only
+            when they are accessed, see :attr:`telegram.Bot.lazy_updates` (ignored if `bot` or
+            `dispatcher` argument is used). Defaults to ``False``.
+        intern_cache (:class:`telegram.ext.InternCache`, optional): A cache sharing the users and
+            chats of updates (ignored if `bot` or `dispatcher` argument is used).
+        keep_raw_updates (:obj:`bool`, optional): Whether updates keep the data they were decoded
+            from, see :attr:`telegram.Update.raw_data` (ignored if `bot` or `dispatcher` argument
+            is used). Defaults to ``False``.
 
     Note:
         * You must supply either a :attr:`bot` or a :attr:`token` argument.
@@ -114,7 +130,14 @@ class Updater:
                  defaults=None,
                  use_context=False,
                  dispatcher=None,
-                 base_file_url=None):
+                 base_file_url=None,
+                 rate_limiter=None,
+                 upload_cache=None,
+                 download_cache=None,
+                 identity_file=None,
+                 lazy_updates=False,
+                 intern_cache=None,
+                 keep_raw_updates=False):
 
         if dispatcher is None:
             if (token is None) and (bot is None):
@@ -162,7 +185,14 @@ class Updater:
                                request=self._request,
                                private_key=private_key,
                                private_key_password=private_key_password,
-                               defaults=defaults)
+                               defaults=defaults,
+                               rate_limiter=rate_limiter,
+                               upload_cache=upload_cache,
+                               download_cache=download_cache,
+                               identity_file=identity_file,
+                               lazy_updates=lazy_updates,
+                               intern_cache=intern_cache,
+                               keep_raw_updates=keep_raw_updates)
             self.update_queue = Queue()
             self.job_queue = JobQueue()
             self.__exception_event = Event()
@@ -197,9 +227,6 @@ class Updater:
         self.__lock = Lock()
         self.__threads = []
 
-        # Just for passing to WebhookAppClass
-        self._default_quote = defaults.quote if defaults else None
-
     def _init_thread(self, target, name, *args, **kwargs):
         thr = Thread(target=self._thread_wrapper,
                      name="Bot:{}:{}".format(self.bot.id, name),
@@ -411,14 +438,16 @@ class Updater:
 
     def _start_webhook(self, listen, port, url_path, cert, key, bootstrap_retries, clean,
                        webhook_url, allowed_updates):
+        # tornado is only imported if needed, as it is slow to import
+        from telegram.utils.webhookhandler import WebhookServer, WebhookAppClass
+
         self.logger.debug('Updater thread started (webhook)')
         use_ssl = cert is not None and key is not None
         if not url_path.startswith('/'):
             url_path = '/{}'.format(url_path)
 
         # Create Tornado app instance
-        app = WebhookAppClass(url_path, self.bot, self.update_queue,
-                              default_quote=self._default_quote)
+        app = WebhookAppClass(url_path, self.bot, self.update_queue)
 
         # Form SSL Context
         # An SSLError is raised if the private key does not match with the certificate
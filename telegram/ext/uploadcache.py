@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the UploadCache class."""
+import copy
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from threading import Lock
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+from telegram import InputFile, InputMedia
+from telegram.error import BadRequest
+
+# Message attributes a file_id can be taken from, i.e. the parameter names of the send methods
+MEDIA_FIELDS = ('photo', 'audio', 'document', 'video', 'animation', 'voice', 'video_note',
+                'sticker')
+
+
+class UploadCache:
+    """
+    Remembers the ``file_id`` of uploaded files, so that sending the same content again does not
+    upload it again.
+
+    The cache is keyed by the SHA-256 digest of the file content together with the kind of media
+    (photo, document, ...) and the bot, because a ``file_id`` is only valid for the bot that
+    uploaded the file. After a successful upload the ``file_id`` is taken from the returned
+    :class:`telegram.Message`. Later sends of identical content transparently pass that
+    ``file_id`` instead of the file. If Telegram rejects a cached ``file_id``, the entry is
+    dropped and the file is uploaded again.
+
+    Example:
+        .. code:: python
+
+            bot = Bot(TOKEN, upload_cache=UploadCache('uploads.json'))
+            for chat_id in chat_ids:
+                with open('logo.png', 'rb') as logo:
+                    bot.send_photo(chat_id, logo)  # uploaded only once
+
+    Note:
+        Only files sent with the ``send_*`` methods, :meth:`telegram.Bot.send_media_group` and
+        :meth:`telegram.Bot.edit_message_media` are cached. Thumbnails are always uploaded, as
+        they can not be reused.
+
+    Attributes:
+        filename (:obj:`str`): Optional. Path of the JSON file the cache is persisted to.
+        max_entries (:obj:`int`): Number of cached ``file_id`` s above which the least recently
+            used ones are dropped.
+
+    Args:
+        filename (:obj:`str`, optional): Path of the JSON file the cache is persisted to. If it
+            exists, the cache is loaded from it. If not passed, the cache is kept in memory only.
+        max_entries (:obj:`int`, optional): Number of cached ``file_id`` s above which the least
+            recently used ones are dropped. Defaults to 10000.
+
+    """
+
+    def __init__(self, filename=None, max_entries=10000):
+        self.filename = filename
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._save_lock = Lock()
+
+        if filename and os.path.exists(filename):
+            with open(filename, 'r') as file:
+                self._entries.update(json.load(file))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def digest(input_file):
+        """Returns the hex digest identifying the content of a file.
+
+        Args:
+            input_file (:class:`telegram.InputFile`): The file.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return hashlib.sha256(input_file.input_file_content).hexdigest()
+
+    def get(self, key):
+        """Returns the cached ``file_id`` for ``key`` or :obj:`None`."""
+        with self._lock:
+            file_id = self._entries.get(key)
+            if file_id is not None:
+                self._entries.move_to_end(key)
+            return file_id
+
+    def put(self, key, file_id):
+        """Caches ``file_id`` for ``key`` and persists the cache, if :attr:`filename` is set."""
+        with self._lock:
+            if self._entries.get(key) == file_id:
+                return
+            self._entries[key] = file_id
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self.save()
+
+    def invalidate(self, key):
+        """Drops the cached ``file_id`` for ``key``."""
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return
+        self.save()
+
+    def save(self):
+        """Saves the cache to :attr:`filename`. The file is replaced atomically."""
+        if not self.filename:
+            return
+        with self._save_lock:
+            with self._lock:
+                entries = list(self._entries.items())
+            tmp_file = '{}.tmp'.format(self.filename)
+            with open(tmp_file, 'w') as file:
+                json.dump(OrderedDict(entries), file)
+            os.replace(tmp_file, self.filename)
+
+    def _substitute(self, bot_id, data):
+        """Returns a copy of data with cached file_ids in place of the files, and a list of
+        (key, field, index, cached) for every uploaded or substituted file."""
+        pending = []
+        new_data = dict(data)
+
+        def lookup(field, index, input_file):
+            key = '{}:{}:{}'.format(bot_id, field, self.digest(input_file))
+            file_id = self.get(key)
+            pending.append((key, field, index, file_id is not None))
+            return file_id
+
+        for field in MEDIA_FIELDS:
+            if isinstance(data.get(field), InputFile):
+                file_id = lookup(field, None, data[field])
+                if file_id is not None:
+                    new_data[field] = file_id
+
+        media = data.get('media')
+        if isinstance(media, (InputMedia, list, tuple)):
+            single = isinstance(media, InputMedia)
+            items = [media] if single else list(media)
+            for index, item in enumerate(items):
+                if isinstance(item, InputMedia) and isinstance(item.media, InputFile):
+                    file_id = lookup(item.type, None if single else index, item.media)
+                    if file_id is not None:
+                        # Don't touch the users objects
+                        items[index] = copy.copy(item)
+                        items[index].media = file_id
+            new_data['media'] = items[0] if single else items
+
+        return new_data, pending
+
+    @staticmethod
+    def _file_id(message, field):
+        if not isinstance(message, dict):
+            return None
+        attachment = message.get(field)
+        if field == 'photo' and attachment:
+            # The largest size comes last
+            attachment = attachment[-1]
+        if isinstance(attachment, dict):
+            return attachment.get('file_id')
+        return None
+
+    def _remember(self, pending, result):
+        for key, field, index, cached in pending:
+            if cached:
+                continue
+            message = result[index] if index is not None and isinstance(result, list) else result
+            file_id = self._file_id(message, field)
+            if file_id is not None:
+                self.put(key, file_id)
+
+    def process(self, bot_id, data, post):
+        """Sends a request, passing cached ``file_id`` s instead of files where possible and
+        remembering the ``file_id`` s of newly uploaded files.
+
+        Args:
+            bot_id (:obj:`str`): Identifier of the bot sending the request.
+            data (:obj:`dict`): The parameters of the request. Not modified.
+            post (:obj:`callable`): Takes the parameters and performs the request, returning the
+                decoded JSON result.
+
+        Returns:
+            The return value of ``post``.
+
+        """
+        new_data, pending = self._substitute(bot_id, data)
+        if not pending:
+            return post(data)
+
+        if any(cached for _, _, _, cached in pending):
+            try:
+                result = post(new_data)
+            except BadRequest as exc:
+                if 'file' not in exc.message.lower():
+                    raise
+                self.logger.debug('Cached file_id rejected, uploading again: %s', exc.message)
+                for key, _, _, cached in pending:
+                    if cached:
+                        self.invalidate(key)
+                pending = [(key, field, index, False) for key, field, index, _ in pending]
+                result = post(data)
+        else:
+            result = post(data)
+
+        self._remember(pending, result)
+        return result
@@ -56,6 +56,9 @@ class Animation(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'file_name',
+                 'mime_type', 'file_size', 'bot', '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
@@ -57,6 +57,9 @@ class Audio(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'performer', 'title', 'mime_type',
+                 'file_size', 'thumb', 'bot', '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
@@ -87,6 +90,8 @@ class Audio(TelegramObject):
         if not data:
             return None
 
+        data = super().de_json(data, bot)
+
         data['thumb'] = PhotoSize.de_json(data.get('thumb'), bot)
 
         return cls(bot=bot, **data)
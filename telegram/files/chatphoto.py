@@ -53,6 +53,9 @@ class ChatPhoto(TelegramObject):
 
     """
 
+    __slots__ = ('small_file_id', 'small_file_unique_id', 'big_file_id', 'big_file_unique_id',
+                 'bot', '_id_attrs')
+
     def __init__(self,
                  small_file_id,
                  small_file_unique_id,
@@ -41,6 +41,8 @@ class Contact(TelegramObject):
 
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'user_id', 'vcard', '_id_attrs')
+
     def __init__(self, phone_number, first_name, last_name=None, user_id=None, vcard=None,
                  **kwargs):
         # Required
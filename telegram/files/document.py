@@ -48,6 +48,10 @@ class Document(TelegramObject):
         **kwargs (:obj:`dict`): Arbitrary keyword arguments.
 
     """
+
+    __slots__ = ('file_id', 'file_unique_id', 'thumb', 'file_name', 'mime_type', 'file_size',
+                 'bot', '_id_attrs')
+
     _id_keys = ('file_id',)
 
     def __init__(self,
@@ -58,8 +58,15 @@ class File(TelegramObject):
         If you obtain an instance of this class from :attr:`telegram.PassportFile.get_file`,
         then it will automatically be decrypted as it downloads when you call :attr:`download()`.
 
+    Note:
+        If the bot has a :class:`telegram.ext.DownloadCache`, :attr:`download` and
+        :attr:`download_as_bytearray` read the file from the cache, if possible.
+
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_path', 'bot', '_credentials',
+                 '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
@@ -119,7 +126,7 @@ class File(TelegramObject):
         url = self._get_encoded_url()
 
         if out:
-            buf = self.bot.request.retrieve(url)
+            buf = self._retrieve(url, timeout=timeout)
             if self._credentials:
                 buf = decrypt(b64decode(self._credentials.secret),
                               b64decode(self._credentials.hash),
@@ -134,7 +141,7 @@ class File(TelegramObject):
             else:
                 filename = os.path.join(os.getcwd(), self.file_id)
 
-            buf = self.bot.request.retrieve(url, timeout=timeout)
+            buf = self._retrieve(url, timeout=timeout)
             if self._credentials:
                 buf = decrypt(b64decode(self._credentials.secret),
                               b64decode(self._credentials.hash),
@@ -143,6 +150,14 @@ class File(TelegramObject):
                 fobj.write(buf)
             return filename
 
+    def _retrieve(self, url, timeout=None):
+        cache = getattr(self.bot, 'download_cache', None)
+        if cache is None:
+            return self.bot.request.retrieve(url, timeout=timeout)
+        # Passport files are cached encrypted, just like they are downloaded
+        return cache.retrieve(self.file_unique_id,
+                              lambda: self.bot.request.retrieve(url, timeout=timeout))
+
     def _get_encoded_url(self):
         """Convert any UTF-8 char in :obj:`File.file_path` into a url encoded ASCII string."""
         sres = urllib_parse.urlsplit(self.file_path)
@@ -163,7 +178,7 @@ class File(TelegramObject):
         if buf is None:
             buf = bytearray()
 
-        buf.extend(self.bot.request.retrieve(self._get_encoded_url()))
+        buf.extend(self._retrieve(self._get_encoded_url()))
         return buf
 
     def set_credentials(self, credentials):
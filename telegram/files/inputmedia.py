@@ -30,7 +30,8 @@ class InputMedia(TelegramObject):
     :class:`telegram.InputMediaVideo` for detailed use.
 
     """
-    pass
+
+    __slots__ = ()
 
 
 class InputMediaAnimation(InputMedia):
@@ -72,6 +73,8 @@ class InputMediaAnimation(InputMedia):
         arguments.
     """
 
+    __slots__ = ('type', 'media', 'width', 'height', 'duration', 'thumb', 'caption', 'parse_mode')
+
     def __init__(self,
                  media,
                  thumb=None,
@@ -129,6 +132,8 @@ class InputMediaPhoto(InputMedia):
             in :class:`telegram.ParseMode` for the available modes.
     """
 
+    __slots__ = ('type', 'media', 'caption', 'parse_mode')
+
     def __init__(self, media, caption=None, parse_mode=DEFAULT_NONE):
         self.type = 'photo'
 
@@ -186,6 +191,9 @@ class InputMediaVideo(InputMedia):
         arguments.
     """
 
+    __slots__ = ('type', 'media', 'width', 'height', 'duration', 'thumb', 'caption', 'parse_mode',
+                 'supports_streaming')
+
     def __init__(self, media, caption=None, width=None, height=None, duration=None,
                  supports_streaming=None, parse_mode=DEFAULT_NONE, thumb=None):
         self.type = 'video'
@@ -258,6 +266,9 @@ class InputMediaAudio(InputMedia):
         optional arguments.
     """
 
+    __slots__ = ('type', 'media', 'duration', 'performer', 'title', 'thumb', 'caption',
+                 'parse_mode')
+
     def __init__(self, media, thumb=None, caption=None, parse_mode=DEFAULT_NONE,
                  duration=None, performer=None, title=None):
         self.type = 'audio'
@@ -315,6 +326,8 @@ class InputMediaDocument(InputMedia):
             Thumbnails can't be reused and can be only uploaded as a new file.
     """
 
+    __slots__ = ('type', 'media', 'thumb', 'caption', 'parse_mode')
+
     def __init__(self, media, thumb=None, caption=None, parse_mode=DEFAULT_NONE):
         self.type = 'document'
 
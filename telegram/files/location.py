@@ -35,6 +35,8 @@ class Location(TelegramObject):
 
     """
 
+    __slots__ = ('longitude', 'latitude', '_id_attrs')
+
     def __init__(self, longitude, latitude, **kwargs):
         # Required
         self.longitude = float(longitude)
@@ -47,6 +47,8 @@ class PhotoSize(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'file_size', 'bot', '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
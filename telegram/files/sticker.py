@@ -62,6 +62,9 @@ class Sticker(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'is_animated', 'thumb', 'emoji',
+                 'file_size', 'set_name', 'mask_position', 'bot', '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
@@ -152,6 +155,11 @@ class StickerSet(TelegramObject):
 
     """
 
+    __slots__ = ('name', 'title', 'is_animated', 'contains_masks', 'stickers', 'thumb',
+                 '_id_attrs')
+
+    _FIELD_KINDS = {'stickers': 'list'}
+
     def __init__(self, name, title, is_animated, contains_masks, stickers, bot=None, thumb=None,
                  **kwargs):
         self.name = name
@@ -176,13 +184,6 @@ class StickerSet(TelegramObject):
 
         return cls(bot=bot, **data)
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['stickers'] = [s.to_dict() for s in data.get('stickers')]
-
-        return data
-
 
 class MaskPosition(TelegramObject):
     """This object describes the position on faces where a mask should be placed by default.
@@ -210,6 +211,9 @@ class MaskPosition(TelegramObject):
         scale (:obj:`float`): Mask scaling coefficient. For example, 2.0 means double size.
 
     """
+
+    __slots__ = ('point', 'x_shift', 'y_shift', 'scale')
+
     FOREHEAD = 'forehead'
     """:obj:`str`: 'forehead'"""
     EYES = 'eyes'
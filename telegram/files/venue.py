@@ -43,6 +43,8 @@ class Venue(TelegramObject):
 
     """
 
+    __slots__ = ('location', 'title', 'address', 'foursquare_id', 'foursquare_type', '_id_attrs')
+
     def __init__(self, location, title, address, foursquare_id=None, foursquare_type=None,
                  **kwargs):
         # Required
@@ -53,6 +53,9 @@ class Video(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'width', 'height', 'duration', 'thumb', 'mime_type',
+                 'file_size', 'bot', '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
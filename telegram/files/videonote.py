@@ -49,6 +49,9 @@ class VideoNote(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'length', 'duration', 'thumb', 'file_size', 'bot',
+                 '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
@@ -47,6 +47,9 @@ class Voice(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'duration', 'mime_type', 'file_size', 'bot',
+                 '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
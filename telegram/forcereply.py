@@ -44,6 +44,8 @@ class ForceReply(ReplyMarkup):
 
     """
 
+    __slots__ = ('force_reply', 'selective')
+
     def __init__(self, force_reply=True, selective=False, **kwargs):
         # Required
         self.force_reply = bool(force_reply)
@@ -57,6 +57,10 @@ class Game(TelegramObject):
 
     """
 
+    __slots__ = ('title', 'description', 'photo', 'text', 'text_entities', 'animation')
+
+    _FIELD_KINDS = {'photo': 'list', 'text_entities': 'list'}
+
     def __init__(self,
                  title,
                  description,
@@ -85,15 +89,6 @@ class Game(TelegramObject):
 
         return cls(**data)
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['photo'] = [p.to_dict() for p in self.photo]
-        if self.text_entities:
-            data['text_entities'] = [x.to_dict() for x in self.text_entities]
-
-        return data
-
     def parse_text_entity(self, entity):
         """Returns the text from a given :class:`telegram.MessageEntity`.
 
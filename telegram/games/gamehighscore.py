@@ -36,6 +36,8 @@ class GameHighScore(TelegramObject):
 
     """
 
+    __slots__ = ('position', 'user', 'score')
+
     def __init__(self, position, user, score):
         self.position = position
         self.user = user
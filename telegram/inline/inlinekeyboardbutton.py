@@ -73,6 +73,9 @@ class InlineKeyboardButton(TelegramObject):
 
     """
 
+    __slots__ = ('text', 'url', 'login_url', 'callback_data', 'switch_inline_query',
+                 'switch_inline_query_current_chat', 'callback_game', 'pay')
+
     def __init__(self,
                  text,
                  url=None,
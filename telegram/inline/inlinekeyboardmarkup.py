@@ -36,19 +36,14 @@ class InlineKeyboardMarkup(ReplyMarkup):
 
     """
 
+    __slots__ = ('inline_keyboard',)
+
+    _FIELD_KINDS = {'inline_keyboard': 'lists'}
+
     def __init__(self, inline_keyboard, **kwargs):
         # Required
         self.inline_keyboard = inline_keyboard
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['inline_keyboard'] = []
-        for inline_keyboard in self.inline_keyboard:
-            data['inline_keyboard'].append([x.to_dict() for x in inline_keyboard])
-
-        return data
-
     @classmethod
     def de_json(cls, data, bot):
         if not data:
@@ -50,6 +50,8 @@ class InlineQuery(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'from_user', 'query', 'offset', 'location', 'bot', '_id_attrs')
+
     def __init__(self, id, from_user, query, offset, location=None, bot=None, **kwargs):
         # Required
         self.id = id
@@ -35,6 +35,8 @@ class InlineQueryResult(TelegramObject):
 
     """
 
+    __slots__ = ('type', 'id', '_id_attrs')
+
     def __init__(self, type, id, **kwargs):
         # Required
         self.type = str(type)
@@ -58,6 +58,9 @@ class InlineQueryResultArticle(InlineQueryResult):
 
     """
 
+    __slots__ = ('title', 'input_message_content', 'reply_markup', 'url', 'hide_url',
+                 'description', 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self,
                  id,
                  title,
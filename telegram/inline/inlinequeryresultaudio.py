@@ -62,6 +62,9 @@ class InlineQueryResultAudio(InlineQueryResult):
 
     """
 
+    __slots__ = ('audio_url', 'title', 'performer', 'audio_duration', 'caption', 'parse_mode',
+                 'reply_markup', 'input_message_content')
+
     def __init__(self,
                  id,
                  audio_url,
@@ -56,6 +56,8 @@ class InlineQueryResultCachedAudio(InlineQueryResult):
 
     """
 
+    __slots__ = ('audio_file_id', 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self,
                  id,
                  audio_file_id,
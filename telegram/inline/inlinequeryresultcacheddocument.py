@@ -62,6 +62,9 @@ class InlineQueryResultCachedDocument(InlineQueryResult):
 
     """
 
+    __slots__ = ('title', 'document_file_id', 'description', 'caption', 'parse_mode',
+                 'reply_markup', 'input_message_content')
+
     def __init__(self,
                  id,
                  title,
@@ -61,6 +61,9 @@ class InlineQueryResultCachedGif(InlineQueryResult):
 
     """
 
+    __slots__ = ('gif_file_id', 'title', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  gif_file_id,
@@ -61,6 +61,9 @@ class InlineQueryResultCachedMpeg4Gif(InlineQueryResult):
 
     """
 
+    __slots__ = ('mpeg4_file_id', 'title', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  mpeg4_file_id,
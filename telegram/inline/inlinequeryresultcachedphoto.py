@@ -63,6 +63,9 @@ class InlineQueryResultCachedPhoto(InlineQueryResult):
 
     """
 
+    __slots__ = ('photo_file_id', 'title', 'description', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  photo_file_id,
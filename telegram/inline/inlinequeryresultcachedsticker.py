@@ -47,6 +47,8 @@ class InlineQueryResultCachedSticker(InlineQueryResult):
 
     """
 
+    __slots__ = ('sticker_file_id', 'reply_markup', 'input_message_content')
+
     def __init__(self,
                  id,
                  sticker_file_id,
@@ -63,6 +63,9 @@ class InlineQueryResultCachedVideo(InlineQueryResult):
 
     """
 
+    __slots__ = ('video_file_id', 'title', 'description', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  video_file_id,
@@ -58,6 +58,9 @@ class InlineQueryResultCachedVoice(InlineQueryResult):
 
     """
 
+    __slots__ = ('voice_file_id', 'title', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  voice_file_id,
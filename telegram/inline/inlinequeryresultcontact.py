@@ -61,6 +61,9 @@ class InlineQueryResultContact(InlineQueryResult):
 
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup',
+                 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self,
                  id,
                  phone_number,
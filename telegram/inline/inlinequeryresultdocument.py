@@ -73,6 +73,10 @@ class InlineQueryResultDocument(InlineQueryResult):
 
     """
 
+    __slots__ = ('document_url', 'title', 'mime_type', 'caption', 'parse_mode', 'description',
+                 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width',
+                 'thumb_height')
+
     def __init__(self,
                  id,
                  document_url,
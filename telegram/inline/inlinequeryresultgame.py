@@ -40,6 +40,8 @@ class InlineQueryResultGame(InlineQueryResult):
 
     """
 
+    __slots__ = ('game_short_name', 'reply_markup')
+
     def __init__(self, id, game_short_name, reply_markup=None, **kwargs):
         # Required
         super().__init__('game', id)
@@ -71,6 +71,10 @@ class InlineQueryResultGif(InlineQueryResult):
 
     """
 
+    __slots__ = ('gif_url', 'thumb_url', 'gif_width', 'gif_height', 'gif_duration', 'title',
+                 'caption', 'parse_mode', 'reply_markup', 'input_message_content',
+                 'thumb_mime_type')
+
     def __init__(self,
                  id,
                  gif_url,
@@ -61,6 +61,9 @@ class InlineQueryResultLocation(InlineQueryResult):
 
     """
 
+    __slots__ = ('latitude', 'longitude', 'title', 'live_period', 'reply_markup',
+                 'input_message_content', 'thumb_url', 'thumb_width', 'thumb_height')
+
     def __init__(self,
                  id,
                  latitude,
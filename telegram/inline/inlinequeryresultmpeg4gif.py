@@ -72,6 +72,10 @@ class InlineQueryResultMpeg4Gif(InlineQueryResult):
 
     """
 
+    __slots__ = ('mpeg4_url', 'thumb_url', 'mpeg4_width', 'mpeg4_height', 'mpeg4_duration',
+                 'title', 'caption', 'parse_mode', 'reply_markup', 'input_message_content',
+                 'thumb_mime_type')
+
     def __init__(self,
                  id,
                  mpeg4_url,
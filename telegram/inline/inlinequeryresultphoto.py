@@ -70,6 +70,9 @@ class InlineQueryResultPhoto(InlineQueryResult):
 
     """
 
+    __slots__ = ('photo_url', 'thumb_url', 'photo_width', 'photo_height', 'title', 'description',
+                 'caption', 'parse_mode', 'reply_markup', 'input_message_content')
+
     def __init__(self,
                  id,
                  photo_url,
@@ -67,6 +67,10 @@ class InlineQueryResultVenue(InlineQueryResult):
 
     """
 
+    __slots__ = ('latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type',
+                 'reply_markup', 'input_message_content', 'thumb_url', 'thumb_width',
+                 'thumb_height')
+
     def __init__(self,
                  id,
                  latitude,
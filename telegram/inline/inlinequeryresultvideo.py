@@ -80,6 +80,10 @@ class InlineQueryResultVideo(InlineQueryResult):
 
     """
 
+    __slots__ = ('video_url', 'mime_type', 'thumb_url', 'title', 'caption', 'parse_mode',
+                 'video_width', 'video_height', 'video_duration', 'description', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  video_url,
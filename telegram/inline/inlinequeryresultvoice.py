@@ -61,6 +61,9 @@ class InlineQueryResultVoice(InlineQueryResult):
 
     """
 
+    __slots__ = ('voice_url', 'title', 'voice_duration', 'caption', 'parse_mode', 'reply_markup',
+                 'input_message_content')
+
     def __init__(self,
                  id,
                  voice_url,
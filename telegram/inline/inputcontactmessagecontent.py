@@ -41,6 +41,8 @@ class InputContactMessageContent(InputMessageContent):
 
     """
 
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard')
+
     def __init__(self, phone_number, first_name, last_name=None, vcard=None, **kwargs):
         # Required
         self.phone_number = phone_number
@@ -38,6 +38,8 @@ class InputLocationMessageContent(InputMessageContent):
 
     """
 
+    __slots__ = ('latitude', 'longitude', 'live_period')
+
     def __init__(self, latitude, longitude, live_period=None, **kwargs):
         # Required
         self.latitude = latitude
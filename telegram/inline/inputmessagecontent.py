@@ -29,6 +29,9 @@ class InputMessageContent(TelegramObject):
     :class:`telegram.InputVenueMessageContent` for more details.
 
     """
+
+    __slots__ = ()
+
     @property
     def _has_parse_mode(self):
         return hasattr(self, 'parse_mode')
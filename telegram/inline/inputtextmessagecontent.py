@@ -45,6 +45,8 @@ class InputTextMessageContent(InputMessageContent):
 
     """
 
+    __slots__ = ('message_text', 'parse_mode', 'disable_web_page_preview')
+
     def __init__(self,
                  message_text,
                  parse_mode=DEFAULT_NONE,
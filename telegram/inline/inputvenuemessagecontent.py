@@ -47,6 +47,8 @@ class InputVenueMessageContent(InputMessageContent):
 
     """
 
+    __slots__ = ('latitude', 'longitude', 'title', 'address', 'foursquare_id', 'foursquare_type')
+
     def __init__(self, latitude, longitude, title, address, foursquare_id=None,
                  foursquare_type=None, **kwargs):
         # Required
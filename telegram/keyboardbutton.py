@@ -55,6 +55,8 @@ class KeyboardButton(TelegramObject):
 
     """
 
+    __slots__ = ('text', 'request_contact', 'request_location', 'request_poll')
+
     def __init__(self, text, request_contact=None, request_location=None, request_poll=None,
                  **kwargs):
         # Required
@@ -31,6 +31,9 @@ class KeyboardButtonPollType(TelegramObject):
             passed, only regular polls will be allowed. Otherwise, the user will be allowed to
             create a poll of any type.
     """
+
+    __slots__ = ('type', '_id_attrs')
+
     def __init__(self, type=None):
         self.type = type
 
@@ -53,6 +53,8 @@ class LoginUrl(TelegramObject):
             bot to send messages to the user.
     """
 
+    __slots__ = ('url', 'forward_text', 'bot_username', 'request_write_access', '_id_attrs')
+
     def __init__(self, url, forward_text=None, bot_username=None, request_write_access=None):
         # Required
         self.url = url
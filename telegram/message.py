@@ -25,11 +25,56 @@ from telegram import (Animation, Audio, Contact, Document, Chat, Location, Photo
                       TelegramObject, User, Video, Voice, Venue, MessageEntity, Game, Invoice,
                       SuccessfulPayment, VideoNote, PassportData, Poll, InlineKeyboardMarkup, Dice)
 from telegram import ParseMode
-from telegram.utils.helpers import escape_markdown, to_timestamp, from_timestamp
+from telegram.base import _Timestamp
+from telegram.utils.helpers import escape_markdown
 
 _UNDEFINED = object()
 
 
+def _decoders(lazy):
+    """Returns the functions decoding the attributes of a message that hold other objects from the
+    data of the message and the bot. Nested messages are decoded lazily as well, if ``lazy`` is
+    passed."""
+    message = Message._de_json_lazy if lazy else Message.de_json
+    return {
+        'from_user': lambda data, bot: User.de_json(data.get('from'), bot),
+        'date': lambda data, bot: data.get('date'),
+        'chat': lambda data, bot: Chat.de_json(data.get('chat'), bot),
+        'entities': lambda data, bot: MessageEntity.de_list(data.get('entities'), bot),
+        'caption_entities': lambda data, bot: MessageEntity.de_list(data.get('caption_entities'),
+                                                                    bot),
+        'forward_from': lambda data, bot: User.de_json(data.get('forward_from'), bot),
+        'forward_from_chat': lambda data, bot: Chat.de_json(data.get('forward_from_chat'),
+                                                            bot),
+        'reply_to_message': lambda data, bot: message(data.get('reply_to_message'), bot),
+        'audio': lambda data, bot: Audio.de_json(data.get('audio'), bot),
+        'document': lambda data, bot: Document.de_json(data.get('document'), bot),
+        'animation': lambda data, bot: Animation.de_json(data.get('animation'), bot),
+        'game': lambda data, bot: Game.de_json(data.get('game'), bot),
+        'photo': lambda data, bot: PhotoSize.de_list(data.get('photo'), bot),
+        'sticker': lambda data, bot: Sticker.de_json(data.get('sticker'), bot),
+        'video': lambda data, bot: Video.de_json(data.get('video'), bot),
+        'voice': lambda data, bot: Voice.de_json(data.get('voice'), bot),
+        'video_note': lambda data, bot: VideoNote.de_json(data.get('video_note'), bot),
+        'contact': lambda data, bot: Contact.de_json(data.get('contact'), bot),
+        'location': lambda data, bot: Location.de_json(data.get('location'), bot),
+        'venue': lambda data, bot: Venue.de_json(data.get('venue'), bot),
+        'new_chat_members': lambda data, bot: User.de_list(data.get('new_chat_members'), bot),
+        'left_chat_member': lambda data, bot: User.de_json(data.get('left_chat_member'), bot),
+        'new_chat_photo': lambda data, bot: PhotoSize.de_list(data.get('new_chat_photo'), bot),
+        'pinned_message': lambda data, bot: message(data.get('pinned_message'), bot),
+        'invoice': lambda data, bot: Invoice.de_json(data.get('invoice'), bot),
+        'successful_payment': lambda data, bot: SuccessfulPayment.de_json(
+            data.get('successful_payment'), bot),
+        'passport_data': lambda data, bot: PassportData.de_json(data.get('passport_data'), bot),
+        'poll': lambda data, bot: Poll.de_json(data.get('poll'), bot),
+        'dice': lambda data, bot: Dice.de_json(data.get('dice'), bot),
+        'via_bot': lambda data, bot: User.de_json(data.get('via_bot'), bot),
+        'reply_markup': lambda data, bot: InlineKeyboardMarkup.de_json(data.get('reply_markup'),
+                                                                       bot),
+    }
+
+
 class Message(TelegramObject):
     """This object represents a message.
 
@@ -112,7 +157,8 @@ class Message(TelegramObject):
             to the message.
         bot (:class:`telegram.Bot`): Optional. The Bot to use for instance methods.
         default_quote (:obj:`bool`): Optional. Default setting for the `quote` parameter of the
-            :attr:`reply_text` and friends.
+            :attr:`reply_text` and friends. If not set for this message, the ``quote`` setting of
+            the :class:`telegram.ext.Defaults` of :attr:`bot` is used.
 
     Args:
         message_id (:obj:`int`): Unique message identifier inside this chat.
@@ -225,7 +271,27 @@ class Message(TelegramObject):
 
     """
 
-    _effective_attachment = _UNDEFINED
+    __slots__ = ('message_id', 'from_user', '_date', 'chat', 'forward_from', 'forward_from_chat',
+                 '_forward_date', 'reply_to_message', '_edit_date', 'text', 'entities',
+                 'caption_entities', 'audio', 'game', 'document', 'photo', 'sticker', 'video',
+                 'voice', 'video_note', 'caption', 'contact', 'location', 'venue',
+                 'new_chat_members', 'left_chat_member', 'new_chat_title', 'new_chat_photo',
+                 'delete_chat_photo', 'group_chat_created', 'supergroup_chat_created',
+                 'migrate_to_chat_id', 'migrate_from_chat_id', 'channel_chat_created',
+                 'pinned_message', 'forward_from_message_id', 'invoice', 'successful_payment',
+                 'connected_website', 'forward_signature', 'forward_sender_name',
+                 'author_signature', 'media_group_id', 'animation', 'passport_data', 'poll',
+                 'dice', 'via_bot', 'reply_markup', 'bot', '_default_quote',
+                 '_effective_attachment', '_id_attrs', '_lazy')
+
+    _FIELD_KINDS = {'date': 'timestamp', 'forward_date': 'timestamp', 'edit_date': 'timestamp',
+                    'entities': 'list', 'caption_entities': 'list', 'photo': 'list',
+                    'new_chat_members': 'list', 'new_chat_photo': 'list'}
+
+    # Keep the timestamps received until the datetimes are needed
+    date = _Timestamp('_date')
+    forward_date = _Timestamp('_forward_date')
+    edit_date = _Timestamp('_edit_date')
 
     ATTACHMENT_TYPES = ['audio', 'game', 'animation', 'document', 'photo', 'sticker', 'video',
                         'voice', 'video_note', 'contact', 'location', 'venue', 'invoice',
@@ -343,8 +409,24 @@ class Message(TelegramObject):
         self.bot = bot
         self.default_quote = default_quote
 
+        self._effective_attachment = _UNDEFINED
+
         self._id_attrs = (self.message_id,)
 
+    @property
+    def default_quote(self):
+        # Resolved when needed, so that the defaults don't have to be passed on while decoding
+        default_quote = getattr(self, '_default_quote', None)
+        if default_quote is None:
+            defaults = getattr(getattr(self, 'bot', None), 'defaults', None)
+            if defaults:
+                return defaults.quote
+        return default_quote
+
+    @default_quote.setter
+    def default_quote(self, value):
+        self._default_quote = value
+
     @property
     def chat_id(self):
         """:obj:`int`: Shortcut for :attr:`telegram.Chat.id` for :attr:`chat`."""
@@ -370,51 +452,8 @@ class Message(TelegramObject):
 
         data = super().de_json(data, bot)
 
-        data['from_user'] = User.de_json(data.get('from'), bot)
-        data['date'] = from_timestamp(data['date'])
-        chat = data.get('chat')
-        if chat:
-            chat['default_quote'] = data.get('default_quote')
-        data['chat'] = Chat.de_json(chat, bot)
-        data['entities'] = MessageEntity.de_list(data.get('entities'), bot)
-        data['caption_entities'] = MessageEntity.de_list(data.get('caption_entities'), bot)
-        data['forward_from'] = User.de_json(data.get('forward_from'), bot)
-        forward_from_chat = data.get('forward_from_chat')
-        if forward_from_chat:
-            forward_from_chat['default_quote'] = data.get('default_quote')
-        data['forward_from_chat'] = Chat.de_json(forward_from_chat, bot)
-        data['forward_date'] = from_timestamp(data.get('forward_date'))
-        reply_to_message = data.get('reply_to_message')
-        if reply_to_message:
-            reply_to_message['default_quote'] = data.get('default_quote')
-        data['reply_to_message'] = Message.de_json(reply_to_message, bot)
-        data['edit_date'] = from_timestamp(data.get('edit_date'))
-        data['audio'] = Audio.de_json(data.get('audio'), bot)
-        data['document'] = Document.de_json(data.get('document'), bot)
-        data['animation'] = Animation.de_json(data.get('animation'), bot)
-        data['game'] = Game.de_json(data.get('game'), bot)
-        data['photo'] = PhotoSize.de_list(data.get('photo'), bot)
-        data['sticker'] = Sticker.de_json(data.get('sticker'), bot)
-        data['video'] = Video.de_json(data.get('video'), bot)
-        data['voice'] = Voice.de_json(data.get('voice'), bot)
-        data['video_note'] = VideoNote.de_json(data.get('video_note'), bot)
-        data['contact'] = Contact.de_json(data.get('contact'), bot)
-        data['location'] = Location.de_json(data.get('location'), bot)
-        data['venue'] = Venue.de_json(data.get('venue'), bot)
-        data['new_chat_members'] = User.de_list(data.get('new_chat_members'), bot)
-        data['left_chat_member'] = User.de_json(data.get('left_chat_member'), bot)
-        data['new_chat_photo'] = PhotoSize.de_list(data.get('new_chat_photo'), bot)
-        pinned_message = data.get('pinned_message')
-        if pinned_message:
-            pinned_message['default_quote'] = data.get('default_quote')
-        data['pinned_message'] = Message.de_json(pinned_message, bot)
-        data['invoice'] = Invoice.de_json(data.get('invoice'), bot)
-        data['successful_payment'] = SuccessfulPayment.de_json(data.get('successful_payment'), bot)
-        data['passport_data'] = PassportData.de_json(data.get('passport_data'), bot)
-        data['poll'] = Poll.de_json(data.get('poll'), bot)
-        data['dice'] = Dice.de_json(data.get('dice'), bot)
-        data['via_bot'] = User.de_json(data.get('via_bot'), bot)
-        data['reply_markup'] = InlineKeyboardMarkup.de_json(data.get('reply_markup'), bot)
+        for name, decode in cls._DECODERS.items():
+            data[name] = decode(data, bot)
 
         return cls(bot=bot, **data)
 
@@ -451,33 +490,12 @@ class Message(TelegramObject):
         return self._effective_attachment
 
     def __getitem__(self, item):
-        if item in self.__dict__.keys():
-            return self.__dict__[item]
-        elif item == 'chat_id':
-            return self.chat.id
-
-    def to_dict(self):
-        data = super().to_dict()
-
-        # Required
-        data['date'] = to_timestamp(self.date)
-        # Optionals
-        if self.forward_date:
-            data['forward_date'] = to_timestamp(self.forward_date)
-        if self.edit_date:
-            data['edit_date'] = to_timestamp(self.edit_date)
-        if self.photo:
-            data['photo'] = [p.to_dict() for p in self.photo]
-        if self.entities:
-            data['entities'] = [e.to_dict() for e in self.entities]
-        if self.caption_entities:
-            data['caption_entities'] = [e.to_dict() for e in self.caption_entities]
-        if self.new_chat_photo:
-            data['new_chat_photo'] = [p.to_dict() for p in self.new_chat_photo]
-        if self.new_chat_members:
-            data['new_chat_members'] = [u.to_dict() for u in self.new_chat_members]
-
-        return data
+        try:
+            return super().__getitem__(item)
+        except KeyError:
+            if item == 'chat_id':
+                return self.chat.id
+            return None
 
     def _quote(self, kwargs):
         """Modify kwargs for replying with or without quoting."""
@@ -1042,10 +1060,7 @@ class Message(TelegramObject):
         if types is None:
             types = MessageEntity.ALL_TYPES
 
-        return {
-            entity: self.parse_entity(entity)
-            for entity in self.entities if entity.type in types
-        }
+        return self._entity_texts(self.text, self.entities, types)
 
     def parse_caption_entities(self, types=None):
         """
@@ -1073,95 +1088,96 @@ class Message(TelegramObject):
         if types is None:
             types = MessageEntity.ALL_TYPES
 
-        return {
-            entity: self.parse_caption_entity(entity)
-            for entity in self.caption_entities if entity.type in types
-        }
+        return self._entity_texts(self.caption, self.caption_entities, types)
 
     @staticmethod
-    def _parse_html(message_text, entities, urled=False, offset=0):
-        if message_text is None:
-            return None
-
-        if not sys.maxunicode == 0xffff:
-            message_text = message_text.encode('utf-16-le')
-
-        html_text = ''
-        last_offset = 0
-
-        sorted_entities = sorted(entities.items(), key=(lambda item: item[0].offset))
-        parsed_entities = []
-
-        for (entity, text) in sorted_entities:
-            if entity not in parsed_entities:
-                nested_entities = {
-                    e: t
-                    for (e, t) in sorted_entities if e.offset >= entity.offset
-                    and e.offset + e.length <= entity.offset + entity.length
-                    and e != entity
-                }
-                parsed_entities.extend([e for e in nested_entities.keys()])
-
-                text = escape(text)
-
-                if nested_entities:
-                    text = Message._parse_html(text, nested_entities,
-                                               urled=urled, offset=entity.offset)
-
-                if entity.type == MessageEntity.TEXT_LINK:
-                    insert = '<a href="{}">{}</a>'.format(entity.url, text)
-                elif entity.type == MessageEntity.TEXT_MENTION and entity.user:
-                    insert = '<a href="tg://user?id={}">{}</a>'.format(entity.user.id, text)
-                elif entity.type == MessageEntity.URL and urled:
-                    insert = '<a href="{0}">{0}</a>'.format(text)
-                elif entity.type == MessageEntity.BOLD:
-                    insert = '<b>' + text + '</b>'
-                elif entity.type == MessageEntity.ITALIC:
-                    insert = '<i>' + text + '</i>'
-                elif entity.type == MessageEntity.CODE:
-                    insert = '<code>' + text + '</code>'
-                elif entity.type == MessageEntity.PRE:
-                    if entity.language:
-                        insert = '<pre><code class="{}">{}</code></pre>'.format(entity.language,
-                                                                                text)
-                    else:
-                        insert = '<pre>' + text + '</pre>'
-                elif entity.type == MessageEntity.UNDERLINE:
-                    insert = '<u>' + text + '</u>'
-                elif entity.type == MessageEntity.STRIKETHROUGH:
-                    insert = '<s>' + text + '</s>'
+    def _entity_texts(message_text, entities, types):
+        # Like parse_entity, but the text is encoded only once
+        entity_texts = {}
+        encoded = None
+        for entity in entities:
+            if entity.type in types:
+                if sys.maxunicode == 0xffff:
+                    entity_texts[entity] = message_text[entity.offset:entity.offset
+                                                        + entity.length]
                 else:
-                    insert = text
+                    if encoded is None:
+                        encoded = message_text.encode('utf-16-le')
+                    entity_texts[entity] = encoded[entity.offset * 2:(entity.offset
+                                                   + entity.length) * 2].decode('utf-16-le')
+        return entity_texts
 
-                if offset == 0:
-                    if sys.maxunicode == 0xffff:
-                        html_text += escape(message_text[last_offset:entity.offset
-                                                         - offset]) + insert
-                    else:
-                        html_text += escape(message_text[last_offset * 2:(entity.offset
-                                                         - offset) * 2]
-                                            .decode('utf-16-le')) + insert
-                else:
-                    if sys.maxunicode == 0xffff:
-                        html_text += message_text[last_offset:entity.offset - offset] + insert
-                    else:
-                        html_text += message_text[last_offset * 2:(entity.offset
-                                                  - offset) * 2].decode('utf-16-le') + insert
+    @staticmethod
+    def _entity_tree(entities):
+        """Returns the entities as a list of ``(entity, children)`` tuples, where ``children`` is
+        such a list of the entities within the range of ``entity``. It's built in a single pass
+        over the entities sorted by offset, which keeps the enclosing entities on a stack."""
+        roots = []
+        stack = []
+        for entity in sorted(entities, key=lambda e: (e.offset, -e.length)):
+            end = entity.offset + entity.length
+            while stack and stack[-1][0].offset + stack[-1][0].length < end:
+                stack.pop()
+            node = (entity, [])
+            (stack[-1][1] if stack else roots).append(node)
+            stack.append(node)
+        return roots
 
-                last_offset = entity.offset - offset + entity.length
+    @staticmethod
+    def _text_slicer(message_text):
+        """Returns a function returning the text between two offsets, which count UTF-16 code
+        units, and the length of the text in UTF-16 code units. The text is encoded only once."""
+        if sys.maxunicode == 0xffff:
+            return lambda start, end: message_text[start:end], len(message_text)
 
-        if offset == 0:
-            if sys.maxunicode == 0xffff:
-                html_text += escape(message_text[last_offset:])
-            else:
-                html_text += escape(message_text[last_offset * 2:].decode('utf-16-le'))
-        else:
-            if sys.maxunicode == 0xffff:
-                html_text += message_text[last_offset:]
-            else:
-                html_text += message_text[last_offset * 2:].decode('utf-16-le')
+        encoded = message_text.encode('utf-16-le')
+        return (lambda start, end: encoded[start * 2:end * 2].decode('utf-16-le'),
+                len(encoded) // 2)
 
-        return html_text
+    @staticmethod
+    def _parse_html(message_text, entities, urled=False):
+        if message_text is None:
+            return None
+
+        text_slice, length = Message._text_slicer(message_text)
+
+        def render(start, end, nodes):
+            # The text between the entities is escaped, the entities render their own text
+            parts = []
+            last_offset = start
+            for entity, children in nodes:
+                parts.append(escape(text_slice(last_offset, entity.offset)))
+                parts.append(render_entity(entity, children))
+                last_offset = entity.offset + entity.length
+            parts.append(escape(text_slice(last_offset, end)))
+            return ''.join(parts)
+
+        def render_entity(entity, children):
+            text = render(entity.offset, entity.offset + entity.length, children)
+
+            if entity.type == MessageEntity.TEXT_LINK:
+                return '<a href="{}">{}</a>'.format(entity.url, text)
+            if entity.type == MessageEntity.TEXT_MENTION and entity.user:
+                return '<a href="tg://user?id={}">{}</a>'.format(entity.user.id, text)
+            if entity.type == MessageEntity.URL and urled:
+                return '<a href="{0}">{0}</a>'.format(text)
+            if entity.type == MessageEntity.BOLD:
+                return '<b>' + text + '</b>'
+            if entity.type == MessageEntity.ITALIC:
+                return '<i>' + text + '</i>'
+            if entity.type == MessageEntity.CODE:
+                return '<code>' + text + '</code>'
+            if entity.type == MessageEntity.PRE:
+                if entity.language:
+                    return '<pre><code class="{}">{}</code></pre>'.format(entity.language, text)
+                return '<pre>' + text + '</pre>'
+            if entity.type == MessageEntity.UNDERLINE:
+                return '<u>' + text + '</u>'
+            if entity.type == MessageEntity.STRIKETHROUGH:
+                return '<s>' + text + '</s>'
+            return text
+
+        return render(0, length, Message._entity_tree(entities))
 
     @property
     def text_html(self):
@@ -1218,124 +1234,84 @@ class Message(TelegramObject):
         return self._parse_html(self.caption, self.parse_caption_entities(), urled=True)
 
     @staticmethod
-    def _parse_markdown(message_text, entities, urled=False, version=1, offset=0):
+    def _parse_markdown(message_text, entities, urled=False, version=1):
         version = int(version)
 
         if message_text is None:
             return None
 
-        if not sys.maxunicode == 0xffff:
-            message_text = message_text.encode('utf-16-le')
-
-        markdown_text = ''
-        last_offset = 0
-
-        sorted_entities = sorted(entities.items(), key=(lambda item: item[0].offset))
-        parsed_entities = []
-
-        for (entity, text) in sorted_entities:
-            if entity not in parsed_entities:
-                nested_entities = {
-                    e: t
-                    for (e, t) in sorted_entities if e.offset >= entity.offset
-                    and e.offset + e.length <= entity.offset + entity.length
-                    and e != entity
-                }
-                parsed_entities.extend([e for e in nested_entities.keys()])
-
-                orig_text = text
-                text = escape_markdown(text, version=version)
-
-                if nested_entities:
-                    if version < 2:
-                        raise ValueError('Nested entities are not supported for Markdown '
-                                         'version 1')
-
-                    text = Message._parse_markdown(text, nested_entities,
-                                                   urled=urled, offset=entity.offset,
-                                                   version=version)
-
-                if entity.type == MessageEntity.TEXT_LINK:
-                    if version == 1:
-                        url = entity.url
-                    else:
-                        # Links need special escaping. Also can't have entities nested within
-                        url = escape_markdown(entity.url, version=version,
-                                              entity_type=MessageEntity.TEXT_LINK)
-                    insert = '[{}]({})'.format(text, url)
-                elif entity.type == MessageEntity.TEXT_MENTION and entity.user:
-                    insert = '[{}](tg://user?id={})'.format(text, entity.user.id)
-                elif entity.type == MessageEntity.URL and urled:
-                    if version == 1:
-                        link = orig_text
-                    else:
-                        link = text
-                    insert = '[{}]({})'.format(link, orig_text)
-                elif entity.type == MessageEntity.BOLD:
-                    insert = '*' + text + '*'
-                elif entity.type == MessageEntity.ITALIC:
-                    insert = '_' + text + '_'
-                elif entity.type == MessageEntity.CODE:
-                    # Monospace needs special escaping. Also can't have entities nested within
-                    insert = '`' + escape_markdown(orig_text, version=version,
-                                                   entity_type=MessageEntity.CODE) + '`'
-                elif entity.type == MessageEntity.PRE:
-                    # Monospace needs special escaping. Also can't have entities nested within
-                    code = escape_markdown(orig_text, version=version,
-                                           entity_type=MessageEntity.PRE)
-                    if entity.language:
-                        prefix = '```' + entity.language + '\n'
-                    else:
-                        if code.startswith('\\'):
-                            prefix = '```'
-                        else:
-                            prefix = '```\n'
-                    insert = prefix + code + '```'
-                elif entity.type == MessageEntity.UNDERLINE:
-                    if version == 1:
-                        raise ValueError('Underline entities are not supported for Markdown '
-                                         'version 1')
-                    insert = '__' + text + '__'
-                elif entity.type == MessageEntity.STRIKETHROUGH:
-                    if version == 1:
-                        raise ValueError('Strikethrough entities are not supported for Markdown '
-                                         'version 1')
-                    insert = '~' + text + '~'
+        text_slice, length = Message._text_slicer(message_text)
+
+        def render(start, end, nodes):
+            # The text between the entities is escaped, the entities render their own text
+            parts = []
+            last_offset = start
+            for entity, children in nodes:
+                parts.append(escape_markdown(text_slice(last_offset, entity.offset),
+                                             version=version))
+                parts.append(render_entity(entity, children))
+                last_offset = entity.offset + entity.length
+            parts.append(escape_markdown(text_slice(last_offset, end), version=version))
+            return ''.join(parts)
+
+        def render_entity(entity, children):
+            if children and version < 2:
+                raise ValueError('Nested entities are not supported for Markdown version 1')
+
+            end = entity.offset + entity.length
+            if entity.type in (MessageEntity.CODE, MessageEntity.PRE, MessageEntity.URL):
+                orig_text = text_slice(entity.offset, end)
+            text = render(entity.offset, end, children)
+
+            if entity.type == MessageEntity.TEXT_LINK:
+                if version == 1:
+                    url = entity.url
                 else:
-                    insert = text
-
-                if offset == 0:
-                    if sys.maxunicode == 0xffff:
-                        markdown_text += escape_markdown(message_text[last_offset:entity.offset
-                                                                      - offset],
-                                                         version=version) + insert
-                    else:
-                        markdown_text += escape_markdown(message_text[last_offset * 2:
-                                                                      (entity.offset - offset) * 2]
-                                                         .decode('utf-16-le'),
-                                                         version=version) + insert
+                    # Links need special escaping. Also can't have entities nested within
+                    url = escape_markdown(entity.url, version=version,
+                                          entity_type=MessageEntity.TEXT_LINK)
+                return '[{}]({})'.format(text, url)
+            if entity.type == MessageEntity.TEXT_MENTION and entity.user:
+                return '[{}](tg://user?id={})'.format(text, entity.user.id)
+            if entity.type == MessageEntity.URL and urled:
+                if version == 1:
+                    link = orig_text
                 else:
-                    if sys.maxunicode == 0xffff:
-                        markdown_text += message_text[last_offset:entity.offset - offset] + insert
+                    link = text
+                return '[{}]({})'.format(link, orig_text)
+            if entity.type == MessageEntity.BOLD:
+                return '*' + text + '*'
+            if entity.type == MessageEntity.ITALIC:
+                return '_' + text + '_'
+            if entity.type == MessageEntity.CODE:
+                # Monospace needs special escaping. Also can't have entities nested within
+                return '`' + escape_markdown(orig_text, version=version,
+                                             entity_type=MessageEntity.CODE) + '`'
+            if entity.type == MessageEntity.PRE:
+                # Monospace needs special escaping. Also can't have entities nested within
+                code = escape_markdown(orig_text, version=version,
+                                       entity_type=MessageEntity.PRE)
+                if entity.language:
+                    prefix = '```' + entity.language + '\n'
+                else:
+                    if code.startswith('\\'):
+                        prefix = '```'
                     else:
-                        markdown_text += message_text[last_offset * 2:(entity.offset
-                                                      - offset) * 2].decode('utf-16-le') + insert
-
-                last_offset = entity.offset - offset + entity.length
-
-        if offset == 0:
-            if sys.maxunicode == 0xffff:
-                markdown_text += escape_markdown(message_text[last_offset:], version=version)
-            else:
-                markdown_text += escape_markdown(message_text[last_offset * 2:]
-                                                 .decode('utf-16-le'), version=version)
-        else:
-            if sys.maxunicode == 0xffff:
-                markdown_text += message_text[last_offset:]
-            else:
-                markdown_text += message_text[last_offset * 2:].decode('utf-16-le')
-
-        return markdown_text
+                        prefix = '```\n'
+                return prefix + code + '```'
+            if entity.type == MessageEntity.UNDERLINE:
+                if version == 1:
+                    raise ValueError('Underline entities are not supported for Markdown '
+                                     'version 1')
+                return '__' + text + '__'
+            if entity.type == MessageEntity.STRIKETHROUGH:
+                if version == 1:
+                    raise ValueError('Strikethrough entities are not supported for Markdown '
+                                     'version 1')
+                return '~' + text + '~'
+            return text
+
+        return render(0, length, Message._entity_tree(entities))
 
     @property
     def text_markdown(self):
@@ -1450,3 +1426,8 @@ class Message(TelegramObject):
         """
         return self._parse_markdown(self.caption, self.parse_caption_entities(),
                                     urled=True, version=2)
+
+
+# Used by Message.de_json, and by Update.de_json with Bot.lazy_updates
+Message._DECODERS = _decoders(lazy=False)
+Message._LAZY_ATTRIBUTES = _decoders(lazy=True)
@@ -51,6 +51,8 @@ class MessageEntity(TelegramObject):
 
     """
 
+    __slots__ = ('type', 'offset', 'length', 'url', 'user', 'language', '_id_attrs')
+
     def __init__(self, type, offset, length, url=None, user=None, language=None, **kwargs):
         # Required
         self.type = type
@@ -22,13 +22,6 @@ except ImportError:
     import json
 from base64 import b64decode
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.asymmetric.padding import OAEP, MGF1
-from cryptography.hazmat.primitives.ciphers import Cipher
-from cryptography.hazmat.primitives.ciphers.algorithms import AES
-from cryptography.hazmat.primitives.ciphers.modes import CBC
-from cryptography.hazmat.primitives.hashes import SHA512, SHA256, Hash, SHA1
-
 from telegram import TelegramObject, TelegramError
 
 
@@ -62,6 +55,13 @@ def decrypt(secret, hash, data):
         :obj:`bytes`: The decrypted data as bytes.
 
     """
+    # cryptography is only imported when passport data is decrypted, as it is slow to import
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.ciphers import Cipher
+    from cryptography.hazmat.primitives.ciphers.algorithms import AES
+    from cryptography.hazmat.primitives.ciphers.modes import CBC
+    from cryptography.hazmat.primitives.hashes import SHA512, SHA256, Hash
+
     # Make a SHA512 hash of secret + update
     digest = Hash(SHA512(), backend=default_backend())
     digest.update(secret + hash)
@@ -115,6 +115,9 @@ class EncryptedCredentials(TelegramObject):
 
     """
 
+    __slots__ = ('data', 'hash', 'secret', '_id_attrs', 'bot', '_decrypted_secret',
+                 '_decrypted_data')
+
     def __init__(self, data, hash, secret, bot=None, **kwargs):
         # Required
         self.data = data
@@ -146,6 +149,9 @@ class EncryptedCredentials(TelegramObject):
                 private/public key but can also suggest malformed/tampered data.
         """
         if self._decrypted_secret is None:
+            from cryptography.hazmat.primitives.asymmetric.padding import OAEP, MGF1
+            from cryptography.hazmat.primitives.hashes import SHA1
+
             # Try decrypting according to step 1 at
             # https://core.telegram.org/passport#decrypting-data
             # We make sure to base64 decode the secret first.
@@ -189,6 +195,8 @@ class Credentials(TelegramObject):
         nonce (:obj:`str`): Bot-specified nonce
     """
 
+    __slots__ = ('secure_data', 'nonce', 'bot')
+
     def __init__(self, secure_data, nonce, bot=None, **kwargs):
         # Required
         self.secure_data = secure_data
@@ -201,6 +209,8 @@ class Credentials(TelegramObject):
         if not data:
             return None
 
+        data = super().de_json(data, bot)
+
         data['secure_data'] = SecureData.de_json(data.get('secure_data'), bot=bot)
 
         return cls(bot=bot, **data)
@@ -234,6 +244,10 @@ class SecureData(TelegramObject):
             temporary registration.
     """
 
+    __slots__ = ('temporary_registration', 'passport_registration', 'rental_agreement',
+                 'bank_statement', 'utility_bill', 'address', 'identity_card', 'driver_license',
+                 'internal_passport', 'passport', 'personal_details', 'bot')
+
     def __init__(self,
                  personal_details=None,
                  passport=None,
@@ -268,6 +282,8 @@ class SecureData(TelegramObject):
         if not data:
             return None
 
+        data = super().de_json(data, bot)
+
         data['temporary_registration'] = SecureValue.de_json(data.get('temporary_registration'),
                                                              bot=bot)
         data['passport_registration'] = SecureValue.de_json(data.get('passport_registration'),
@@ -312,6 +328,10 @@ class SecureValue(TelegramObject):
 
     """
 
+    __slots__ = ('data', 'front_side', 'reverse_side', 'selfie', 'files', 'translation', 'bot')
+
+    _FIELD_KINDS = {'files': 'list', 'translation': 'list'}
+
     def __init__(self,
                  data=None,
                  front_side=None,
@@ -335,6 +355,8 @@ class SecureValue(TelegramObject):
         if not data:
             return None
 
+        data = super().de_json(data, bot)
+
         data['data'] = DataCredentials.de_json(data.get('data'), bot=bot)
         data['front_side'] = FileCredentials.de_json(data.get('front_side'), bot=bot)
         data['reverse_side'] = FileCredentials.de_json(data.get('reverse_side'), bot=bot)
@@ -344,18 +366,12 @@ class SecureValue(TelegramObject):
 
         return cls(bot=bot, **data)
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['files'] = [p.to_dict() for p in self.files]
-        data['translation'] = [p.to_dict() for p in self.translation]
-
-        return data
-
 
 class _CredentialsBase(TelegramObject):
     """Base class for DataCredentials and FileCredentials."""
 
+    __slots__ = ('hash', 'secret', 'file_hash', 'data_hash', 'bot')
+
     def __init__(self, hash, secret, bot=None, **kwargs):
         self.hash = hash
         self.secret = secret
@@ -399,6 +415,8 @@ class DataCredentials(_CredentialsBase):
         secret (:obj:`str`): Secret of encrypted data
     """
 
+    __slots__ = ()
+
     def __init__(self, data_hash, secret, **kwargs):
         super().__init__(data_hash, secret, **kwargs)
 
@@ -425,6 +443,8 @@ class FileCredentials(_CredentialsBase):
             secret (:obj:`str`): Secret of encrypted file
         """
 
+    __slots__ = ()
+
     def __init__(self, file_hash, secret, **kwargs):
         super().__init__(file_hash, secret, **kwargs)
 
@@ -40,6 +40,10 @@ class PersonalDetails(TelegramObject):
             residence.
     """
 
+    __slots__ = ('first_name', 'last_name', 'middle_name', 'birth_date', 'gender', 'country_code',
+                 'residence_country_code', 'first_name_native', 'last_name_native',
+                 'middle_name_native', 'bot')
+
     def __init__(self, first_name, last_name, birth_date, gender, country_code,
                  residence_country_code, first_name_native=None,
                  last_name_native=None, middle_name=None,
@@ -79,6 +83,9 @@ class ResidentialAddress(TelegramObject):
         post_code (:obj:`str`): Address post code.
     """
 
+    __slots__ = ('street_line1', 'street_line2', 'city', 'state', 'country_code', 'post_code',
+                 'bot')
+
     def __init__(self, street_line1, street_line2, city, state, country_code,
                  post_code, bot=None, **kwargs):
         # Required
@@ -108,6 +115,8 @@ class IdDocumentData(TelegramObject):
         expiry_date (:obj:`str`): Optional. Date of expiry, in DD.MM.YYYY format.
     """
 
+    __slots__ = ('document_no', 'expiry_date', 'bot')
+
     def __init__(self, document_no, expiry_date, bot=None, **kwargs):
         self.document_no = document_no
         self.expiry_date = expiry_date
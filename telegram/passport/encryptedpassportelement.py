@@ -101,6 +101,11 @@ class EncryptedPassportElement(TelegramObject):
         :obj:`telegram.PassportData.decrypted_data`.
     """
 
+    __slots__ = ('type', 'data', 'phone_number', 'email', 'files', 'front_side', 'reverse_side',
+                 'selfie', 'translation', 'hash', '_id_attrs', 'bot')
+
+    _FIELD_KINDS = {'files': 'list', 'translation': 'list'}
+
     def __init__(self,
                  type,
                  data=None,
@@ -195,13 +200,3 @@ class EncryptedPassportElement(TelegramObject):
             encrypted_passport_elements.append(cls.de_json(element, bot))
 
         return encrypted_passport_elements
-
-    def to_dict(self):
-        data = super().to_dict()
-
-        if self.files:
-            data['files'] = [p.to_dict() for p in self.files]
-        if self.translation:
-            data['translation'] = [p.to_dict() for p in self.translation]
-
-        return data
@@ -45,6 +45,10 @@ class PassportData(TelegramObject):
 
     """
 
+    __slots__ = ('data', 'credentials', 'bot', '_decrypted_data', '_id_attrs')
+
+    _FIELD_KINDS = {'data': 'list'}
+
     def __init__(self, data, credentials, bot=None, **kwargs):
         self.data = data
         self.credentials = credentials
@@ -65,13 +69,6 @@ class PassportData(TelegramObject):
 
         return cls(bot=bot, **data)
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['data'] = [e.to_dict() for e in self.data]
-
-        return data
-
     @property
     def decrypted_data(self):
         """
@@ -36,6 +36,8 @@ class PassportElementError(TelegramObject):
 
     """
 
+    __slots__ = ('source', 'type', 'message', '_id_attrs')
+
     def __init__(self, source, type, message, **kwargs):
         # Required
         self.source = str(source)
@@ -69,6 +71,8 @@ class PassportElementErrorDataField(PassportElementError):
 
     """
 
+    __slots__ = ('field_name', 'data_hash')
+
     def __init__(self,
                  type,
                  field_name,
@@ -105,6 +109,8 @@ class PassportElementErrorFile(PassportElementError):
 
     """
 
+    __slots__ = ('file_hash',)
+
     def __init__(self,
                  type,
                  file_hash,
@@ -139,6 +145,8 @@ class PassportElementErrorFiles(PassportElementError):
 
     """
 
+    __slots__ = ('file_hashes',)
+
     def __init__(self,
                  type,
                  file_hashes,
@@ -174,6 +182,8 @@ class PassportElementErrorFrontSide(PassportElementError):
 
     """
 
+    __slots__ = ('file_hash',)
+
     def __init__(self,
                  type,
                  file_hash,
@@ -208,6 +218,8 @@ class PassportElementErrorReverseSide(PassportElementError):
 
     """
 
+    __slots__ = ('file_hash',)
+
     def __init__(self,
                  type,
                  file_hash,
@@ -240,6 +252,8 @@ class PassportElementErrorSelfie(PassportElementError):
 
     """
 
+    __slots__ = ('file_hash',)
+
     def __init__(self,
                  type,
                  file_hash,
@@ -276,6 +290,8 @@ class PassportElementErrorTranslationFile(PassportElementError):
 
     """
 
+    __slots__ = ('file_hash',)
+
     def __init__(self,
                  type,
                  file_hash,
@@ -312,6 +328,8 @@ class PassportElementErrorTranslationFiles(PassportElementError):
 
     """
 
+    __slots__ = ('file_hashes',)
+
     def __init__(self,
                  type,
                  file_hashes,
@@ -343,6 +361,8 @@ class PassportElementErrorUnspecified(PassportElementError):
 
     """
 
+    __slots__ = ('element_hash',)
+
     def __init__(self,
                  type,
                  element_hash,
@@ -47,6 +47,9 @@ class PassportFile(TelegramObject):
 
     """
 
+    __slots__ = ('file_id', 'file_unique_id', 'file_size', 'file_date', 'bot', '_credentials',
+                 '_id_attrs')
+
     def __init__(self,
                  file_id,
                  file_unique_id,
@@ -43,6 +43,8 @@ class Invoice(TelegramObject):
 
     """
 
+    __slots__ = ('title', 'description', 'start_parameter', 'currency', 'total_amount')
+
     def __init__(self, title, description, start_parameter, currency, total_amount, **kwargs):
         self.title = title
         self.description = description
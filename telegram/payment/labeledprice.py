@@ -38,6 +38,8 @@ class LabeledPrice(TelegramObject):
 
     """
 
+    __slots__ = ('label', 'amount')
+
     def __init__(self, label, amount, **kwargs):
         self.label = label
         self.amount = amount
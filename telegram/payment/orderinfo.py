@@ -39,6 +39,8 @@ class OrderInfo(TelegramObject):
 
     """
 
+    __slots__ = ('name', 'phone_number', 'email', 'shipping_address')
+
     def __init__(self, name=None, phone_number=None, email=None, shipping_address=None, **kwargs):
         self.name = name
         self.phone_number = phone_number
@@ -55,6 +55,9 @@ class PreCheckoutQuery(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'from_user', 'currency', 'total_amount', 'invoice_payload',
+                 'shipping_option_id', 'order_info', 'bot', '_id_attrs')
+
     def __init__(self,
                  id,
                  from_user,
@@ -43,6 +43,9 @@ class ShippingAddress(TelegramObject):
 
     """
 
+    __slots__ = ('country_code', 'state', 'city', 'street_line1', 'street_line2', 'post_code',
+                 '_id_attrs')
+
     def __init__(self, country_code, state, city, street_line1, street_line2, post_code, **kwargs):
         self.country_code = country_code
         self.state = state
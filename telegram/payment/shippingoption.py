@@ -37,16 +37,13 @@ class ShippingOption(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'title', 'prices', '_id_attrs')
+
+    _FIELD_KINDS = {'prices': 'list'}
+
     def __init__(self, id, title, prices, **kwargs):
         self.id = id
         self.title = title
         self.prices = prices
 
         self._id_attrs = (self.id,)
-
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['prices'] = [p.to_dict() for p in self.prices]
-
-        return data
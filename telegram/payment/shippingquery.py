@@ -44,6 +44,8 @@ class ShippingQuery(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'from_user', 'invoice_payload', 'shipping_address', 'bot', '_id_attrs')
+
     def __init__(self, id, from_user, invoice_payload, shipping_address, bot=None, **kwargs):
         self.id = id
         self.from_user = from_user
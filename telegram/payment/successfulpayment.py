@@ -50,6 +50,9 @@ class SuccessfulPayment(TelegramObject):
 
     """
 
+    __slots__ = ('currency', 'total_amount', 'invoice_payload', 'shipping_option_id', 'order_info',
+                 'telegram_payment_charge_id', 'provider_payment_charge_id', '_id_attrs')
+
     def __init__(self,
                  currency,
                  total_amount,
@@ -22,7 +22,7 @@
 import sys
 
 from telegram import (TelegramObject, User, MessageEntity)
-from telegram.utils.helpers import to_timestamp, from_timestamp
+from telegram.utils.helpers import from_timestamp
 
 
 class PollOption(TelegramObject):
@@ -39,6 +39,8 @@ class PollOption(TelegramObject):
 
     """
 
+    __slots__ = ('text', 'voter_count')
+
     def __init__(self, text, voter_count, **kwargs):
         self.text = text
         self.voter_count = voter_count
@@ -67,6 +69,9 @@ class PollAnswer(TelegramObject):
             May be empty if the user retracted their vote.
 
     """
+
+    __slots__ = ('poll_id', 'user', 'option_ids')
+
     def __init__(self, poll_id, user, option_ids, **kwargs):
         self.poll_id = poll_id
         self.user = user
@@ -129,6 +134,12 @@ class Poll(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'question', 'options', 'total_voter_count', 'is_closed', 'is_anonymous',
+                 'type', 'allows_multiple_answers', 'correct_option_id', 'explanation',
+                 'explanation_entities', 'open_period', 'close_date', '_id_attrs')
+
+    _FIELD_KINDS = {'options': 'list', 'explanation_entities': 'list', 'close_date': 'timestamp'}
+
     def __init__(self,
                  id,
                  question,
@@ -173,16 +184,6 @@ class Poll(TelegramObject):
 
         return cls(**data)
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['options'] = [x.to_dict() for x in self.options]
-        if self.explanation_entities:
-            data['explanation_entities'] = [e.to_dict() for e in self.explanation_entities]
-        data['close_date'] = to_timestamp(data.get('close_date'))
-
-        return data
-
     def parse_explanation_entity(self, entity):
         """Returns the text from a given :class:`telegram.MessageEntity`.
 
@@ -59,6 +59,10 @@ class ReplyKeyboardMarkup(ReplyMarkup):
 
     """
 
+    __slots__ = ('keyboard', 'resize_keyboard', 'one_time_keyboard', 'selective')
+
+    _FIELD_KINDS = {'keyboard': 'lists'}
+
     def __init__(self,
                  keyboard,
                  resize_keyboard=False,
@@ -72,20 +76,6 @@ class ReplyKeyboardMarkup(ReplyMarkup):
         self.one_time_keyboard = bool(one_time_keyboard)
         self.selective = bool(selective)
 
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['keyboard'] = []
-        for row in self.keyboard:
-            r = []
-            for button in row:
-                if hasattr(button, 'to_dict'):
-                    r.append(button.to_dict())  # telegram.KeyboardButton
-                else:
-                    r.append(button)  # str
-            data['keyboard'].append(r)
-        return data
-
     @classmethod
     def from_button(cls,
                     button,
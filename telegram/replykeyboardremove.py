@@ -49,6 +49,8 @@ class ReplyKeyboardRemove(ReplyMarkup):
 
     """
 
+    __slots__ = ('remove_keyboard', 'selective')
+
     def __init__(self, selective=False, **kwargs):
         # Required
         self.remove_keyboard = True
@@ -19,6 +19,7 @@
 """Base class for Telegram ReplyMarkup Objects."""
 
 from telegram import TelegramObject
+from telegram.base import _freeze, _frozen_copy, _public_attributes
 
 
 class ReplyMarkup(TelegramObject):
@@ -28,4 +29,56 @@ class ReplyMarkup(TelegramObject):
     detailed use.
 
     """
-    pass
+
+    # The JSON of frozen reply markups, see frozen()
+    __slots__ = ('_json',)
+
+    @classmethod
+    def frozen(cls, *args, **kwargs):
+        """Creates a reply markup that can not be changed. Its JSON is computed once and sent as
+        is with every message, which saves serializing static keyboards over and over again.
+        Frozen reply markups compare equal and hash alike if they have the same content, so they
+        can be shared between threads and used as dictionary keys.
+
+        Lists of buttons are stored as tuples and the buttons are frozen copies of the ones
+        passed. Use :func:`copy.deepcopy` to get a reply markup that can be changed again.
+
+        Example:
+            .. code:: python
+
+                keyboard = InlineKeyboardMarkup.frozen([[
+                    InlineKeyboardButton('Yes', callback_data='yes'),
+                    InlineKeyboardButton('No', callback_data='no')
+                ]])
+
+        Args:
+            *args: Positional arguments of the reply markup class.
+            **kwargs (:obj:`dict`): Keyword arguments of the reply markup class.
+
+        Returns:
+            An instance of the class, that raises :class:`AttributeError` on attempts to change
+            it.
+
+        """
+        from telegram.utils.helpers import encode_json
+
+        markup = cls(*args, **kwargs)
+        for name in _public_attributes(cls):
+            try:
+                setattr(markup, name, _frozen_copy(getattr(markup, name)))
+            except AttributeError:
+                pass
+        markup._json = encode_json(markup.to_dict())
+        return _freeze(markup)
+
+    @property
+    def _id_attrs(self):
+        # Frozen reply markups are compared and hashed by their content
+        json = getattr(self, '_json', None)
+        return () if json is None else (json,)
+
+    def to_json(self):
+        json = getattr(self, '_json', None)
+        if json is None:
+            return super().to_json()
+        return json.decode('utf-8')
@@ -21,6 +21,29 @@
 from telegram import (Message, TelegramObject, InlineQuery, ChosenInlineResult,
                       CallbackQuery, ShippingQuery, PreCheckoutQuery, Poll)
 from telegram.poll import PollAnswer
+from telegram.utils.helpers import encode_json
+
+
+def _decoders(lazy):
+    """Returns the functions decoding the attributes of an update from its data and the bot.
+    Messages are decoded lazily as well, if ``lazy`` is passed."""
+    message = Message._de_json_lazy if lazy else Message.de_json
+    return {
+        'message': lambda data, bot: message(data.get('message'), bot),
+        'edited_message': lambda data, bot: message(data.get('edited_message'), bot),
+        'inline_query': lambda data, bot: InlineQuery.de_json(data.get('inline_query'), bot),
+        'chosen_inline_result': lambda data, bot: ChosenInlineResult.de_json(
+            data.get('chosen_inline_result'), bot),
+        'callback_query': lambda data, bot: CallbackQuery.de_json(
+            data.get('callback_query'), bot),
+        'shipping_query': lambda data, bot: ShippingQuery.de_json(data.get('shipping_query'), bot),
+        'pre_checkout_query': lambda data, bot: PreCheckoutQuery.de_json(
+            data.get('pre_checkout_query'), bot),
+        'channel_post': lambda data, bot: message(data.get('channel_post'), bot),
+        'edited_channel_post': lambda data, bot: message(data.get('edited_channel_post'), bot),
+        'poll': lambda data, bot: Poll.de_json(data.get('poll'), bot),
+        'poll_answer': lambda data, bot: PollAnswer.de_json(data.get('poll_answer'), bot),
+    }
 
 
 class Update(TelegramObject):
@@ -78,6 +101,12 @@ class Update(TelegramObject):
 
     """
 
+    __slots__ = ('update_id', 'message', 'edited_message', 'inline_query', 'chosen_inline_result',
+                 'callback_query', 'shipping_query', 'pre_checkout_query', 'channel_post',
+                 'edited_channel_post', 'poll', 'poll_answer', '_effective_user',
+                 '_effective_chat', '_effective_message', '_id_attrs', '_lazy', '_raw_data',
+                 '_raw_json')
+
     def __init__(self,
                  update_id,
                  message=None,
@@ -110,9 +139,36 @@ class Update(TelegramObject):
         self._effective_user = None
         self._effective_chat = None
         self._effective_message = None
+        self._raw_data = None
+        self._raw_json = None
 
         self._id_attrs = (self.update_id,)
 
+    @property
+    def raw_data(self):
+        """
+        :obj:`dict`: The data this update was decoded from, exactly as sent by Telegram, if the
+        bot has :attr:`telegram.Bot.keep_raw_updates` set. ``None`` otherwise.
+
+        """
+        return self._raw_data
+
+    @property
+    def raw_json(self):
+        """
+        :obj:`bytes`: The data this update was decoded from as UTF-8 encoded JSON, if the bot has
+        :attr:`telegram.Bot.keep_raw_updates` set. ``None`` otherwise. For updates received by
+        webhook, this is the request body as is. The updates returned by
+        :meth:`telegram.Bot.get_updates` share one response, so their :attr:`raw_data` is
+        encoded on each access.
+
+        """
+        if self._raw_json is not None:
+            return self._raw_json
+        if self._raw_data is not None:
+            return encode_json(self._raw_data)
+        return None
+
     @property
     def effective_user(self):
         """
@@ -223,34 +279,18 @@ class Update(TelegramObject):
         if not data:
             return None
 
-        data = super().de_json(data, bot)
-
-        message = data.get('message')
-        if message:
-            message['default_quote'] = data.get('default_quote')
-        data['message'] = Message.de_json(message, bot)
-        edited_message = data.get('edited_message')
-        if edited_message:
-            edited_message['default_quote'] = data.get('default_quote')
-        data['edited_message'] = Message.de_json(edited_message, bot)
-        data['inline_query'] = InlineQuery.de_json(data.get('inline_query'), bot)
-        data['chosen_inline_result'] = ChosenInlineResult.de_json(
-            data.get('chosen_inline_result'), bot)
-        callback_query = data.get('callback_query')
-        if callback_query:
-            callback_query['default_quote'] = data.get('default_quote')
-        data['callback_query'] = CallbackQuery.de_json(callback_query, bot)
-        data['shipping_query'] = ShippingQuery.de_json(data.get('shipping_query'), bot)
-        data['pre_checkout_query'] = PreCheckoutQuery.de_json(data.get('pre_checkout_query'), bot)
-        channel_post = data.get('channel_post')
-        if channel_post:
-            channel_post['default_quote'] = data.get('default_quote')
-        data['channel_post'] = Message.de_json(channel_post, bot)
-        edited_channel_post = data.get('edited_channel_post')
-        if edited_channel_post:
-            edited_channel_post['default_quote'] = data.get('default_quote')
-        data['edited_channel_post'] = Message.de_json(edited_channel_post, bot)
-        data['poll'] = Poll.de_json(data.get('poll'), bot)
-        data['poll_answer'] = PollAnswer.de_json(data.get('poll_answer'), bot)
-
-        return cls(**data)
+        if getattr(bot, 'lazy_updates', False):
+            update = cls._de_json_lazy(data, bot)
+        else:
+            kwargs = super().de_json(data, bot)
+            for name, decode in cls._DECODERS.items():
+                kwargs[name] = decode(data, bot)
+            update = cls(**kwargs)
+
+        if getattr(bot, 'keep_raw_updates', False):
+            update._raw_data = data
+        return update
+
+
+Update._DECODERS = _decoders(lazy=False)
+Update._LAZY_ATTRIBUTES = _decoders(lazy=True)
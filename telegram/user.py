@@ -59,6 +59,10 @@ class User(TelegramObject):
 
     """
 
+    __slots__ = ('id', 'first_name', 'is_bot', 'last_name', 'username', 'language_code',
+                 'can_join_groups', 'can_read_all_group_messages', 'supports_inline_queries',
+                 'bot', '_id_attrs')
+
     def __init__(self,
                  id,
                  first_name,
@@ -116,9 +120,20 @@ class User(TelegramObject):
     def de_json(cls, data, bot):
         if not data:
             return None
+
+        cache = getattr(bot, 'intern_cache', None)
+        if cache is not None:
+            user = cache.get(cls, data)
+            if user is not None:
+                return user
+            raw = data
+
         data = super().de_json(data, bot)
+        user = cls(bot=bot, **data)
 
-        return cls(bot=bot, **data)
+        if cache is not None:
+            cache.put(cls, raw, user)
+        return user
 
     def get_profile_photos(self, *args, **kwargs):
         """
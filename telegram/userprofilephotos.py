@@ -35,6 +35,10 @@ class UserProfilePhotos(TelegramObject):
 
     """
 
+    __slots__ = ('total_count', 'photos')
+
+    _FIELD_KINDS = {'photos': 'lists'}
+
     def __init__(self, total_count, photos, **kwargs):
         # Required
         self.total_count = int(total_count)
@@ -50,12 +54,3 @@ class UserProfilePhotos(TelegramObject):
         data['photos'] = [PhotoSize.de_list(photo, bot) for photo in data['photos']]
 
         return cls(**data)
-
-    def to_dict(self):
-        data = super().to_dict()
-
-        data['photos'] = []
-        for photo in self.photos:
-            data['photos'].append([x.to_dict() for x in photo])
-
-        return data
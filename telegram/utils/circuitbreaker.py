@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the CircuitBreaker class."""
+import logging
+import threading
+import time
+from collections import deque
+
+from telegram.error import NetworkError
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests while the Bot API is unreachable, so that callers fail fast instead of
+    blocking for the full read timeout on every call.
+
+    The outcomes of the last :attr:`window_size` requests are tracked. A request failed, if it
+    raised :class:`telegram.error.NetworkError` (including :class:`telegram.error.TimedOut`) or
+    got a 5xx response. Once at least :attr:`minimum_requests` requests were tracked and the
+    share of failures reaches :attr:`failure_threshold`, the breaker opens: for
+    :attr:`reset_timeout` seconds every request raises :class:`telegram.error.NetworkError`
+    without being sent. After that, the breaker is half-open and lets :attr:`trial_requests`
+    requests through. If they all succeed, the breaker closes again, if one of them fails, it
+    opens again.
+
+    State changes are logged with level ``WARNING`` and can be followed by passing a
+    ``listener``.
+
+    Example:
+        .. code:: python
+
+            updater = Updater(TOKEN, request_kwargs={'circuit_breaker': CircuitBreaker()})
+
+    Attributes:
+        CLOSED (:obj:`str`): ``'closed'``
+        OPEN (:obj:`str`): ``'open'``
+        HALF_OPEN (:obj:`str`): ``'half-open'``
+        failure_threshold (:obj:`float`): Share of failed requests the breaker opens at.
+        window_size (:obj:`int`): Number of recent requests considered.
+        minimum_requests (:obj:`int`): Number of requests needed before the breaker may open.
+        reset_timeout (:obj:`float`): Time in seconds the breaker stays open.
+        trial_requests (:obj:`int`): Number of requests let through while half-open.
+        rejected (:obj:`int`): Number of requests that failed fast since the breaker was created.
+        opened (:obj:`int`): How often the breaker opened since it was created.
+
+    Args:
+        failure_threshold (:obj:`float`, optional): Share of failed requests the breaker opens at.
+            Defaults to 0.5.
+        window_size (:obj:`int`, optional): Number of recent requests considered. Defaults to 20.
+        minimum_requests (:obj:`int`, optional): Number of requests needed before the breaker may
+            open. Defaults to 5.
+        reset_timeout (:obj:`float`, optional): Time in seconds the breaker stays open. Defaults
+            to 30.
+        trial_requests (:obj:`int`, optional): Number of requests let through while half-open.
+            Defaults to 1.
+        listener (:obj:`callable`, optional): Called with the old and the new state whenever the
+            state changes.
+
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=0.5, window_size=20, minimum_requests=5,
+                 reset_timeout=30., trial_requests=1, listener=None):
+        self.failure_threshold = failure_threshold
+        self.window_size = window_size
+        self.minimum_requests = minimum_requests
+        self.reset_timeout = reset_timeout
+        self.trial_requests = trial_requests
+        self.listener = listener
+        self.rejected = 0
+        self.opened = 0
+        self.logger = logging.getLogger(__name__)
+        self._state = self.CLOSED
+        self._outcomes = deque(maxlen=window_size)  # True for failed requests
+        self._failures = 0
+        self._opened_at = None
+        self._trials_left = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """:obj:`str`: The current state. An open breaker whose :attr:`reset_timeout` has passed is
+        reported as half-open."""
+        with self._lock:
+            if self._state == self.OPEN and self._reset_due():
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def failure_rate(self):
+        """:obj:`float`: The share of failed requests among the tracked ones."""
+        with self._lock:
+            return self._failures / len(self._outcomes) if self._outcomes else 0.
+
+    def _reset_due(self):
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def _transition(self, state):
+        """Changes the state, must be called with the lock held. Returns (old, new) for
+        _notify."""
+        old, self._state = self._state, state
+        self._outcomes.clear()
+        self._failures = 0
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+        elif state == self.HALF_OPEN:
+            self._trials_left = self.trial_requests
+            self._trial_successes = 0
+        return old, state
+
+    def _notify(self, change):
+        if change is None:
+            return
+        old, new = change
+        self.logger.warning('Circuit breaker changed from %s to %s', old, new)
+        if self.listener is not None:
+            self.listener(old, new)
+
+    def before_request(self):
+        """Called before a request is sent.
+
+        Raises:
+            :class:`telegram.error.NetworkError`: If the breaker is open, or half-open with all
+                trial requests under way.
+
+        """
+        change = None
+        with self._lock:
+            if self._state == self.OPEN:
+                if not self._reset_due():
+                    self.rejected += 1
+                    raise NetworkError('Circuit breaker is open, retry in {:.1f} seconds'.format(
+                        self.reset_timeout - time.monotonic() + self._opened_at))
+                change = self._transition(self.HALF_OPEN)
+            if self._state == self.HALF_OPEN:
+                if self._trials_left <= 0:
+                    self.rejected += 1
+                    raise NetworkError('Circuit breaker is half-open, waiting for trial requests')
+                self._trials_left -= 1
+        self._notify(change)
+
+    def record(self, failed):
+        """Called after a request was sent.
+
+        Args:
+            failed (:obj:`bool`): Whether the request failed.
+
+        """
+        change = None
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                if failed:
+                    change = self._transition(self.OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.trial_requests:
+                        change = self._transition(self.CLOSED)
+            elif self._state == self.CLOSED:
+                if len(self._outcomes) == self.window_size and self._outcomes[0]:
+                    self._failures -= 1
+                self._outcomes.append(failed)
+                self._failures += failed
+                if (failed and len(self._outcomes) >= self.minimum_requests
+                        and self._failures >= self.failure_threshold * len(self._outcomes)):
+                    change = self._transition(self.OPEN)
+            # While open, outcomes of requests sent before the breaker opened are ignored
+        self._notify(change)
+
+    def reset(self):
+        """Closes the breaker and forgets the tracked requests."""
+        with self._lock:
+            change = self._transition(self.CLOSED) if self._state != self.CLOSED else None
+            self._outcomes.clear()
+            self._failures = 0
+        self._notify(change)
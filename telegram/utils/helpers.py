@@ -19,6 +19,7 @@
 """This module contains helper functions."""
 
 import datetime as dtm  # dtm = "DateTime Module"
+import functools
 import re
 import signal
 import time
@@ -31,6 +32,11 @@ try:
 except ImportError:
     import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # From https://stackoverflow.com/questions/2549939/get-signal-names-from-numbers-in-python
 _signames = {v: k
@@ -43,6 +49,17 @@ def get_signal_name(signum):
     return _signames[signum]
 
 
+def _escape_pattern(escape_chars):
+    return re.compile('([{}])'.format(re.escape(escape_chars)))
+
+
+# Compiled once, as the patterns are used for every text segment of formatted messages
+_MARKDOWN_ESCAPE = _escape_pattern(r'_*`[')
+_MARKDOWN_V2_ESCAPE = _escape_pattern(r'_*[]()~`>#+-=|{}.!')
+_MARKDOWN_V2_CODE_ESCAPE = _escape_pattern(r'\`')
+_MARKDOWN_V2_TEXT_LINK_ESCAPE = _escape_pattern(r'\)')
+
+
 def escape_markdown(text, version=1, entity_type=None):
     """
     Helper function to escape telegram markup symbols.
@@ -57,18 +74,18 @@ def escape_markdown(text, version=1, entity_type=None):
             ``version=2``, will be ignored else.
     """
     if int(version) == 1:
-        escape_chars = r'_*`['
+        pattern = _MARKDOWN_ESCAPE
     elif int(version) == 2:
         if entity_type == 'pre' or entity_type == 'code':
-            escape_chars = r'\`'
+            pattern = _MARKDOWN_V2_CODE_ESCAPE
         elif entity_type == 'text_link':
-            escape_chars = r'\)'
+            pattern = _MARKDOWN_V2_TEXT_LINK_ESCAPE
         else:
-            escape_chars = r'_*[]()~`>#+-=|{}.!'
+            pattern = _MARKDOWN_V2_ESCAPE
     else:
         raise ValueError('Markdown version must be either 1 or 2!')
 
-    return re.sub('([{}])'.format(re.escape(escape_chars)), r'\\\1', text)
+    return pattern.sub(r'\\\1', text)
 
 
 # -------- date/time related helpers --------
@@ -164,6 +181,12 @@ def to_timestamp(dt_obj, reference_timestamp=None):
     return int(to_float_timestamp(dt_obj, reference_timestamp)) if dt_obj is not None else None
 
 
+@functools.lru_cache(maxsize=1024)
+def _utc_from_timestamp(unixtime):
+    # Datetimes are immutable, so they can be shared by all messages sent in the same second
+    return dtm.datetime.fromtimestamp(unixtime, tz=dtm.timezone.utc)
+
+
 def from_timestamp(unixtime, tzinfo=dtm.timezone.utc):
     """
     Converts an (integer) unix timestamp to a timezone aware datetime object.
@@ -181,6 +204,8 @@ def from_timestamp(unixtime, tzinfo=dtm.timezone.utc):
     if unixtime is None:
         return None
 
+    if tzinfo is dtm.timezone.utc and unixtime.__class__ is int:
+        return _utc_from_timestamp(unixtime)
     if tzinfo is not None:
         return dtm.datetime.fromtimestamp(unixtime, tz=tzinfo)
     else:
@@ -297,6 +322,49 @@ def create_deep_linked_url(bot_username, payload=None, group=False):
     )
 
 
+def decode_json(data):
+    """Parses a JSON document directly from :obj:`bytes`, without decoding it to a :obj:`str`
+    first. Uses ``orjson``, if installed, and falls back to ``ujson`` or :mod:`json`.
+
+    Note:
+        ``orjson`` parses integers that don't fit into 64 bit as :obj:`float`. All identifiers
+        used by the Bot API are well within that range.
+
+    Args:
+        data (:obj:`bytes` | :obj:`str`): The UTF-8 encoded JSON document.
+
+    Returns:
+        The parsed object.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_json(obj):
+    """Serializes an object to UTF-8 encoded JSON. Uses ``orjson``, if installed, and falls back
+    to ``ujson`` or :mod:`json`.
+
+    Args:
+        obj: A JSON serializable object.
+
+    Returns:
+        :obj:`bytes`: The UTF-8 encoded JSON document.
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers above 64 bit or non-string keys, which orjson doesn't support
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
 def encode_conversations_to_json(conversations):
     """Helper method to encode a conversations dict (that uses tuples as keys) to a
     JSON-serializable way. Use :attr:`_decode_conversations_from_json` to decode.
@@ -408,6 +476,9 @@ class DefaultValue:
     def __bool__(self):
         return bool(self.value)
 
+    def __repr__(self):
+        return repr(self.value)
+
 
 DEFAULT_NONE = DefaultValue(None)
 """:class:`DefaultValue`: Default `None`"""
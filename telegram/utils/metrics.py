@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the RequestMetrics class."""
+import bisect
+import threading
+import time
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+PHASES = ('connect', 'ttfb', 'total')
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1., 2.5, 5., 10., 30., 60.)
+
+
+class Histogram:
+    """A latency histogram with fixed buckets. Not thread safe on its own.
+
+    Attributes:
+        buckets (Tuple[:obj:`float`]): The upper bounds of the buckets.
+        counts (List[:obj:`int`]): The number of observations per bucket, the last entry counts
+            the observations above the largest bound.
+        count (:obj:`int`): The number of observations.
+        sum (:obj:`float`): The sum of the observations.
+
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """List[(:obj:`float`, :obj:`int`)]: Pairs of upper bound and number of observations
+        less than or equal to it, ending with ``float('inf')``."""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class _MethodMetrics:
+    __slots__ = ('requests', 'errors', 'histograms')
+
+    def __init__(self, buckets):
+        self.requests = 0
+        self.errors = {}
+        self.histograms = {phase: Histogram(buckets) for phase in PHASES}
+
+
+class RequestMetrics:
+    """
+    Collects client side metrics of the requests made by a :class:`telegram.utils.request.Request`.
+
+    For every Bot API method, the number of requests, the errors by exception class and latency
+    histograms of three phases are recorded:
+
+    * ``connect``: establishing a new connection (including the TLS handshake). Only observed for
+      requests that had to open a connection.
+    * ``ttfb``: time until the response headers were received.
+    * ``total``: time until the response was read completely.
+
+    In addition, the connection pool is monitored: the number of connections in use, the number of
+    requests that found no free connection in the pool (and thus had to open an additional one)
+    and the number of connections opened.
+
+    Example:
+        .. code:: python
+
+            metrics = RequestMetrics()
+            bot = Bot(TOKEN, request=Request(con_pool_size=8, metrics=metrics))
+            metrics.start_http_server(9100)  # Prometheus can scrape http://host:9100/metrics
+
+    Note:
+        File downloads are recorded as method ``download``.
+
+    Attributes:
+        buckets (Tuple[:obj:`float`]): The upper bounds of the histogram buckets in seconds.
+        connections_in_use (:obj:`int`): The number of connections currently in use.
+        pool_exhausted (:obj:`int`): The number of requests that found no free connection.
+        connections_opened (:obj:`int`): The number of connections opened.
+
+    Args:
+        buckets (Tuple[:obj:`float`], optional): The upper bounds of the histogram buckets in
+            seconds.
+
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.connections_in_use = 0
+        self.pool_exhausted = 0
+        self.connections_opened = 0
+        self._methods = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def connection_acquired(self, exhausted):
+        """Called by the connection pool when a request takes a connection.
+
+        Args:
+            exhausted (:obj:`bool`): Whether no free connection was available.
+
+        """
+        with self._lock:
+            self.connections_in_use += 1
+            if exhausted:
+                self.pool_exhausted += 1
+
+    def connection_released(self):
+        """Called by the connection pool when a request returns its connection."""
+        with self._lock:
+            self.connections_in_use -= 1
+
+    def connection_opened(self, duration):
+        """Called when the current thread opened a new connection.
+
+        Args:
+            duration (:obj:`float`): The time the connection took to establish in seconds.
+
+        """
+        self._local.connect = duration
+        with self._lock:
+            self.connections_opened += 1
+
+    def start(self):
+        """Starts timing a request in the current thread.
+
+        Returns:
+            :obj:`float`: The start time to pass to :meth:`observe`.
+
+        """
+        self._local.connect = None
+        return time.perf_counter()
+
+    def observe(self, method, start, ttfb=None, error=None):
+        """Records a finished request made by the current thread.
+
+        Args:
+            method (:obj:`str`): The Bot API method.
+            start (:obj:`float`): The return value of :meth:`start`.
+            ttfb (:obj:`float`, optional): The time stamp the response headers were received at.
+            error (:obj:`Exception`, optional): The exception the request failed with.
+
+        """
+        end = time.perf_counter()
+        connect = getattr(self._local, 'connect', None)
+        with self._lock:
+            metrics = self._methods.get(method)
+            if metrics is None:
+                metrics = self._methods[method] = _MethodMetrics(self.buckets)
+            metrics.requests += 1
+            if error is not None:
+                name = type(error).__name__
+                metrics.errors[name] = metrics.errors.get(name, 0) + 1
+            if connect is not None:
+                metrics.histograms['connect'].observe(connect)
+            if ttfb is not None:
+                metrics.histograms['ttfb'].observe(ttfb - start)
+            metrics.histograms['total'].observe(end - start)
+
+    def snapshot(self):
+        """Returns a consistent copy of all metrics.
+
+        Returns:
+            :obj:`dict`: With the keys ``methods`` (a dict mapping each method to a dict with
+            ``requests``, ``errors`` and one histogram per phase, given as dict with ``count``,
+            ``sum`` and the cumulative ``buckets``) and ``pool`` (a dict with
+            ``connections_in_use``, ``pool_exhausted`` and ``connections_opened``).
+
+        """
+        with self._lock:
+            methods = {}
+            for method, metrics in self._methods.items():
+                methods[method] = {
+                    'requests': metrics.requests,
+                    'errors': dict(metrics.errors)
+                }
+                for phase, histogram in metrics.histograms.items():
+                    methods[method][phase] = {'count': histogram.count,
+                                              'sum': histogram.sum,
+                                              'buckets': histogram.cumulative()}
+            return {
+                'methods': methods,
+                'pool': {'connections_in_use': self.connections_in_use,
+                         'pool_exhausted': self.pool_exhausted,
+                         'connections_opened': self.connections_opened}
+            }
+
+    def reset(self):
+        """Resets the per method metrics and the pool counters."""
+        with self._lock:
+            self._methods.clear()
+            self.pool_exhausted = 0
+            self.connections_opened = 0
+
+    def to_prometheus(self, prefix='telegram'):
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (:obj:`str`, optional): Prefix of the metric names. Defaults to
+                ``'telegram'``.
+
+        Returns:
+            :obj:`str`
+
+        """
+        snapshot = self.snapshot()
+        methods = sorted(snapshot['methods'].items())
+        lines = []
+
+        def header(name, kind, text):
+            lines.append('# HELP {}_{} {}'.format(prefix, name, text))
+            lines.append('# TYPE {}_{} {}'.format(prefix, name, kind))
+
+        header('requests_total', 'counter', 'Requests per Bot API method.')
+        for method, metrics in methods:
+            lines.append('{}_requests_total{{method="{}"}} {}'.format(prefix, method,
+                                                                      metrics['requests']))
+
+        header('request_errors_total', 'counter', 'Failed requests per method and error.')
+        for method, metrics in methods:
+            for error, count in sorted(metrics['errors'].items()):
+                lines.append('{}_request_errors_total{{method="{}",error="{}"}} {}'.format(
+                    prefix, method, error, count))
+
+        header('request_duration_seconds', 'histogram', 'Request latency per method and phase.')
+        for method, metrics in methods:
+            for phase in PHASES:
+                histogram = metrics[phase]
+                labels = 'method="{}",phase="{}"'.format(method, phase)
+                for bound, count in histogram['buckets']:
+                    lines.append('{}_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(
+                        prefix, labels, '+Inf' if bound == float('inf') else repr(bound), count))
+                lines.append('{}_request_duration_seconds_sum{{{}}} {}'.format(
+                    prefix, labels, repr(histogram['sum'])))
+                lines.append('{}_request_duration_seconds_count{{{}}} {}'.format(
+                    prefix, labels, histogram['count']))
+
+        pool = snapshot['pool']
+        header('pool_connections_in_use', 'gauge', 'Connections currently in use.')
+        lines.append('{}_pool_connections_in_use {}'.format(prefix, pool['connections_in_use']))
+        header('pool_exhausted_total', 'counter', 'Requests that found no free connection.')
+        lines.append('{}_pool_exhausted_total {}'.format(prefix, pool['pool_exhausted']))
+        header('pool_connections_opened_total', 'counter', 'Connections opened.')
+        lines.append('{}_pool_connections_opened_total {}'.format(prefix,
+                                                                  pool['connections_opened']))
+        return '\n'.join(lines) + '\n'
+
+    def start_http_server(self, port, address=''):
+        """Serves :meth:`to_prometheus` at ``/metrics`` in a daemon thread.
+
+        Args:
+            port (:obj:`int`): The port to listen on. Pass 0 to pick a free port.
+            address (:obj:`str`, optional): The address to listen on. Defaults to all interfaces.
+
+        Returns:
+            :class:`http.server.HTTPServer`: The server. Call its ``shutdown`` method to stop it.
+
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        server = Server((address, port), Handler)
+        thread = threading.Thread(target=server.serve_forever, name='RequestMetrics:server')
+        thread.daemon = True
+        thread.start()
+        return server
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the PreparedRequest class."""
+import inspect
+
+from telegram import InputFile, InputMedia, ReplyMarkup, TelegramObject
+from telegram.utils.helpers import encode_json
+
+
+class _Placeholder:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _NoRequest:
+    def __getattr__(self, name):
+        raise ValueError('Only methods sending or editing messages can be prepared')
+
+
+class _Captured(Exception):
+    def __init__(self, url, data, timeout):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.timeout = timeout
+
+
+def _convert(value):
+    # Like Request.post does it for JSON requests
+    if isinstance(value, (float, int)):
+        return str(value)
+    if isinstance(value, ReplyMarkup):
+        return value.to_json()
+    if isinstance(value, TelegramObject):
+        return value.to_dict()
+    return value
+
+
+class PreparedRequest:
+    """
+    A request to a bot method that sends or edits a message, whose static arguments are validated
+    and JSON encoded once. Use :meth:`telegram.Bot.prepare` to create one.
+
+    The arguments of the bot method that are required but were not passed to
+    :meth:`telegram.Bot.prepare` are the dynamic arguments, which have to be passed to
+    :meth:`send`. Only these are encoded on each call and merged into the prepared body.
+
+    Example:
+        .. code:: python
+
+            welcome = bot.prepare('send_message', text='Welcome!', reply_markup=keyboard)
+
+            def start(update, context):
+                welcome.send(chat_id=update.effective_chat.id)
+
+    Note:
+        :class:`telegram.ext.Defaults` are applied when the request is prepared. Requests that
+        upload files can not be prepared.
+
+    Attributes:
+        bot (:class:`telegram.Bot`): The bot sending the request.
+        method (:obj:`str`): The name of the bot method.
+        dynamic_arguments (Tuple[:obj:`str`]): The names of the arguments :meth:`send` expects.
+
+    Args:
+        bot (:class:`telegram.Bot`): The bot sending the request.
+        method (:obj:`str`): The name of the bot method, e.g. ``'send_message'``.
+        static_kwargs (:obj:`dict`): The arguments that are the same for every call.
+
+    Raises:
+        TypeError: If ``static_kwargs`` contains an argument the method does not take.
+        ValueError: If the method does not send or edit a message or uploads files.
+
+    """
+
+    def __init__(self, bot, method, static_kwargs):
+        func = getattr(type(bot), method, None)
+        if not callable(func) or method.startswith('_'):
+            raise ValueError('Bot has no method {}'.format(method))
+        self.bot = bot
+        self.method = func.__name__
+        self._static_kwargs = static_kwargs
+
+        parameters = inspect.signature(func).parameters
+        for name in static_kwargs:
+            if (name not in parameters or name == 'self'
+                    or parameters[name].kind == inspect.Parameter.VAR_KEYWORD):
+                raise TypeError('{}() got an unexpected keyword argument {!r}'.format(
+                    self.method, name))
+        placeholders = {
+            name: _Placeholder(name) for name, parameter in parameters.items()
+            if name != 'self' and name not in static_kwargs
+            and parameter.default is inspect.Parameter.empty
+            and parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                   inspect.Parameter.KEYWORD_ONLY)
+        }
+
+        captured = self._capture(func, dict(static_kwargs, **placeholders))
+        self.url = captured.url
+        self._timeout = captured.timeout
+        self._keys = {}  # dynamic argument -> key in the request data
+        static = {}
+        for key, value in captured.data.items():
+            if isinstance(value, _Placeholder):
+                self._keys[value.name] = key
+            elif isinstance(value, (InputFile, InputMedia)):
+                raise ValueError('Requests uploading files can not be prepared')
+            else:
+                static[key] = _convert(value)
+        if len(self._keys) != len(placeholders):
+            raise ValueError('{} can not be prepared without {}'.format(
+                self.method, ', '.join(sorted(set(placeholders) - set(self._keys)))))
+        self.dynamic_arguments = tuple(self._keys)
+        self._static_chat_id = static_kwargs.get('chat_id')
+        self._static_body = encode_json(static)[1:-1]
+
+    def _capture(self, func, kwargs):
+        """Runs the bot method on a copy of the bot that raises _Captured instead of sending the
+        request."""
+        bot = self.bot
+        clone = object.__new__(type(bot))
+        clone.__dict__.update(bot.__dict__)
+        via_message = []
+
+        def message(*args, **kwargs):
+            via_message.append(True)
+            return type(bot)._message(clone, *args, **kwargs)
+
+        def upload(url, data, timeout=None):
+            raise _Captured(url, data, timeout)
+
+        clone._message = message
+        clone._upload = upload
+        # Other methods must fail without sending anything
+        clone._request = _NoRequest()
+        try:
+            func(clone, **kwargs)
+        except _Captured as captured:
+            if not via_message:
+                raise ValueError('Only methods sending or editing messages can be prepared')
+            return captured
+        raise ValueError('Only methods sending or editing messages can be prepared')
+
+    def send(self, timeout=None, **kwargs):
+        """Sends the request.
+
+        Args:
+            timeout (:obj:`int` | :obj:`float`, optional): If this value is specified, use it as
+                the read timeout from the server (instead of the one the request was prepared
+                with).
+            **kwargs (:obj:`dict`): The dynamic arguments, see :attr:`dynamic_arguments`. Other
+                arguments of the bot method can be passed as well, but then the request is built
+                from scratch by calling the bot method.
+
+        Returns:
+            :class:`telegram.Message` | :obj:`bool`: The return value of the bot method.
+
+        Raises:
+            :class:`telegram.TelegramError`
+
+        """
+        if kwargs.keys() != self._keys.keys():
+            if timeout is not None:
+                kwargs['timeout'] = timeout
+            return getattr(self.bot, self.method)(**dict(self._static_kwargs, **kwargs))
+
+        fields = encode_json({self._keys[name]: _convert(value)
+                              for name, value in kwargs.items()})[1:-1]
+        body = b'{' + b','.join(part for part in (fields, self._static_body) if part) + b'}'
+        result = self.bot._post_json(self.url, body,
+                                     timeout=self._timeout if timeout is None else timeout,
+                                     chat_id=kwargs.get('chat_id', self._static_chat_id))
+        return self.bot._message_result(result)
@@ -19,7 +19,8 @@
 """This module contains the Promise class."""
 
 import logging
-from threading import Event
+import time
+from threading import Event, Lock
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,13 @@ logger = logging.getLogger(__name__)
 class Promise:
     """A simple Promise implementation for use with the run_async decorator, DelayQueue etc.
 
+    Promises can be composed with :meth:`then` and waited for together with :meth:`gather`::
+
+        sent = bot.send_message(chat_id, 'Hi', block=False)
+        answered = bot.answer_callback_query(query_id, block=False)
+        message_id = sent.then(lambda message: message.message_id)
+        Promise.gather(answered, message_id)
+
     Args:
         pooled_function (:obj:`callable`): The callable that will be called concurrently.
         args (:obj:`list` | :obj:`tuple`): Positional arguments for :attr:`pooled_function`.
@@ -48,6 +56,8 @@ class Promise:
         self.done = Event()
         self._result = None
         self._exception = None
+        self._callbacks = []
+        self._lock = Lock()
 
     def run(self):
         """Calls the :attr:`pooled_function` callable."""
@@ -60,7 +70,72 @@ class Promise:
             self._exception = exc
 
         finally:
-            self.done.set()
+            with self._lock:
+                self.done.set()
+                callbacks, self._callbacks = self._callbacks, []
+            for callback in callbacks:
+                self._run_callback(callback)
+
+    def _run_callback(self, callback):
+        try:
+            callback(self)
+        except Exception:
+            logger.exception('An uncaught error was raised while running a promise callback')
+
+    def add_done_callback(self, callback):
+        """Calls ``callback`` with this ``Promise`` as only argument once it is done. If the
+        ``Promise`` is already done, ``callback`` is called immediately.
+
+        Args:
+            callback (:obj:`callable`): The callback. It runs in the thread that ran the
+                ``Promise`` and should thus return quickly.
+
+        """
+        with self._lock:
+            if not self.done.is_set():
+                self._callbacks.append(callback)
+                return
+        self._run_callback(callback)
+
+    def then(self, callback):
+        """Chains a callable to this ``Promise``.
+
+        Args:
+            callback (:obj:`callable`): Called with the result of this ``Promise`` once it is
+                available. It runs in the thread that ran this ``Promise``.
+
+        Returns:
+            :class:`telegram.utils.promise.Promise`: Resolves to the return value of
+            ``callback``. If this ``Promise`` or ``callback`` raise an exception, it is raised by
+            the new ``Promise`` instead.
+
+        """
+        promise = Promise(lambda: callback(self.result()), (), {})
+        self.add_done_callback(lambda _: promise.run())
+        return promise
+
+    @staticmethod
+    def gather(*promises, timeout=None):
+        """Waits for several promises at once.
+
+        Args:
+            *promises (:class:`telegram.utils.promise.Promise`): The promises to wait for.
+            timeout (:obj:`float`, optional): Maximum time in seconds to wait for all results.
+                ``None`` means indefinite. Default is ``None``.
+
+        Returns:
+            List: The results of the promises in the order they were passed. Results of promises
+            that are not done after ``timeout`` are ``None``.
+
+        Raises:
+            The exception of the first promise (in the order they were passed) that raised one.
+
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for promise in promises:
+            promise.done.wait(None if deadline is None
+                              else max(0, deadline - time.perf_counter()))
+        return [promise.result(timeout=0) for promise in promises]
 
     def __call__(self):
         self.run()
@@ -19,9 +19,14 @@
 """This module contains methods to make POST and GET requests."""
 import logging
 import os
+import queue
 import socket
+import ssl
 import sys
+import threading
+import time
 import warnings
+from collections import OrderedDict
 
 try:
     import ujson as json
@@ -34,15 +39,20 @@ try:
     import telegram.vendor.ptb_urllib3.urllib3 as urllib3
     import telegram.vendor.ptb_urllib3.urllib3.contrib.appengine as appengine
     from telegram.vendor.ptb_urllib3.urllib3.connection import HTTPConnection
+    from telegram.vendor.ptb_urllib3.urllib3.util.connection import create_connection
     from telegram.vendor.ptb_urllib3.urllib3.util.timeout import Timeout
     from telegram.vendor.ptb_urllib3.urllib3.fields import RequestField
+    from telegram.vendor.ptb_urllib3.urllib3.exceptions import (ConnectTimeoutError,
+                                                                NewConnectionError)
 except ImportError:  # pragma: no cover
     try:
         import urllib3
         import urllib3.contrib.appengine as appengine
         from urllib3.connection import HTTPConnection
+        from urllib3.util.connection import create_connection
         from urllib3.util.timeout import Timeout
         from urllib3.fields import RequestField
+        from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
         warnings.warn('python-telegram-bot is using upstream urllib3. This is allowed but not '
                       'supported by python-telegram-bot maintainers.')
     except ImportError:
@@ -52,9 +62,10 @@ except ImportError:  # pragma: no cover
         raise
 
 
-from telegram import (InputFile, TelegramError, InputMedia)
+from telegram import (InputFile, TelegramError, InputMedia, ReplyMarkup)
 from telegram.error import (Unauthorized, NetworkError, TimedOut, BadRequest, ChatMigrated,
                             RetryAfter, InvalidToken, Conflict)
+from telegram.utils.helpers import decode_json, encode_json
 
 
 def _render_part(self, name, value):
@@ -72,6 +83,129 @@ RequestField._render_part = _render_part
 
 logging.getLogger('urllib3').setLevel(logging.WARNING)
 
+
+class _DNSCache:
+    """Caches the addresses of hosts for ttl seconds. If resolving fails, expired addresses are
+    used for another ttl seconds."""
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host, port):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        try:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            if entry is None:
+                return []
+            addresses = entry[1]
+        else:
+            addresses = list(OrderedDict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host, port):
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+class _ResumingSSLContext(ssl.SSLContext):
+    """Resumes the last TLS session of a host when connecting to it again."""
+
+    def __init__(self, protocol=None):  # pylint: disable=W0613
+        super().__init__()
+        self.sessions = {}
+
+    def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+        if session is None and server_hostname is not None:
+            session = self.sessions.get(server_hostname)
+        return super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session,
+                                   **kwargs)
+
+
+def _tuned_pool_class(pool_class, dns_cache, ssl_context):
+    """Derives a connection pool class that resolves hosts through a _DNSCache and remembers
+    TLS sessions in a _ResumingSSLContext. Both may be None. The connections put back into the
+    pool are stamped with the time in ``idle_since``."""
+
+    class TunedConnection(pool_class.ConnectionCls):
+        def _new_conn(self):
+            # Like urllib3 does it, but connects to the cached addresses. self.host stays the host
+            # name, as it's used for SNI and the certificate check
+            addresses = dns_cache.resolve(self.host, self.port) if dns_cache is not None else None
+            if not addresses:
+                return super()._new_conn()
+            extra_kw = {}
+            if self.source_address:
+                extra_kw['source_address'] = self.source_address
+            if self.socket_options:
+                extra_kw['socket_options'] = self.socket_options
+            error = None
+            for address in addresses:
+                try:
+                    return create_connection((address, self.port), self.timeout, **extra_kw)
+                except socket.timeout:
+                    error = ConnectTimeoutError(
+                        self, 'Connection to {} timed out. (connect timeout={})'.format(
+                            self.host, self.timeout))
+                except OSError as exc:
+                    error = NewConnectionError(
+                        self, 'Failed to establish a new connection: {}'.format(exc))
+            dns_cache.invalidate(self.host, self.port)
+            raise error
+
+    class TunedPool(pool_class):
+        ConnectionCls = TunedConnection
+
+        def _put_conn(self, conn):
+            # With TLS 1.3 the session is only available after data was received
+            session = getattr(getattr(conn, 'sock', None), 'session', None)
+            if ssl_context is not None and session is not None:
+                ssl_context.sessions[self.host] = session
+            if conn is not None:
+                conn.idle_since = time.monotonic()
+            super()._put_conn(conn)
+
+    TunedPool.__name__ = pool_class.__name__
+    return TunedPool
+
+
+def _measured_pool_class(pool_class, metrics):
+    """Derives a connection pool class that reports to a RequestMetrics object."""
+
+    class MeasuredConnection(pool_class.ConnectionCls):
+        def connect(self):
+            start = time.perf_counter()
+            super().connect()
+            metrics.connection_opened(time.perf_counter() - start)
+
+    class MeasuredPool(pool_class):
+        ConnectionCls = MeasuredConnection
+
+        def _get_conn(self, timeout=None):
+            pool = self.pool
+            metrics.connection_acquired(pool is not None and pool.empty())
+            try:
+                return super()._get_conn(timeout=timeout)
+            except Exception:
+                metrics.connection_released()
+                raise
+
+        def _put_conn(self, conn):
+            metrics.connection_released()
+            super()._put_conn(conn)
+
+    MeasuredPool.__name__ = pool_class.__name__
+    return MeasuredPool
+
+
 USER_AGENT = 'Python Telegram Bot (https://github.com/python-telegram-bot/python-telegram-bot)'
 
 
@@ -92,6 +226,31 @@ class Request:
             consecutive read operations for a response from the server. None will set an infinite
             timeout. This value is usually overridden by the various ``telegram.Bot`` methods.
             (default: 5.)
+        metrics (:class:`telegram.utils.metrics.RequestMetrics`): Optional. Collects per method
+            latencies and errors and connection pool statistics. (default: None)
+        circuit_breaker (:class:`telegram.utils.circuitbreaker.CircuitBreaker`): Optional. Makes
+            requests fail fast with :class:`telegram.error.NetworkError` while the Bot API is
+            unreachable. (default: None)
+        bulkheads (dict[str, int]): Optional. Limits the number of concurrent requests per kind,
+            so that e.g. many file downloads can't hold up the replies of a bot. Maps the kinds
+            ``'updates'`` (``getUpdates``), ``'files'`` (file downloads and uploads) and
+            ``'send'`` (all other requests) to their maximum number of concurrent requests.
+            Kinds that are not given are not limited. A request that doesn't get a slot within
+            ``connect_timeout`` seconds raises :class:`telegram.error.NetworkError`.
+            (default: None)
+        prewarm_connections (int): Number of connections :class:`telegram.Bot` opens right after
+            its creation, so that the first requests don't wait for the TCP and TLS handshakes.
+            At most ``con_pool_size``. (default: 0)
+        dns_cache_ttl (int|float): Optional. If set, host names are resolved once per
+            ``dns_cache_ttl`` seconds. If resolving fails, the last known addresses are used.
+            Not used with proxies. (default: None)
+        keepalive_interval (int|float): Optional. If set, pooled connections are kept alive by
+            sending a cheap ``HEAD`` request on them once they have been idle for about
+            ``keepalive_interval`` seconds. Should be lower than the idle timeout of the server.
+            (default: None)
+        tls_session_resumption (bool): If :obj:`True`, new connections resume the TLS session
+            of an earlier connection to the same host, which saves a round trip and the key
+            exchange. Not used with proxies. (default: False)
 
     """
 
@@ -100,11 +259,22 @@ class Request:
                  proxy_url=None,
                  urllib3_proxy_kwargs=None,
                  connect_timeout=5.,
-                 read_timeout=5.):
+                 read_timeout=5.,
+                 metrics=None,
+                 circuit_breaker=None,
+                 bulkheads=None,
+                 prewarm_connections=0,
+                 dns_cache_ttl=None,
+                 keepalive_interval=None,
+                 tls_session_resumption=False):
         if urllib3_proxy_kwargs is None:
             urllib3_proxy_kwargs = dict()
 
         self._connect_timeout = connect_timeout
+        self.metrics = metrics
+        self.circuit_breaker = circuit_breaker
+        self._bulkheads = {kind: threading.BoundedSemaphore(size)
+                           for kind, size in (bulkheads or {}).items()}
 
         sockopts = HTTPConnection.default_socket_options + [
             (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
@@ -119,6 +289,8 @@ class Request:
                              socket.TCP_KEEPCNT, 8))  # pylint: disable=no-member
 
         self._con_pool_size = con_pool_size
+        self.prewarm_connections = min(prewarm_connections, con_pool_size)
+        self.keepalive_interval = keepalive_interval
 
         kwargs = dict(
             maxsize=con_pool_size,
@@ -137,11 +309,19 @@ class Request:
         if not proxy_url:
             proxy_url = os.environ.get('HTTPS_PROXY') or os.environ.get('https_proxy')
 
+        dns_cache = ssl_context = None
         if not proxy_url:
             if appengine.is_appengine_sandbox():
                 # Use URLFetch service if running in App Engine
                 mgr = appengine.AppEngineManager()
             else:
+                if tls_session_resumption:
+                    ssl_context = _ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                    # Load the certificates once instead of on every connect
+                    ssl_context.load_verify_locations(kwargs.pop('ca_certs'))
+                    kwargs['ssl_context'] = ssl_context
+                if dns_cache_ttl:
+                    dns_cache = _DNSCache(dns_cache_ttl)
                 mgr = urllib3.PoolManager(**kwargs)
         else:
             kwargs.update(urllib3_proxy_kwargs)
@@ -158,16 +338,110 @@ class Request:
                     auth_hdrs = urllib3.make_headers(proxy_basic_auth=mgr.proxy.auth)
                     mgr.proxy_headers.update(auth_hdrs)
 
+        if ((dns_cache is not None or ssl_context is not None or keepalive_interval)
+                and hasattr(mgr, 'pool_classes_by_scheme')):
+            mgr.pool_classes_by_scheme = {
+                scheme: _tuned_pool_class(pool_class, dns_cache, ssl_context)
+                for scheme, pool_class in mgr.pool_classes_by_scheme.items()
+            }
+
+        if metrics is not None and hasattr(mgr, 'pool_classes_by_scheme'):
+            mgr.pool_classes_by_scheme = {
+                scheme: _measured_pool_class(pool_class, metrics)
+                for scheme, pool_class in mgr.pool_classes_by_scheme.items()
+            }
+
         self._con_pool = mgr
 
+        self._stopped = threading.Event()
+        if keepalive_interval:
+            thread = threading.Thread(target=self._keep_alive, name='Request:keepalive')
+            thread.daemon = True
+            thread.start()
+
     @property
     def con_pool_size(self):
         """The size of the connection pool used."""
         return self._con_pool_size
 
     def stop(self):
+        self._stopped.set()
         self._con_pool.clear()
 
+    def warm_up(self, url, connections=None):
+        """Opens connections to the host of an URL and puts them into the connection pool.
+        Connections that are already open are kept. Errors are logged and otherwise ignored.
+
+        Args:
+            url (:obj:`str`): An URL on the host to connect to.
+            connections (:obj:`int`, optional): Number of connections to open. Defaults to
+                :attr:`prewarm_connections`. At most ``con_pool_size``.
+
+        """
+        if not hasattr(self._con_pool, 'connection_from_url'):
+            return
+        if connections is None:
+            connections = self.prewarm_connections
+        pool = self._con_pool.connection_from_url(url)
+        # Take all connections at once, otherwise the same one would be handed out again
+        conns = [pool._get_conn() for _ in range(min(connections, self._con_pool_size))]
+        try:
+            for conn in conns:
+                if conn.sock is None:
+                    conn.connect()
+        except Exception as exc:
+            logging.getLogger(__name__).debug('Could not warm up connections to %s: %s',
+                                              pool.host, exc)
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+
+    def _keep_alive(self):
+        # Connections are probed at most a tenth of the interval before they are due
+        while not self._stopped.wait(self.keepalive_interval / 10):
+            pools = getattr(self._con_pool, 'pools', None)
+            for key in pools.keys() if pools is not None else ():
+                pool = pools.get(key)
+                if pool is not None:
+                    self._probe(pool)
+
+    def _probe(self, pool):
+        """Sends a HEAD request on each connection of the pool that has been idle for at least
+        nine tenths of :attr:`keepalive_interval`. The connections are taken out of the pool one
+        at a time, so that requests can use the others meanwhile."""
+        conns = pool.pool
+        if conns is None:
+            # The pool was closed
+            return
+        idle_before = time.monotonic() - 0.9 * self.keepalive_interval
+        with conns.mutex:
+            due = [conn for conn in conns.queue
+                   if conn is not None and conn.sock is not None
+                   and getattr(conn, 'idle_since', idle_before) <= idle_before]
+        for conn in due:
+            with conns.mutex:
+                try:
+                    conns.queue.remove(conn)
+                except ValueError:
+                    # A request took it meanwhile
+                    continue
+                conns.not_full.notify()
+            try:
+                conn.sock.settimeout(self._connect_timeout)
+                conn.request('HEAD', '/', headers={'connection': 'keep-alive',
+                                                   'user-agent': USER_AGENT})
+                conn.getresponse().read()
+            except Exception:  # pylint: disable=W0703
+                # It's reconnected on the next use
+                conn.close()
+            conn.idle_since = time.monotonic()
+            try:
+                if pool.pool is not conns:
+                    raise queue.Full
+                conns.put(conn, block=False)
+            except queue.Full:
+                conn.close()
+
     @staticmethod
     def _parse(json_data):
         """Try and parse the JSON returned from Telegram.
@@ -177,24 +451,29 @@ class Request:
 
         """
 
-        decoded_s = json_data.decode('utf-8', 'replace')
         try:
-            data = json.loads(decoded_s)
+            data = decode_json(json_data)
         except ValueError:
-            raise TelegramError('Invalid server response')
-
-        if not data.get('ok'):  # pragma: no cover
-            description = data.get('description')
-            parameters = data.get('parameters')
-            if parameters:
-                migrate_to_chat_id = parameters.get('migrate_to_chat_id')
-                if migrate_to_chat_id:
-                    raise ChatMigrated(migrate_to_chat_id)
-                retry_after = parameters.get('retry_after')
-                if retry_after:
-                    raise RetryAfter(retry_after)
-            if description:
-                return description
+            # Not valid UTF-8 or not valid JSON at all
+            try:
+                data = decode_json(json_data.decode('utf-8', 'replace'))
+            except ValueError:
+                raise TelegramError('Invalid server response')
+
+        if data.get('ok'):
+            return data['result']
+
+        description = data.get('description')
+        parameters = data.get('parameters')
+        if parameters:
+            migrate_to_chat_id = parameters.get('migrate_to_chat_id')
+            if migrate_to_chat_id:
+                raise ChatMigrated(migrate_to_chat_id)
+            retry_after = parameters.get('retry_after')
+            if retry_after:
+                raise RetryAfter(retry_after)
+        if description:
+            return description
 
         return data['result']
 
@@ -220,8 +499,64 @@ class Request:
         # Also set our user agent
         kwargs['headers']['user-agent'] = USER_AGENT
 
+        if self.metrics is None:
+            return self._handle_response(self._send(args, kwargs)[0])
+
+        # args[1] is the url, whose last part is the Bot API method or the file path
+        method = 'download' if '/file/bot' in args[1] else args[1].rpartition('/')[2]
+        start = self.metrics.start()
+        try:
+            resp, ttfb = self._send(args, kwargs, measure=True)
+            result = self._handle_response(resp)
+        except Exception as exc:
+            self.metrics.observe(method, start, error=exc)
+            raise
+        self.metrics.observe(method, start, ttfb=ttfb)
+        return result
+
+    @staticmethod
+    def _kind(args, kwargs):
+        url = args[1]
+        if '/file/bot' in url or 'fields' in kwargs:
+            return 'files'
+        if url.endswith('/getUpdates'):
+            return 'updates'
+        return 'send'
+
+    def _send(self, args, kwargs, measure=False):
+        """Passes the request through its bulkhead and the circuit breaker to _urlopen."""
+        bulkhead = self._bulkheads.get(self._kind(args, kwargs)) if self._bulkheads else None
+        if bulkhead is not None and not bulkhead.acquire(timeout=self._connect_timeout):
+            raise NetworkError('Too many concurrent {} requests'.format(
+                self._kind(args, kwargs)))
         try:
-            resp = self._con_pool.request(*args, **kwargs)
+            breaker = self.circuit_breaker
+            if breaker is None:
+                return self._urlopen(args, kwargs, measure)
+            breaker.before_request()
+            failed = True
+            try:
+                result = self._urlopen(args, kwargs, measure)
+                failed = result[0].status >= 500
+                return result
+            finally:
+                breaker.record(failed)
+        finally:
+            if bulkhead is not None:
+                bulkhead.release()
+
+    def _urlopen(self, args, kwargs, measure=False):
+        """Returns the response and, if measure is set, the time stamp its headers arrived at."""
+        try:
+            if not measure:
+                return self._con_pool.request(*args, **kwargs), None
+            resp = self._con_pool.request(*args, preload_content=False, **kwargs)
+            ttfb = time.perf_counter()
+            try:
+                resp.data  # pylint: disable=W0104
+            finally:
+                resp.release_conn()
+            return resp, ttfb
         except urllib3.exceptions.TimeoutError:
             raise TimedOut()
         except urllib3.exceptions.HTTPError as error:
@@ -229,6 +564,7 @@ class Request:
             # TODO: do something smart here; for now just raise NetworkError
             raise NetworkError('urllib3 HTTPError {}'.format(error))
 
+    def _handle_response(self, resp):
         if 200 <= resp.status <= 299:
             # 200-299 range are HTTP success statuses
             return resp.data
@@ -297,6 +633,8 @@ class Request:
 
         # Are we uploading files?
         files = False
+        # Frozen reply markups, whose cached JSON is put into the body as is
+        markups = {}
 
         for key, val in data.copy().items():
             if isinstance(val, InputFile):
@@ -306,6 +644,11 @@ class Request:
             elif isinstance(val, (float, int)):
                 # Urllib3 doesn't like floats it seems
                 data[key] = str(val)
+            elif isinstance(val, ReplyMarkup):
+                if getattr(val, '_json', None):
+                    markups[key] = data.pop(key)
+                else:
+                    data[key] = val.to_json()
             elif key == 'media':
                 # One media or multiple
                 if isinstance(val, InputMedia):
@@ -325,15 +668,47 @@ class Request:
 
         # Use multipart upload if we're uploading files, otherwise use JSON
         if files:
+            for key, markup in markups.items():
+                data[key] = markup.to_json()
             result = self._request_wrapper('POST', url, fields=data, **urlopen_kwargs)
         else:
+            body = encode_json(data)
+            if markups:
+                fields = [body[1:-1]] + [encode_json(key) + b':' + markup._json
+                                         for key, markup in markups.items()]
+                body = b'{' + b','.join(field for field in fields if field) + b'}'
             result = self._request_wrapper('POST', url,
-                                           body=json.dumps(data).encode('utf-8'),
+                                           body=body,
                                            headers={'Content-Type': 'application/json'},
                                            **urlopen_kwargs)
 
         return self._parse(result)
 
+    def post_json(self, url, body, timeout=None):
+        """Request an URL with an already JSON encoded body.
+
+        Args:
+            url (:obj:`str`): The web location we want to retrieve.
+            body (:obj:`bytes`): The UTF-8 encoded JSON body.
+            timeout (:obj:`int` | :obj:`float`): If this value is specified, use it as the read
+                timeout from the server (instead of the one specified during creation of the
+                connection pool).
+
+        Returns:
+          A JSON object.
+
+        """
+        urlopen_kwargs = {}
+
+        if timeout is not None:
+            urlopen_kwargs['timeout'] = Timeout(read=timeout, connect=self._connect_timeout)
+
+        result = self._request_wrapper('POST', url,
+                                       body=body,
+                                       headers={'Content-Type': 'application/json'},
+                                       **urlopen_kwargs)
+        return self._parse(result)
+
     def retrieve(self, url, timeout=None):
         """Retrieve the contents of a file by its URL.
 
@@ -18,12 +18,11 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 import sys
 import logging
+import warnings
 from telegram import Update
+from telegram.utils.deprecate import TelegramDeprecationWarning
+from telegram.utils.helpers import decode_json
 from threading import Lock
-try:
-    import ujson as json
-except ImportError:
-    import json
 from tornado.httpserver import HTTPServer
 from tornado.ioloop import IOLoop
 import tornado.web
@@ -66,11 +65,17 @@ class WebhookServer:
                           client_address, exc_info=True)
 
 
+def _warn_default_quote():
+    warnings.warn('default_quote is deprecated and ignored, messages take the quote setting of '
+                  'the Defaults of their bot', TelegramDeprecationWarning, stacklevel=3)
+
+
 class WebhookAppClass(tornado.web.Application):
 
     def __init__(self, webhook_path, bot, update_queue, default_quote=None):
-        self.shared_objects = {"bot": bot, "update_queue": update_queue,
-                               "default_quote": default_quote}
+        if default_quote is not None:
+            _warn_default_quote()
+        self.shared_objects = {"bot": bot, "update_queue": update_queue}
         handlers = [
             (r"{}/?".format(webhook_path), WebhookHandler,
              self.shared_objects)
@@ -119,9 +124,10 @@ class WebhookHandler(tornado.web.RequestHandler):
                     asyncio.set_event_loop_policy(WindowsSelectorEventLoopPolicy())
 
     def initialize(self, bot, update_queue, default_quote=None):
+        if default_quote is not None:
+            _warn_default_quote()
         self.bot = bot
         self.update_queue = update_queue
-        self._default_quote = default_quote
 
     def set_default_headers(self):
         self.set_header("Content-Type", 'application/json; charset="utf-8"')
@@ -129,13 +135,15 @@ class WebhookHandler(tornado.web.RequestHandler):
     def post(self):
         self.logger.debug('Webhook triggered')
         self._validate_post()
-        json_string = self.request.body.decode()
-        data = json.loads(json_string)
+        data = decode_json(self.request.body)
         self.set_status(200)
-        self.logger.debug('Webhook received data: ' + json_string)
-        data['default_quote'] = self._default_quote
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Webhook received data: %s', self.request.body.decode())
         update = Update.de_json(data, self.bot)
-        self.logger.debug('Received Update with ID %d on Webhook' % update.update_id)
+        if update.raw_data is not None:
+            # Saves encoding the data again for Update.raw_json
+            update._raw_json = self.request.body
+        self.logger.debug('Received Update with ID %d on Webhook', update.update_id)
         self.update_queue.put(update)
 
     def _validate_post(self):
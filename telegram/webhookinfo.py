@@ -53,6 +53,9 @@ class WebhookInfo(TelegramObject):
 
     """
 
+    __slots__ = ('url', 'has_custom_certificate', 'pending_update_count', 'last_error_date',
+                 'last_error_message', 'max_connections', 'allowed_updates')
+
     def __init__(self,
                  url,
                  has_custom_certificate,
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+# Run "python -m tests.test_benchmark" to print the numbers the tests check
+import pickle
+import sys
+import timeit
+import tracemalloc
+
+import pytest
+
+from telegram import Update, Message, User, Chat, MessageEntity, PhotoSize
+
+USER = {'id': 123456789, 'is_bot': False, 'first_name': 'Jane', 'last_name': 'Doe',
+        'username': 'jane_doe', 'language_code': 'en'}
+CHAT = {'id': -1001234567890, 'type': 'supergroup', 'title': 'A group', 'username': 'a_group'}
+ENTITY = {'type': 'bold', 'offset': 0, 'length': 5}
+PHOTO = {'file_id': 'AgACAgIAAxkBAAIBXl8', 'file_unique_id': 'AQADx7kxG', 'width': 320,
+         'height': 240, 'file_size': 12345}
+MESSAGE = {'message_id': 4242, 'from': USER, 'chat': CHAT, 'date': 1600000000,
+           'caption': 'Hello world', 'caption_entities': [ENTITY], 'photo': [PHOTO]}
+UPDATE = {'update_id': 868573637, 'message': MESSAGE}
+
+CASES = [(Update, UPDATE), (Message, MESSAGE), (User, USER), (Chat, CHAT),
+         (MessageEntity, ENTITY), (PhotoSize, PHOTO)]
+IDS = [cls.__name__ for cls, _ in CASES]
+
+
+class Plain:
+    """Holds the same attributes in a __dict__, like the objects did before __slots__."""
+
+
+def sizes(cls, data):
+    """Returns the size of a decoded object in bytes, without the objects it refers to, and
+    the size of a plain object holding the same attributes in its __dict__."""
+    obj = cls.de_json(data, None)
+    plain = Plain()
+    for name, value in obj.__getstate__().items():
+        setattr(plain, name, value)
+    return sys.getsizeof(obj), sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+
+
+def growth(cls, data, use, number=2000):
+    """Returns by how many bytes per object the memory grows, when ``use`` is called on each of
+    ``number`` decoded objects."""
+    objs = [cls.de_json(data, None) for _ in range(number)]
+    # Fills the caches, e.g. generates the serializers
+    use(cls.de_json(data, None))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for obj in objs:
+            use(obj)
+        return (tracemalloc.get_traced_memory()[0] - before) / number
+    finally:
+        tracemalloc.stop()
+
+
+def throughput(cls, data, number=10000):
+    """Returns the number of de_json and to_dict calls per second."""
+    obj = cls.de_json(data, None)
+    de_json = number / timeit.timeit(lambda: cls.de_json(data, None), number=number)
+    to_dict = number / timeit.timeit(obj.to_dict, number=number)
+    return de_json, to_dict
+
+
+def missing_item(obj):
+    try:
+        obj['custom']
+    except KeyError:
+        pass
+
+
+class TestBenchmark:
+    @pytest.mark.parametrize('cls, data', CASES, ids=IDS)
+    def test_size(self, cls, data):
+        slotted, plain = sizes(cls, data)
+        # Saves the __dict__, which takes more than the slots do
+        assert slotted < plain * 0.6
+
+    @pytest.mark.parametrize('use', [
+        pytest.param(lambda obj: obj.to_dict(), id='to_dict'),
+        pytest.param(lambda obj: str(obj), id='str'),
+        pytest.param(missing_item, id='getitem'),
+        pytest.param(lambda obj: pickle.dumps(obj), id='pickle', marks=pytest.mark.skipif(
+            sys.version_info < (3, 11), reason='__dict__ is created before 3.11'))
+    ])
+    @pytest.mark.parametrize('cls, data', CASES, ids=IDS)
+    def test_no_growth(self, cls, data, use):
+        # Reading __dict__ of a slotted object would create an empty one
+        assert growth(cls, data, use) < 8
+
+    @pytest.mark.parametrize('cls, data', CASES, ids=IDS)
+    def test_throughput(self, cls, data):
+        # Only checks that the benchmark runs, the numbers depend on the machine
+        assert all(rate > 0 for rate in throughput(cls, data, number=10))
+
+
+if __name__ == '__main__':
+    print('{:<14}{:>10}{:>10}{:>16}{:>16}'.format(
+        'class', 'slots B', 'dict B', 'de_json/s', 'to_dict/s'))
+    for cls, data in CASES:
+        print('{:<14}{:>10}{:>10}{:>16,.0f}{:>16,.0f}'.format(
+            cls.__name__, *sizes(cls, data), *throughput(cls, data)))
@@ -19,6 +19,7 @@
 import time
 import datetime as dtm
 from platform import python_implementation
+from threading import Event
 
 import pytest
 from flaky import flaky
@@ -28,7 +29,10 @@ from telegram import (Bot, Update, ChatAction, TelegramError, User, InlineKeyboa
                       ShippingOption, LabeledPrice, ChatPermissions, Poll, BotCommand,
                       InlineQueryResultDocument, Dice, MessageEntity, ParseMode)
 from telegram.error import BadRequest, InvalidToken, NetworkError, RetryAfter
+from telegram.ext import Defaults
 from telegram.utils.helpers import from_timestamp, escape_markdown
+from telegram.utils.promise import Promise
+from telegram.utils.request import Request
 from tests.conftest import expect_bad_request
 
 BASE_TIME = time.time()
@@ -76,6 +80,110 @@ class TestBot:
         with pytest.raises(InvalidToken):
             bot.get_me()
 
+    def test_non_blocking(self, monkeypatch):
+        def post(_, url, data, timeout=None):
+            time.sleep(0.2)
+            return data['message_id']
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+        bot = Bot('123:abcd', request=Request(con_pool_size=3))
+
+        start = time.perf_counter()
+        promises = [bot.delete_message(1, i, block=False) for i in range(3)]
+        assert all(isinstance(promise, Promise) for promise in promises)
+        assert Promise.gather(*promises, timeout=1) == [0, 1, 2]
+        assert time.perf_counter() - start < 0.5
+        assert bot.delete_message(1, 3, block=True) == 3
+
+    def test_id_without_request(self, monkeypatch):
+        def get(*args, **kwargs):
+            pytest.fail('No request expected')
+
+        monkeypatch.setattr('telegram.utils.request.Request.get', get)
+        assert Bot('1234:abcd').id == 1234
+
+    def test_defaults_without_request(self, monkeypatch):
+        calls = []
+
+        def post(_, url, data, timeout=None):
+            calls.append((url.rpartition('/')[2], data.get('parse_mode'), timeout))
+            return True
+
+        def get(*args, **kwargs):
+            pytest.fail('No request expected')
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+        monkeypatch.setattr('telegram.utils.request.Request.get', get)
+        bot = Bot('1234:abcd', defaults=Defaults(parse_mode=ParseMode.HTML, timeout=5))
+
+        bot.edit_message_text('text', 1, 2)
+        bot.send_message(1, 'text', parse_mode=None, timeout=None)
+        bot.send_message(1, 'text', ParseMode.MARKDOWN)
+        bot.send_photo(1, 'file_id', block=False).result()
+        Bot('1234:abcd').send_photo(1, 'file_id')
+        assert calls == [('editMessageText', ParseMode.HTML, 5),
+                         ('sendMessage', None, None),
+                         ('sendMessage', ParseMode.MARKDOWN, 5),
+                         ('sendPhoto', ParseMode.HTML, 5),
+                         ('sendPhoto', None, 20)]
+
+    def test_identity_file(self, monkeypatch, tmpdir):
+        calls = []
+        release, refreshed = Event(), Event()
+
+        def get(_, url, timeout=None):
+            calls.append(url.rpartition('/')[2])
+            if len(calls) > 2:
+                release.wait(1)
+            if url.endswith('/getMe'):
+                return {'id': 1234, 'first_name': 'Bot', 'is_bot': True,
+                        'username': 'name{}'.format(len(calls))}
+            if len(calls) == 4:
+                refreshed.set()
+            return [{'command': 'start', 'description': 'Start'}]
+
+        monkeypatch.setattr('telegram.utils.request.Request.get', get)
+        identity_file = str(tmpdir.join('identity.json'))
+
+        bot = Bot('1234:abcd', identity_file=identity_file)
+        assert bot.username == 'name1'
+        assert bot.commands == [BotCommand('start', 'Start')]
+        assert calls == ['getMe', 'getMyCommands']
+
+        # Read from the file, then refreshed in the background
+        bot = Bot('1234:abcd', identity_file=identity_file)
+        assert bot.username == 'name1'
+        assert bot.commands == [BotCommand('start', 'Start')]
+        release.set()
+        assert refreshed.wait(1)
+        assert calls == ['getMe', 'getMyCommands', 'getMe', 'getMyCommands']
+        assert bot.username == 'name3'
+
+        # The file of another bot is ignored
+        bot = Bot('5678:abcd', identity_file=identity_file)
+        assert bot.bot is None
+
+    @pytest.mark.parametrize('name', ['missing/identity.json', 'directory'])
+    def test_identity_file_not_writable(self, monkeypatch, tmpdir, caplog, name):
+        def get(_, url, timeout=None):
+            if url.endswith('/getMe'):
+                return {'id': 1234, 'first_name': 'Bot', 'is_bot': True, 'username': 'name'}
+            return [{'command': 'start', 'description': 'Start'}]
+
+        monkeypatch.setattr('telegram.utils.request.Request.get', get)
+        monkeypatch.setattr('telegram.utils.request.Request.post', lambda *args, **kwargs: True)
+        tmpdir.mkdir('directory')
+        identity_file = str(tmpdir.join(name))
+
+        bot = Bot('1234:abcd', identity_file=identity_file)
+        assert bot.username == 'name'
+        assert bot.get_me().username == 'name'
+        assert bot.get_my_commands() == [BotCommand('start', 'Start')]
+        assert bot.set_my_commands([BotCommand('help', 'Help')])
+        assert bot.commands == [BotCommand('help', 'Help')]
+        assert sorted(tmpdir.listdir()) == [tmpdir.join('directory')]
+        assert 'Could not write the identity file' in caplog.text
+
     @flaky(3, 1)
     @pytest.mark.timeout(10)
     def test_get_me_and_properties(self, bot):
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+from io import BytesIO
+from threading import Thread, Event
+
+import pytest
+
+from telegram import Bot, InlineKeyboardMarkup, InlineKeyboardButton, InputFile
+from telegram.error import Unauthorized, ChatMigrated, RetryAfter, BadRequest
+from telegram.ext import Broadcast
+
+
+@pytest.fixture(scope='function')
+def offline_bot():
+    return Bot('123:abcd')
+
+
+class TestBroadcast:
+    data = {'text': 'Hello', 'reply_markup': InlineKeyboardMarkup([[
+        InlineKeyboardButton('button', callback_data='data')]])}
+
+    def test_body(self, offline_bot):
+        broadcast = Broadcast(offline_bot, [], 'sendMessage', self.data)
+        body = json.loads(broadcast._body(-123).decode('utf-8'))
+        assert body == {'chat_id': -123, 'text': 'Hello',
+                        'reply_markup': self.data['reply_markup'].to_dict()}
+
+        broadcast = Broadcast(offline_bot, [], 'sendChatAction', {})
+        assert json.loads(broadcast._body('@channel').decode('utf-8')) == {'chat_id': '@channel'}
+
+    def test_no_files(self, offline_bot):
+        with pytest.raises(ValueError, match='not supported'):
+            Broadcast(offline_bot, [], 'sendPhoto', {'photo': InputFile(BytesIO(b'photo'))})
+
+    def test_run(self, monkeypatch, offline_bot):
+        calls = []
+
+        def post_json(_, url, body, timeout=None):
+            assert url.endswith('/sendMessage')
+            chat_id = json.loads(body.decode('utf-8'))['chat_id']
+            calls.append(chat_id)
+            if chat_id == 2:
+                raise Unauthorized('Forbidden: bot was blocked by the user')
+            if chat_id == -3:
+                raise ChatMigrated(-1003)
+            if chat_id == 4 and calls.count(4) == 1:
+                raise RetryAfter(0)
+            if chat_id == 5:
+                raise BadRequest('Chat not found')
+            return {}
+
+        monkeypatch.setattr('telegram.utils.request.Request.post_json', post_json)
+        broadcast = Broadcast(offline_bot, iter([1, 2, -3, 4, 5, 6]), 'sendMessage',
+                              self.data, workers=2).run()
+
+        assert sorted(calls) == [-1003, -3, 1, 2, 4, 4, 5, 6]
+        assert broadcast.sent == 4
+        assert broadcast.blocked == [2]
+        assert broadcast.migrated == {-3: -1003}
+        assert broadcast.failed == {5: 'Chat not found'}
+        assert broadcast.offset == 6
+
+    def test_resume(self, monkeypatch, offline_bot, tmpdir):
+        checkpoint_file = str(tmpdir.join('checkpoint.json'))
+        calls = []
+        stopped = Event()
+        broadcast = None
+
+        def post_json(_, url, body, timeout=None):
+            chat_id = json.loads(body.decode('utf-8'))['chat_id']
+            if chat_id == 2:
+                raise Unauthorized('Forbidden: bot was blocked by the user')
+            if chat_id == 10 and not stopped.is_set():
+                broadcast.stop()
+                stopped.set()
+                raise RetryAfter(0)
+            calls.append(chat_id)
+            return {}
+
+        monkeypatch.setattr('telegram.utils.request.Request.post_json', post_json)
+        broadcast = Broadcast(offline_bot, range(100), 'sendMessage', self.data, workers=1,
+                              burst_limit=1000, checkpoint_file=checkpoint_file)
+        thread = Thread(target=broadcast.run)
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert 10 in calls
+        assert broadcast.offset < 100
+
+        with open(checkpoint_file) as file:
+            checkpoint = json.load(file)
+        assert checkpoint['offset'] == broadcast.offset
+        assert checkpoint['blocked'] == [2]
+
+        resumed = Broadcast(offline_bot, range(100), 'sendMessage', self.data,
+                            burst_limit=1000, checkpoint_file=checkpoint_file)
+        assert resumed.offset == broadcast.offset
+        assert resumed.blocked == [2]
+        resumed.run()
+        assert resumed.offset == 100
+        assert resumed.sent == 99
+        assert set(calls) == set(range(100)) - {2}
@@ -46,16 +46,16 @@ class TestCallbackQuery:
     inline_message_id = 'inline_message_id'
     game_short_name = 'the_game'
 
-    def test_de_json(self, bot):
+    @pytest.mark.parametrize('default_bot', [{'quote': True}], indirect=True)
+    def test_de_json(self, default_bot):
         json_dict = {'id': self.id_,
                      'from': self.from_user.to_dict(),
                      'chat_instance': self.chat_instance,
                      'message': self.message.to_dict(),
                      'data': self.data,
                      'inline_message_id': self.inline_message_id,
-                     'game_short_name': self.game_short_name,
-                     'default_quote': True}
-        callback_query = CallbackQuery.de_json(json_dict, bot)
+                     'game_short_name': self.game_short_name}
+        callback_query = CallbackQuery.de_json(json_dict, default_bot)
 
         assert callback_query.id == self.id_
         assert callback_query.from_user == self.from_user
@@ -72,7 +72,8 @@ class TestChat:
         assert chat.permissions == self.permissions
         assert chat.slow_mode_delay == self.slow_mode_delay
 
-    def test_de_json_default_quote(self, bot):
+    @pytest.mark.parametrize('default_bot', [{'quote': True}], indirect=True)
+    def test_de_json_default_quote(self, default_bot):
         json_dict = {
             'id': self.id_,
             'type': self.type_,
@@ -81,10 +82,9 @@ class TestChat:
                 from_user=None,
                 date=None,
                 chat=None
-            ).to_dict(),
-            'default_quote': True
+            ).to_dict()
         }
-        chat = Chat.de_json(json_dict, bot)
+        chat = Chat.de_json(json_dict, default_bot)
 
         assert chat.pinned_message.default_quote is True
 
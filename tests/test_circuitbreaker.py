@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from telegram.error import NetworkError
+from telegram.utils.circuitbreaker import CircuitBreaker
+from telegram.utils.request import Request
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    status = 200
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.server.requests += 1
+        body = b'{"ok": true, "result": true}'
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='function')
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeApiHandler)
+    server.status = 200
+    server.requests = 0
+    server.url = 'http://127.0.0.1:{}/bot123:abcd/'.format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_threshold=0.5, window_size=4, minimum_requests=4)
+        for failed in (False, True, False):
+            breaker.before_request()
+            breaker.record(failed)
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failure_rate == pytest.approx(1 / 3)
+
+        breaker.before_request()
+        breaker.record(True)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.opened == 1
+        with pytest.raises(NetworkError, match='open'):
+            breaker.before_request()
+        assert breaker.rejected == 1
+
+    def test_window(self):
+        breaker = CircuitBreaker(failure_threshold=0.6, window_size=3, minimum_requests=3)
+        # 3 of 5 requests failed, but only one of the last three
+        for failed in (True, True, False, False, True):
+            breaker.before_request()
+            breaker.record(failed)
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failure_rate == pytest.approx(1 / 3)
+
+    def test_recovery(self):
+        changes = []
+        breaker = CircuitBreaker(minimum_requests=1, reset_timeout=0.05, trial_requests=2,
+                                 listener=lambda old, new: changes.append((old, new)))
+        breaker.before_request()
+        breaker.record(True)
+        assert breaker.state == CircuitBreaker.OPEN
+        time.sleep(0.06)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        # A failed trial request opens the breaker again
+        breaker.before_request()
+        breaker.record(True)
+        assert breaker.state == CircuitBreaker.OPEN
+        time.sleep(0.06)
+
+        breaker.before_request()
+        breaker.before_request()
+        with pytest.raises(NetworkError, match='half-open'):
+            breaker.before_request()
+        breaker.record(False)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.record(False)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        assert changes == [('closed', 'open'), ('open', 'half-open'), ('half-open', 'open'),
+                           ('open', 'half-open'), ('half-open', 'closed')]
+
+    def test_request(self, server):
+        breaker = CircuitBreaker(minimum_requests=2, reset_timeout=0.05)
+        request = Request(circuit_breaker=breaker)
+
+        server.status = 502
+        for _ in range(2):
+            with pytest.raises(NetworkError, match='Bad Gateway'):
+                request.post(server.url + 'sendMessage', {'chat_id': 1})
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(NetworkError, match='Circuit breaker is open'):
+            request.post(server.url + 'sendMessage', {'chat_id': 1})
+        assert server.requests == 2
+
+        server.status = 200
+        time.sleep(0.06)
+        assert request.post(server.url + 'sendMessage', {'chat_id': 1}) is True
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_bulkheads(self, server):
+        request = Request(connect_timeout=0.01, bulkheads={'files': 1, 'updates': 1})
+        # A running download
+        request._bulkheads['files'].acquire()
+        try:
+            with pytest.raises(NetworkError, match='Too many concurrent files requests'):
+                request.retrieve(server.url.replace('/bot', '/file/bot') + 'photo.jpg')
+            assert request.post(server.url + 'getUpdates', {'timeout': 0}) is True
+            assert request.post(server.url + 'sendMessage', {'chat_id': 1}) is True
+        finally:
+            request._bulkheads['files'].release()
+        assert request.retrieve(server.url.replace('/bot', '/file/bot') + 'photo.jpg')
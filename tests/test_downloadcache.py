@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import os
+from io import BytesIO
+
+import pytest
+
+from telegram import Bot
+from telegram.ext import DownloadCache
+
+
+@pytest.fixture(scope='function')
+def download_cache(tmpdir):
+    return DownloadCache(str(tmpdir.join('cache')), max_bytes=10)
+
+
+class TestDownloadCache:
+    def test_get_put(self, download_cache):
+        assert download_cache.get('unique') is None
+        download_cache.put('unique', b'12345')
+        assert download_cache.get('unique') == b'12345'
+        download_cache.put('unique', b'123')
+        assert download_cache.size == 3
+        assert len(download_cache) == 1
+
+        download_cache.put('too large', b'12345678901')
+        assert download_cache.get('too large') is None
+        # No temporary files are left behind
+        assert len(os.listdir(download_cache.directory)) == 1
+
+    def test_lru_eviction(self, download_cache):
+        download_cache.put('a', b'1234')
+        download_cache.put('b', b'1234')
+        assert download_cache.get('a') == b'1234'
+        download_cache.put('c', b'1234')
+        assert download_cache.get('b') is None
+        assert download_cache.get('a') == b'1234'
+        assert download_cache.size == 8
+        assert len(os.listdir(download_cache.directory)) == 2
+
+    def test_reload(self, download_cache):
+        download_cache.put('a', b'1234')
+        download_cache.put('b', b'1234')
+        cache = DownloadCache(download_cache.directory, max_bytes=10)
+        assert cache.size == 8
+        assert cache.get('a') == b'1234'
+
+        cache = DownloadCache(download_cache.directory, max_bytes=4)
+        assert len(cache) == 1
+
+        cache.clear()
+        assert os.listdir(download_cache.directory) == []
+
+    def test_file_info_expiry(self, monkeypatch, download_cache):
+        download_cache.put_file_info('id', {'file_id': 'id', 'file_path': 'path'})
+        download_cache.put_file_info('no path', {'file_id': 'no path'})
+        assert download_cache.get_file_info('id') == {'file_id': 'id', 'file_path': 'path'}
+        assert download_cache.get_file_info('no path') is None
+
+        monkeypatch.setattr('time.time', lambda: 10 ** 12)
+        assert download_cache.get_file_info('id') is None
+
+    def test_bot(self, monkeypatch, download_cache):
+        calls = []
+
+        def post(_, url, data, timeout=None):
+            calls.append(url)
+            return {'file_id': data['file_id'], 'file_unique_id': 'unique',
+                    'file_path': 'stickers/file.webp'}
+
+        def retrieve(_, url, timeout=None):
+            calls.append(url)
+            return b'content'
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+        monkeypatch.setattr('telegram.utils.request.Request.retrieve', retrieve)
+        bot = Bot('123:abcd', download_cache=download_cache)
+
+        assert bot.get_file('id').download_as_bytearray() == bytearray(b'content')
+        assert len(calls) == 2
+        file = bot.get_file('id')
+        assert file.file_path.endswith('/stickers/file.webp')
+        assert file.download(out=BytesIO()).getvalue() == b'content'
+        assert len(calls) == 2
+
+        # Another file_id of the same file
+        assert bot.get_file('other id').download_as_bytearray() == bytearray(b'content')
+        assert len(calls) == 3
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from threading import Event
+from time import sleep, perf_counter
+
+import pytest
+
+from telegram.error import RetryAfter, BadRequest
+from telegram.ext import EditCoalescer
+
+
+class TestEditCoalescer:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        self.calls = []
+
+    def edit_message_text(self, text, chat_id=None, message_id=None, inline_message_id=None):
+        self.calls.append((text, chat_id, message_id, inline_message_id, perf_counter()))
+        return text
+
+    def test_key(self):
+        assert EditCoalescer._key(self.edit_message_text, {'chat_id': 1, 'message_id': 2}) == (
+            'edit_message_text', 1, 2)
+        assert EditCoalescer._key(self.edit_message_text, {'inline_message_id': 'a'}) == (
+            'edit_message_text', 'a')
+        with pytest.raises(ValueError):
+            EditCoalescer._key(self.edit_message_text, {'chat_id': 1})
+
+    def test_latest_wins(self):
+        coalescer = EditCoalescer(interval=0.2)
+        try:
+            first = coalescer(self.edit_message_text, '0', chat_id=1, message_id=1)
+            assert first.result(timeout=1) == '0'
+            promises = [coalescer(self.edit_message_text, str(i), chat_id=1, message_id=1)
+                        for i in range(1, 10)]
+            other = coalescer(self.edit_message_text, 'other', inline_message_id='a')
+            assert all(p.result(timeout=1) == '9' for p in promises)
+            assert other.result(timeout=1) == 'other'
+        finally:
+            coalescer.stop()
+
+        texts = [call[0] for call in self.calls]
+        assert sorted(texts) == ['0', '9', 'other']
+        first, last = [call[4] for call in self.calls if call[1] == 1]
+        assert last - first >= 0.2
+
+    def test_exception(self):
+        def edit(chat_id, message_id):
+            raise BadRequest('Message is not modified')
+
+        coalescer = EditCoalescer(interval=0)
+        try:
+            promise = coalescer(edit, chat_id=1, message_id=1)
+            promise.done.wait(1)
+            assert isinstance(promise.exception, BadRequest)
+        finally:
+            coalescer.stop()
+
+    def test_retry_after(self):
+        flood = Event()
+
+        def edit(text, chat_id, message_id):
+            self.calls.append(text)
+            if not flood.is_set():
+                flood.set()
+                sleep(0.1)
+                raise RetryAfter(0.2)
+            return text
+
+        coalescer = EditCoalescer(interval=0)
+        try:
+            first = coalescer(edit, 'first', chat_id=1, message_id=1)
+            flood.wait(1)
+            second = coalescer(edit, 'second', chat_id=1, message_id=1)
+            assert first.result(timeout=1) == 'second'
+            assert second.result(timeout=1) == 'second'
+        finally:
+            coalescer.stop()
+        assert self.calls == ['first', 'second']
@@ -16,6 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
 import time
 import datetime as dtm
 
@@ -153,6 +154,13 @@ class TestHelpers:
         assert (helpers.from_timestamp(1573431976.1 - timezone.utcoffset(None).total_seconds())
                 == datetime)
 
+    def test_from_timestamp_utc_cached(self):
+        datetime = helpers.from_timestamp(1573431976)
+        assert datetime == dtm.datetime(2019, 11, 11, 0, 26, 16, tzinfo=dtm.timezone.utc)
+        assert helpers.from_timestamp(1573431976) is datetime
+        assert helpers.from_timestamp(1573431976.5) == datetime + dtm.timedelta(seconds=0.5)
+        assert helpers.from_timestamp(None) is None
+
     def test_create_deep_linked_url(self):
         username = 'JamesTheMock'
 
@@ -231,3 +239,19 @@ class TestHelpers:
         expected = r'[the\_name](tg://user?id=1)'
 
         assert expected == helpers.mention_markdown(1, 'the_name')
+
+    @pytest.mark.parametrize('fast_backend', [True, False])
+    def test_encode_decode_json(self, monkeypatch, fast_backend):
+        if not fast_backend:
+            monkeypatch.setattr(helpers, 'orjson', None)
+        obj = {'text': 'ünïcödé', 'ids': [1, -1001234567890], 'ok': True, 'none': None}
+
+        encoded = helpers.encode_json(obj)
+        assert isinstance(encoded, bytes)
+        assert helpers.decode_json(encoded) == obj
+        assert helpers.decode_json(encoded.decode('utf-8')) == obj
+        # Integers beyond 64 bit can be encoded with every backend
+        big = {'big': 2 ** 70 + 1}
+        assert json.loads(helpers.encode_json(big).decode()) == big
+        with pytest.raises(ValueError):
+            helpers.decode_json(b'{invalid')
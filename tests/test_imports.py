@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import subprocess
+import sys
+
+import pytest
+
+import telegram
+import telegram.ext
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7),
+                                reason='Names are only imported lazily on Python 3.7+')
+
+
+def run(code):
+    """Runs code in a fresh interpreter and returns the lines it printed and the -X importtime
+    report as dict of module name -> cumulative import time in microseconds."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', code],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+                            universal_newlines=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return result.stdout.split(), times
+
+
+class TestImports:
+    def test_lazy_names(self):
+        assert telegram.Update.__module__ == 'telegram.update'
+        assert telegram.ext.Updater.__module__ == 'telegram.ext.updater'
+        assert set(telegram.__all__) <= set(dir(telegram))
+        assert set(telegram.ext.__all__) <= set(dir(telegram.ext))
+        with pytest.raises(AttributeError, match='no attribute'):
+            telegram.NoSuchClass
+        with pytest.raises(AttributeError, match='no attribute'):
+            telegram.ext.NoSuchClass
+
+    def test_import_loads_nothing(self):
+        modules, _ = run('import sys, telegram, telegram.ext; '
+                         'print(*[m for m in sys.modules if m.startswith("telegram.")])')
+        assert set(modules) == {'telegram.version', 'telegram.ext'}
+
+    def test_no_cryptography_and_tornado(self):
+        modules, _ = run('import sys; from telegram import Bot, Update, PassportData; '
+                         'from telegram.ext import Updater, MessageHandler, Filters; '
+                         'print(*[m for m in ("cryptography", "tornado") if m in sys.modules])')
+        assert modules == []
+
+    def test_import_time(self):
+        # Guards against modules that are imported eagerly again: importing the packages must be
+        # much faster than importing e.g. the bot
+        _, times = run('import telegram, telegram.ext; '
+                       'from telegram import *; from telegram.ext import *')
+        slowest = max(time for name, time in times.items() if name.startswith('telegram.'))
+        assert times['telegram'] + times['telegram.ext'] < slowest / 5
@@ -17,10 +17,14 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
+import json
+from copy import deepcopy
+
 import pytest
 from flaky import flaky
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, ReplyMarkup
+from telegram.utils.request import Request
 
 
 @pytest.fixture(scope='class')
@@ -88,6 +92,68 @@ class TestInlineKeyboardMarkup:
         monkeypatch.setattr(bot, '_message', test)
         bot.send_message(123, 'test', reply_markup=inline_keyboard_markup)
 
+    def test_frozen(self):
+        buttons = [InlineKeyboardButton(text='button1', callback_data='data1')]
+        frozen = InlineKeyboardMarkup.frozen([buttons])
+        assert frozen.inline_keyboard == ((buttons[0],),)
+        assert frozen.to_dict() == {'inline_keyboard': [[buttons[0].to_dict()]]}
+
+        with pytest.raises(AttributeError, match='can not be changed'):
+            frozen.inline_keyboard = []
+        with pytest.raises(AttributeError, match='can not be changed'):
+            frozen.inline_keyboard[0][0].text = 'button2'
+        # The buttons passed are copied
+        buttons[0].text = 'button2'
+        assert frozen.inline_keyboard[0][0].text == 'button1'
+        assert '"button1"' in frozen.to_json()
+
+        copied = deepcopy(frozen)
+        copied.inline_keyboard[0][0].text = 'button3'
+        assert '"button3"' in copied.to_json()
+
+    def test_frozen_equality(self):
+        a = InlineKeyboardMarkup.frozen([[InlineKeyboardButton('button1', callback_data='data1')]])
+        b = InlineKeyboardMarkup.frozen([[InlineKeyboardButton('button1', callback_data='data1')]])
+        c = InlineKeyboardMarkup.frozen([[InlineKeyboardButton('button1', callback_data='data2')]])
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a != c
+        assert {a: 1}[b] == 1
+
+    def test_frozen_request_body(self, monkeypatch):
+        frozen = InlineKeyboardMarkup.frozen([[InlineKeyboardButton('button1', url='http://a')]])
+        bodies = []
+
+        def request_wrapper(*args, **kwargs):
+            bodies.append(kwargs['body'])
+            return b'{"ok": true, "result": true}'
+
+        request = Request()
+        monkeypatch.setattr(request, '_request_wrapper', request_wrapper)
+        request.post('url', {'chat_id': 123, 'reply_markup': frozen})
+        request.post('url', {'reply_markup': frozen})
+
+        assert all(frozen._json in body for body in bodies)
+        assert json.loads(bodies[0].decode()) == {'chat_id': '123',
+                                                  'reply_markup': frozen.to_dict()}
+        assert json.loads(bodies[1].decode()) == {'reply_markup': frozen.to_dict()}
+
+    def test_request_body(self, monkeypatch, inline_keyboard_markup):
+        bodies = []
+
+        def request_wrapper(*args, **kwargs):
+            bodies.append(kwargs['body'])
+            return b'{"ok": true, "result": true}'
+
+        request = Request()
+        monkeypatch.setattr(request, '_request_wrapper', request_wrapper)
+        request.post('url', {'chat_id': 123, 'reply_markup': inline_keyboard_markup})
+
+        # Markups that aren't frozen are sent as JSON string, like the bot methods do
+        assert json.loads(bodies[0].decode()) == {'chat_id': '123',
+                                                  'reply_markup': inline_keyboard_markup.to_json()}
+
     def test_to_dict(self, inline_keyboard_markup):
         inline_keyboard_markup_dict = inline_keyboard_markup.to_dict()
 
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import copy
+import pickle
+
+import pytest
+
+from telegram import Bot, Chat, Update, User
+from telegram.ext import InternCache
+
+
+@pytest.fixture(scope='function')
+def cached_bot(bot):
+    return Bot(bot.token, intern_cache=InternCache(maxsize=2))
+
+
+class TestInternCache:
+    user_data = {'id': 1, 'is_bot': False, 'first_name': 'first', 'username': 'user'}
+    chat_data = {'id': -1, 'type': 'group', 'title': 'title',
+                 'photo': {'small_file_id': 'small', 'small_file_unique_id': 'small_unique',
+                           'big_file_id': 'big', 'big_file_unique_id': 'big_unique'}}
+
+    def test_user(self, cached_bot):
+        user = User.de_json(dict(self.user_data), cached_bot)
+        assert User.de_json(dict(self.user_data), cached_bot) is user
+        assert user.bot is cached_bot
+        assert isinstance(user, User)
+        assert user.to_dict() == self.user_data
+
+        changed = User.de_json(dict(self.user_data, first_name='changed'), cached_bot)
+        assert changed is not user
+        assert changed == user
+        assert changed.first_name == 'changed'
+        assert User.de_json(dict(self.user_data, first_name='changed'), cached_bot) is changed
+        assert cached_bot.intern_cache.hits == 2
+        assert cached_bot.intern_cache.misses == 2
+
+    def test_chat(self, cached_bot):
+        chat = Chat.de_json(copy.deepcopy(self.chat_data), cached_bot)
+        assert Chat.de_json(copy.deepcopy(self.chat_data), cached_bot) is chat
+        assert chat.photo.big_file_id == 'big'
+        # Users and chats with the same id are cached separately
+        assert User.de_json(dict(self.user_data, id=-1), cached_bot) is not chat
+
+    def test_immutable(self, cached_bot):
+        user = User.de_json(dict(self.user_data), cached_bot)
+        with pytest.raises(AttributeError, match='can not be changed'):
+            user.first_name = 'changed'
+        with pytest.raises(AttributeError, match='can not be changed'):
+            del user.username
+        assert user.first_name == 'first'
+
+        user_copy = copy.copy(user)
+        assert type(user_copy) is User
+        user_copy.first_name = 'changed'
+        assert user_copy.first_name == 'changed'
+        assert user == user_copy
+        assert hash(user) == hash(user_copy)
+
+        plain = User(1, 'first', False, username='user')
+        assert {user: 'value'}[plain] == 'value'
+
+    def test_pickle(self, cached_bot):
+        user = User.de_json(dict(self.user_data), cached_bot)
+        # Pickling the bot is not of interest here
+        object.__setattr__(user, 'bot', None)
+        unpickled = pickle.loads(pickle.dumps(user))
+        assert type(unpickled) is User
+        assert unpickled.to_dict() == user.to_dict()
+
+    def test_lru_eviction(self, cached_bot):
+        cache = cached_bot.intern_cache
+        first = User.de_json(dict(self.user_data), cached_bot)
+        second = User.de_json(dict(self.user_data, id=2), cached_bot)
+        assert User.de_json(dict(self.user_data), cached_bot) is first
+        User.de_json(dict(self.user_data, id=3), cached_bot)
+        assert len(cache) == 2
+        assert User.de_json(dict(self.user_data), cached_bot) is first
+        assert User.de_json(dict(self.user_data, id=2), cached_bot) is not second
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_updates(self, cached_bot):
+        def update(update_id):
+            return Update.de_json({'update_id': update_id, 'message': {
+                'message_id': update_id, 'date': 1, 'text': 'text',
+                'from': dict(self.user_data), 'chat': {'id': 1, 'type': 'private'},
+                'reply_to_message': {'message_id': 1, 'date': 1,
+                                     'from': dict(self.user_data),
+                                     'chat': {'id': 1, 'type': 'private'}}}}, cached_bot)
+
+        first, second = update(2), update(3)
+        assert second.message.from_user is first.message.from_user
+        assert second.message.reply_to_message.from_user is first.message.from_user
+        assert second.effective_chat is first.effective_chat
+        assert second.to_dict()['message']['from'] == self.user_data
@@ -23,6 +23,7 @@ import pytest
 from telegram import (Update, Message, User, MessageEntity, Chat, Audio, Document, Animation,
                       Game, PhotoSize, Sticker, Video, Voice, VideoNote, Contact, Location, Venue,
                       Invoice, SuccessfulPayment, PassportData, ParseMode, Poll, PollOption, Dice)
+from telegram.utils.helpers import from_timestamp, to_timestamp
 from tests.test_passport import RAW_PASSPORT_DATA
 
 
@@ -173,6 +174,27 @@ class TestMessage:
 
         assert new.to_dict() == message_params.to_dict()
 
+    @pytest.mark.parametrize('lazy', [False, True])
+    def test_de_json_timestamps(self, bot, lazy):
+        json_dict = {'message_id': 1, 'date': 1573431976, 'edit_date': 1573431977,
+                     'chat': {'id': 1, 'type': Chat.PRIVATE}}
+        de_json = Message._de_json_lazy if lazy else Message.de_json
+        message = de_json(json_dict, bot)
+        # Serialized without converting the timestamps to datetimes and back
+        assert message.to_dict()['date'] == 1573431976
+        assert message._date == 1573431976
+
+        message = de_json(json_dict, bot)
+        assert message.date == from_timestamp(1573431976)
+        assert message.date is de_json(json_dict, bot).date
+        assert message.edit_date == from_timestamp(1573431977)
+        assert message.forward_date is None
+        assert message.to_dict()['date'] == 1573431976
+        assert message['date'] == message.date
+
+        message.date = datetime(2019, 11, 11)
+        assert message.to_dict()['date'] == to_timestamp(datetime(2019, 11, 11))
+
     def test_dict_approach(self, message):
         assert message['date'] == message.date
         assert message['chat_id'] == message.chat_id
@@ -305,6 +327,26 @@ class TestMessage:
                           text=text, entities=[bold_entity])
         assert expected == message.text_html
 
+    def test_text_many_nested_entities(self):
+        text = 'ab_' * 100
+        entities = [MessageEntity(MessageEntity.ITALIC, 0, len(text))]
+        entities += [MessageEntity(MessageEntity.BOLD, 3 * i, 2) for i in reversed(range(100))]
+        message = Message(1, self.from_user, self.date, self.chat,
+                          text=text, entities=entities)
+        assert message.text_html == '<i>' + '<b>ab</b>_' * 100 + '</i>'
+        assert len(message.parse_entities(MessageEntity.BOLD)) == 100
+        message.entities = entities[1:]
+        assert message.text_markdown_v2 == '*ab*\\_' * 100
+
+    def test_text_nested_entities_escaped(self):
+        text = 'a < b & c.d'
+        entities = [MessageEntity(MessageEntity.ITALIC, 0, len(text)),
+                    MessageEntity(MessageEntity.BOLD, 8, 3)]
+        message = Message(1, self.from_user, self.date, self.chat,
+                          text=text, entities=entities)
+        assert message.text_html == '<i>a &lt; b &amp; <b>c.d</b></i>'
+        assert message.text_markdown_v2 == '_a < b & *c\\.d*_'
+
     def test_text_markdown_emoji(self):
         text = b'\\U0001f469\\u200d\\U0001f469\\u200d ABC'.decode('unicode-escape')
         expected = b'\\U0001f469\\u200d\\U0001f469\\u200d *ABC*'.decode('unicode-escape')
@@ -825,6 +867,18 @@ class TestMessage:
         message._quote(kwargs)
         assert 'reply_to_message_id' in kwargs
 
+    @pytest.mark.parametrize('default_bot', [{'quote': False}], indirect=True)
+    def test_default_quote_from_defaults(self, default_bot):
+        message = Message(1, self.from_user, self.date, Chat(2, Chat.GROUP), bot=default_bot)
+        assert message.default_quote is False
+        kwargs = {}
+        message._quote(kwargs)
+        assert 'reply_to_message_id' not in kwargs
+
+        message.default_quote = True
+        assert message.default_quote is True
+        assert 'default_quote' not in message.to_dict()
+
     def test_equality(self):
         id_ = 1
         a = Message(id_, self.from_user, self.date, self.chat)
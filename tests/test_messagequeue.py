@@ -65,3 +65,96 @@ class TestDelayQueue:
             else:
                 fails.append(part)
         assert fails == []
+
+    def test_delayqueue_workers(self):
+        # Each call takes longer than the whole time window, so they only fit the limits if they
+        # are executed concurrently
+        calls = []
+
+        def call():
+            calls.append(perf_counter())
+            sleep(0.5)
+
+        dsp = mq.DelayQueue(burst_limit=10, time_limit_ms=200, workers=20)
+        starttime = perf_counter()
+        for _ in range(20):
+            dsp(call)
+        sleep(1)
+        dsp.stop()
+        assert dsp.is_alive() is False
+
+        assert len(calls) == 20
+        assert calls[-1] - starttime < 0.5
+        assert calls[-1] - calls[0] >= 0.2
+
+
+class TestChatDelayQueue:
+    def test_limits_per_chat(self):
+        calls = []
+        dsp = mq.ChatDelayQueue(burst_limit=2, time_limit_ms=300)
+        assert dsp.is_alive() is True
+
+        starttime = perf_counter()
+        for i in range(3):
+            dsp(1, lambda i=i: calls.append((1, i, perf_counter())))
+            dsp(2, lambda i=i: calls.append((2, i, perf_counter())))
+        sleep(0.5)
+        dsp.stop()
+        assert dsp.is_alive() is False
+
+        assert len(calls) == 6
+        for chat_id in (1, 2):
+            chat_calls = [c for c in calls if c[0] == chat_id]
+            assert [c[1] for c in chat_calls] == [0, 1, 2]
+            assert chat_calls[1][2] - starttime < 0.1
+            assert chat_calls[2][2] - chat_calls[0][2] >= 0.3
+
+    def test_prune(self):
+        dsp = mq.ChatDelayQueue(burst_limit=1, time_limit_ms=10, max_chats=2)
+        dsp(1, lambda: None)
+        dsp(2, lambda: None)
+        sleep(0.1)
+        dsp(3, lambda: None)
+        sleep(0.1)
+        dsp.stop()
+        assert set(dsp._chats) == {3}
+
+
+class TestMessageQueue:
+    class MockBot:
+        def __init__(self, msg_queue):
+            self._is_messages_queued_default = True
+            self._msg_queue = msg_queue
+
+        @mq.queuedmessage
+        def send_message(self, chat_id, text):
+            return chat_id, text
+
+    @pytest.mark.parametrize('chat_id,isgroup', [(123, False), ('123', False), (-123, True),
+                                                 ('-100123', True), ('@channel', True)])
+    def test_queuedmessage_infers_group(self, chat_id, isgroup):
+        calls = []
+
+        def msg_queue(prom, is_group_msg, chat_id=None):
+            calls.append((is_group_msg, chat_id))
+            prom.run()
+            return prom
+
+        bot = self.MockBot(msg_queue)
+        assert bot.send_message(chat_id, 'text').result() == (chat_id, 'text')
+        assert bot.send_message(chat_id=chat_id, text='text').result() == (chat_id, 'text')
+        assert bot.send_message(chat_id, 'text', isgroup=False).result() == (chat_id, 'text')
+        assert calls == [(isgroup, chat_id), (isgroup, chat_id), (False, chat_id)]
+
+    def test_group_limits_per_chat(self):
+        msg_queue = mq.MessageQueue(group_burst_limit=1, group_time_limit_ms=10000)
+        bot = self.MockBot(msg_queue)
+        try:
+            first = bot.send_message(-1, 'text')
+            second = bot.send_message(-2, 'text')
+            third = bot.send_message(-1, 'text')
+            assert first.result(timeout=1) == (-1, 'text')
+            assert second.result(timeout=1) == (-2, 'text')
+            assert third.result(timeout=0.5) is None
+        finally:
+            msg_queue.stop()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.request import urlopen
+
+import pytest
+
+from telegram.error import BadRequest, Unauthorized
+from telegram.utils.metrics import RequestMetrics, Histogram
+from telegram.utils.request import Request
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    responses = {
+        'sendMessage': (200, b'{"ok": true, "result": true}'),
+        'getChat': (400, b'{"ok": false, "description": "Bad Request: chat not found"}'),
+        'sendPhoto': (403, b'{"ok": false, "description": "Forbidden: bot was blocked"}'),
+    }
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        status, body = self.responses[self.path.rpartition('/')[2]]
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='function')
+def api_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeApiHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield 'http://127.0.0.1:{}/bot123:abcd/'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestRequestMetrics:
+    def test_histogram(self):
+        histogram = Histogram((0.1, 1.))
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+        assert histogram.cumulative() == [(0.1, 2), (1., 3), (float('inf'), 4)]
+
+    def test_request(self, api_url):
+        metrics = RequestMetrics()
+        request = Request(con_pool_size=1, metrics=metrics)
+
+        assert request.post(api_url + 'sendMessage', {'chat_id': 1, 'text': 'hi'}) is True
+        assert request.post(api_url + 'sendMessage', {'chat_id': 1, 'text': 'hi'}) is True
+        with pytest.raises(BadRequest):
+            request.post(api_url + 'getChat', {'chat_id': 1})
+        with pytest.raises(Unauthorized):
+            request.post(api_url + 'sendPhoto', {'chat_id': 1, 'photo': 'id'})
+
+        snapshot = metrics.snapshot()
+        send_message = snapshot['methods']['sendMessage']
+        assert send_message['requests'] == 2
+        assert send_message['errors'] == {}
+        assert send_message['total']['count'] == 2
+        assert send_message['ttfb']['count'] == 2
+        assert send_message['ttfb']['sum'] <= send_message['total']['sum']
+        assert snapshot['methods']['getChat']['errors'] == {'BadRequest': 1}
+        assert snapshot['methods']['sendPhoto']['errors'] == {'Unauthorized': 1}
+        # The connection is kept alive and reused
+        assert snapshot['pool'] == {'connections_in_use': 0, 'pool_exhausted': 0,
+                                    'connections_opened': 1}
+        assert sum(method['connect']['count'] for method in snapshot['methods'].values()) == 1
+
+    def test_pool_exhausted(self, monkeypatch):
+        metrics = RequestMetrics()
+        request = Request(con_pool_size=1, metrics=metrics)
+        pool = request._con_pool.connection_from_url('http://127.0.0.1:1/')
+
+        first = pool._get_conn()
+        second = pool._get_conn()
+        assert metrics.connections_in_use == 2
+        assert metrics.pool_exhausted == 1
+        pool._put_conn(first)
+        pool._put_conn(second)
+        assert metrics.connections_in_use == 0
+
+    def test_prometheus(self, api_url):
+        metrics = RequestMetrics(buckets=(1.,))
+        request = Request(metrics=metrics)
+        request.post(api_url + 'sendMessage', {'chat_id': 1, 'text': 'hi'})
+        with pytest.raises(BadRequest):
+            request.post(api_url + 'getChat', {'chat_id': 1})
+
+        text = metrics.to_prometheus()
+        assert '# TYPE telegram_requests_total counter' in text
+        assert 'telegram_requests_total{method="sendMessage"} 1' in text
+        assert 'telegram_request_errors_total{method="getChat",error="BadRequest"} 1' in text
+        assert ('telegram_request_duration_seconds_bucket{method="sendMessage",phase="total",'
+                'le="+Inf"} 1') in text
+        assert 'telegram_request_duration_seconds_count{method="getChat",phase="ttfb"} 0' in text
+        assert 'telegram_pool_connections_opened_total 1' in text
+        # The token is never part of the output
+        assert 'abcd' not in text
+
+        server = metrics.start_http_server(0, '127.0.0.1')
+        try:
+            url = 'http://127.0.0.1:{}/metrics'.format(server.server_address[1])
+            assert urlopen(url).read().decode('utf-8') == metrics.to_prometheus()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        metrics.reset()
+        assert metrics.snapshot()['methods'] == {}
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+from io import BytesIO
+
+import pytest
+
+from telegram import Bot, InlineKeyboardMarkup, InlineKeyboardButton, Message
+from telegram.ext import Defaults
+
+
+MESSAGE = (b'{"ok": true, "result": {"message_id": 1, "date": 0, "text": "Hi", '
+           b'"chat": {"id": 5, "type": "private"}}}')
+
+
+@pytest.fixture(scope='function')
+def offline_bot(monkeypatch):
+    bot = Bot('123:abcd', defaults=Defaults(parse_mode='HTML', quote=True))
+    bot.sent = []
+
+    def request_wrapper(method, url, **kwargs):
+        bot.sent.append((url, kwargs.get('body'), kwargs.get('timeout')))
+        return MESSAGE
+
+    monkeypatch.setattr(bot.request, '_request_wrapper', request_wrapper)
+    return bot
+
+
+class TestPreparedRequest:
+    keyboard = InlineKeyboardMarkup([[InlineKeyboardButton('Yes', callback_data='yes'),
+                                      InlineKeyboardButton('No', callback_data='no')]])
+
+    def test_send(self, offline_bot):
+        prepared = offline_bot.prepare('send_message', text='Hi', reply_markup=self.keyboard)
+        assert prepared.method == 'send_message'
+        assert prepared.dynamic_arguments == ('chat_id',)
+
+        message = prepared.send(chat_id=5)
+        assert isinstance(message, Message)
+        assert message.text == 'Hi'
+        assert message.default_quote is True
+
+        # The same request as without preparing it
+        offline_bot.send_message(5, 'Hi', reply_markup=self.keyboard)
+        (url, prepared_body, _), (expected_url, expected_body, _) = offline_bot.sent
+        assert url == expected_url == 'https://api.telegram.org/bot123:abcd/sendMessage'
+        assert json.loads(prepared_body.decode('utf-8')) == json.loads(
+            expected_body.decode('utf-8'))
+        assert json.loads(prepared_body.decode('utf-8'))['parse_mode'] == 'HTML'
+
+    def test_dynamic_arguments(self, offline_bot):
+        prepared = offline_bot.prepare('send_message', chat_id=5)
+        assert prepared.dynamic_arguments == ('text',)
+        prepared.send(text='Hi "there"', timeout=7)
+        _, body, timeout = offline_bot.sent[0]
+        assert json.loads(body.decode('utf-8')) == {'chat_id': '5', 'text': 'Hi "there"',
+                                                    'parse_mode': 'HTML'}
+        assert timeout.read_timeout == 7
+
+        # Other arguments take the regular way
+        prepared.send(text='Hi', reply_to_message_id=3)
+        _, body, _ = offline_bot.sent[1]
+        assert json.loads(body.decode('utf-8'))['reply_to_message_id'] == '3'
+
+    def test_errors(self, offline_bot):
+        with pytest.raises(ValueError, match='no method'):
+            offline_bot.prepare('send_nothing')
+        with pytest.raises(TypeError, match='unexpected keyword argument'):
+            offline_bot.prepare('send_message', txt='Hi')
+        with pytest.raises(ValueError, match='sending or editing messages'):
+            offline_bot.prepare('get_me')
+        with pytest.raises(ValueError, match='sending or editing messages'):
+            offline_bot.prepare('leave_chat')
+        with pytest.raises(ValueError, match='uploading files'):
+            offline_bot.prepare('send_photo', photo=BytesIO(b'\x89PNG'))
+        assert offline_bot.sent == []
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from telegram import TelegramError
+from telegram.utils.promise import Promise
+
+
+def run_later(promise, delay=0.05):
+    def target():
+        sleep(delay)
+        promise.run()
+
+    Thread(target=target).start()
+    return promise
+
+
+class TestPromise:
+    def test_run(self):
+        promise = Promise(lambda x, y: x + y, (1,), {'y': 2})
+        promise.run()
+        assert promise.done.is_set()
+        assert promise.result() == 3
+        assert promise.exception is None
+
+    def test_exception(self):
+        def raise_error():
+            raise TelegramError('Error')
+
+        promise = Promise(raise_error, (), {})
+        promise.run()
+        assert isinstance(promise.exception, TelegramError)
+        with pytest.raises(TelegramError, match='Error'):
+            promise.result()
+
+    def test_add_done_callback(self):
+        calls = []
+        promise = Promise(lambda: 1, (), {})
+        promise.add_done_callback(calls.append)
+        assert calls == []
+        promise.run()
+        assert calls == [promise]
+        # Already done promises call the callback immediately
+        promise.add_done_callback(calls.append)
+        assert calls == [promise, promise]
+
+    def test_then(self):
+        promise = run_later(Promise(lambda: 1, (), {}))
+        chained = promise.then(lambda result: result + 1).then(lambda result: result * 3)
+        assert chained.result(timeout=1) == 6
+
+    def test_then_exception(self):
+        def raise_error():
+            raise TelegramError('Error')
+
+        promise = run_later(Promise(raise_error, (), {}))
+        chained = promise.then(lambda result: result + 1)
+        chained.done.wait(1)
+        assert chained.exception is promise.exception
+
+    def test_gather(self):
+        promises = [run_later(Promise(lambda i=i: i, (), {}), 0.1) for i in range(5)]
+        assert Promise.gather(*promises, timeout=1) == list(range(5))
+
+    def test_gather_timeout(self):
+        done = Promise(lambda: 1, (), {})
+        done.run()
+        never = Promise(lambda: 2, (), {})
+        assert Promise.gather(done, never, timeout=0.05) == [1, None]
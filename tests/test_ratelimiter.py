@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from time import perf_counter
+
+import pytest
+
+from telegram import Bot
+from telegram.error import RetryAfter, BadRequest
+from telegram.ext import AdaptiveRateLimiter
+from telegram.ext.ratelimiter import TokenBucket
+
+
+class TestTokenBucket:
+    def test_reserve(self):
+        bucket = TokenBucket(10, burst=2, now=0)
+        assert bucket.reserve(0) == 0
+        assert bucket.reserve(0) == 0
+        assert bucket.reserve(0) == pytest.approx(0.1)
+        assert bucket.reserve(0) == pytest.approx(0.2)
+        # tokens are refilled over time
+        assert bucket.reserve(1) == 0
+
+    def test_aimd(self):
+        bucket = TokenBucket(10, max_rate=12, min_rate=3, now=0)
+        bucket.increase(0.1)
+        assert bucket.rate == pytest.approx(11)
+        bucket.increase(0.5)
+        assert bucket.rate == 12
+        bucket.decrease(0.5, now=0, retry_after=5)
+        assert bucket.rate == 6
+        assert bucket.reserve(0) == 5
+        bucket.decrease(0.1, now=0)
+        assert bucket.rate == 3
+
+    def test_is_idle(self):
+        bucket = TokenBucket(1, now=0)
+        assert bucket.is_idle(0)
+        bucket.reserve(0)
+        assert not bucket.is_idle(0.5)
+        assert bucket.is_idle(1)
+
+
+class TestAdaptiveRateLimiter:
+    def test_private_and_group_chats(self):
+        limiter = AdaptiveRateLimiter(private_chat_rate=2, group_chat_rate=0.5)
+        assert limiter.rate(1) == 2
+        assert limiter.rate(-1) == 0.5
+        assert limiter.rate('@channel') == 0.5
+        assert limiter.rate() == 30
+
+    def test_process_success(self):
+        limiter = AdaptiveRateLimiter(increase=0.1, max_rate_factor=2)
+        assert limiter.process(lambda: 'result', chat_id=1) == 'result'
+        assert limiter.rate() == pytest.approx(33)
+        assert limiter.rate(1) == pytest.approx(1.1)
+
+    def test_process_retry_after(self):
+        limiter = AdaptiveRateLimiter(private_chat_rate=100)
+        calls = []
+
+        def func():
+            calls.append(perf_counter())
+            if len(calls) == 1:
+                raise RetryAfter(0.2)
+            return True
+
+        assert limiter.process(func, chat_id=1) is True
+        assert len(calls) == 2
+        assert calls[1] - calls[0] >= 0.2
+        assert limiter.rate(1) == pytest.approx(50 + 1)
+        assert limiter.rate() == pytest.approx(30 * 1.01)
+
+    def test_process_retry_after_global(self):
+        limiter = AdaptiveRateLimiter(max_retries=1, increase=0)
+
+        def func():
+            raise RetryAfter(0)
+
+        with pytest.raises(RetryAfter):
+            limiter.process(func)
+        assert limiter.rate() == 30 * 0.5 * 0.5
+
+    def test_process_other_errors(self):
+        limiter = AdaptiveRateLimiter()
+
+        def func():
+            raise BadRequest('Chat not found')
+
+        with pytest.raises(BadRequest):
+            limiter.process(func, chat_id=1)
+        assert limiter.rate(1) == 1
+
+    def test_prune_idle_chats(self):
+        limiter = AdaptiveRateLimiter(max_idle_chats=2)
+        limiter.reserve(1)
+        limiter.rate(2)
+        limiter.rate(3)
+        assert set(limiter._chats) == {1, 3}
+
+    def test_bot_post(self, monkeypatch):
+        calls = []
+
+        def post(_, url, data, timeout=None):
+            calls.append((url, dict(data)))
+            data['chat_id'] = str(data['chat_id'])
+            if len(calls) == 1:
+                raise RetryAfter(0)
+            return True
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+        bot = Bot('123:abcd', rate_limiter=AdaptiveRateLimiter())
+
+        assert bot.delete_message(chat_id=1, message_id=2) is True
+        assert len(calls) == 2
+        assert calls[0] == calls[1]
+        assert calls[1][1] == {'chat_id': 1, 'message_id': 2}
+        assert bot.rate_limiter.rate(1) < 1
@@ -106,3 +106,15 @@ class TestReplyKeyboardMarkup:
         assert (reply_keyboard_markup_dict['one_time_keyboard']
                 == reply_keyboard_markup.one_time_keyboard)
         assert reply_keyboard_markup_dict['selective'] == reply_keyboard_markup.selective
+
+    def test_frozen(self):
+        frozen = ReplyKeyboardMarkup.frozen([['button1', KeyboardButton('button2')]],
+                                            resize_keyboard=True)
+        assert frozen.keyboard == (('button1', KeyboardButton('button2')),)
+        assert frozen.to_dict() == ReplyKeyboardMarkup(
+            [['button1', KeyboardButton('button2')]], resize_keyboard=True).to_dict()
+        assert frozen == ReplyKeyboardMarkup.frozen([['button1', KeyboardButton('button2')]],
+                                                    resize_keyboard=True)
+
+        with pytest.raises(AttributeError, match='can not be changed'):
+            frozen.selective = True
@@ -17,10 +17,69 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
+import socket
+import ssl
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
 import pytest
 
 from telegram import TelegramError
-from telegram.utils.request import Request
+from telegram.error import NetworkError
+from telegram.utils.request import (Request, _DNSCache, _ResumingSSLContext, _tuned_pool_class,
+                                    NewConnectionError)
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_HEAD(self):
+        self.server.probes += 1
+        if self.server.on_probe is not None:
+            self.server.on_probe()
+        self.send_response(302)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        body = b'{"ok": true, "result": true}'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='function')
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeApiHandler)
+    server.connections = server.probes = 0
+    server.lock = threading.Lock()
+    server.on_probe = None
+    server.url = 'http://localhost:{}/bot123:abcd/'.format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def wait_for(condition, timeout=1):
+    """The server counts connections and probes in its handler threads."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
 
 
 def test_replaced_unprintable_char():
@@ -42,3 +101,165 @@ def test_parse_illegal_json():
 
     with pytest.raises(TelegramError, match='Invalid server response'):
         Request._parse(server_response)
+
+
+def test_parse_ok():
+    server_response = b'{"ok": true, "result": [{"update_id": 1, "text": "\xc3\xbc"}]}'
+
+    assert Request._parse(server_response) == [{'update_id': 1, 'text': 'ü'}]
+
+
+def test_dns_cache(monkeypatch):
+    calls = []
+
+    def getaddrinfo(host, port, *args):
+        calls.append(host)
+        if len(calls) > 1:
+            raise socket.gaierror('Temporary failure in name resolution')
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port)),
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('::1', port, 0, 0))]
+
+    monkeypatch.setattr(socket, 'getaddrinfo', getaddrinfo)
+    cache = _DNSCache(0.05)
+    assert cache.resolve('example.com', 443) == ['10.0.0.1', '::1']
+    assert cache.resolve('example.com', 443) == ['10.0.0.1', '::1']
+    assert len(calls) == 1
+
+    # Expired, but resolving fails
+    time.sleep(0.06)
+    assert cache.resolve('example.com', 443) == ['10.0.0.1', '::1']
+    assert len(calls) == 2
+
+    cache.invalidate('example.com', 443)
+    assert cache.resolve('example.com', 443) == []
+
+
+@pytest.fixture(scope='function')
+def cached_host(monkeypatch):
+    """Resolves telegram.invalid to an address nobody listens on and to 127.0.0.1."""
+    original = socket.getaddrinfo
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        if host == 'telegram.invalid':
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port))
+                    for address in ('127.0.0.2', '127.0.0.1')]
+        return original(host, port, *args, **kwargs)
+
+    monkeypatch.setattr(socket, 'getaddrinfo', getaddrinfo)
+
+
+def test_dns_cache_connect(server, cached_host):
+    # Runs with the urllib3 the Request uses, i.e. the vendored one if it's installed
+    port = server.server_address[1]
+    request = Request(dns_cache_ttl=60, connect_timeout=1)
+    url = 'http://telegram.invalid:{}/bot123:abcd/sendMessage'.format(port)
+    try:
+        assert request.post(url, {'chat_id': 1}) is True
+        assert server.connections == 1
+
+        request._con_pool.clear()
+        server.shutdown()
+        server.server_close()
+        with pytest.raises(NetworkError):
+            request.post(url, {'chat_id': 1})
+    finally:
+        request.stop()
+
+
+def test_dns_cache_without_dns_host(server, cached_host):
+    class Connection:
+        # Like the connection class of the vendored urllib3, which has no _dns_host
+        def __init__(self, host, port):
+            self.host = host
+            self.port = port
+            self.timeout = 1
+            self.source_address = None
+            self.socket_options = None
+
+        def _new_conn(self):
+            raise AssertionError('Not resolved by the cache')
+
+    class Pool:
+        ConnectionCls = Connection
+
+    cache = _DNSCache(60)
+    conn = _tuned_pool_class(Pool, cache, None).ConnectionCls('telegram.invalid',
+                                                              server.server_address[1])
+    sock = conn._new_conn()
+    try:
+        assert sock.getpeername()[0] == '127.0.0.1'
+        assert conn.host == 'telegram.invalid'
+    finally:
+        sock.close()
+
+    server.shutdown()
+    server.server_close()
+    with pytest.raises(NewConnectionError):
+        conn._new_conn()
+    assert cache._entries == {}
+
+
+def test_warm_up_and_keep_alive(server):
+    request = Request(con_pool_size=2, prewarm_connections=4, dns_cache_ttl=60,
+                      keepalive_interval=0.05)
+    try:
+        assert request.prewarm_connections == 2
+        request.warm_up(server.url)
+        assert wait_for(lambda: server.connections == 2)
+        assert wait_for(lambda: server.probes >= 2)
+
+        assert request.post(server.url + 'sendMessage', {'chat_id': 1}) is True
+        assert server.connections == 2
+    finally:
+        request.stop()
+
+
+def test_keep_alive_probes_idle_connections(server):
+    request = Request(con_pool_size=3, keepalive_interval=60)
+    try:
+        request.warm_up(server.url, 3)
+        pool = request._con_pool.connection_from_url(server.url)
+        conns = [conn for conn in pool.pool.queue if conn is not None]
+        assert len(conns) == 3
+        conns[0].idle_since -= 50
+        conns[1].idle_since -= 60
+        conns[2].idle_since -= 120
+
+        # The other connections stay available while one is probed
+        available = []
+        server.on_probe = lambda: available.append(
+            len([conn for conn in pool.pool.queue if conn is not None]))
+        request._probe(pool)
+        assert server.probes == 2
+        assert available == [2, 2]
+        assert wait_for(lambda: server.connections == 3)
+
+        # Probed connections are idle again from now on
+        request._probe(pool)
+        assert server.probes == 2
+        assert sorted(pool.pool.queue, key=id) == sorted(conns, key=id)
+    finally:
+        request.stop()
+
+
+def test_tls_session_resumption(monkeypatch):
+    wrapped = []
+
+    def wrap_socket(self, sock, server_hostname=None, session=None):
+        wrapped.append((server_hostname, session))
+
+    monkeypatch.setattr(ssl.SSLContext, 'wrap_socket', wrap_socket)
+    request = Request(tls_session_resumption=True)
+    context = request._con_pool.connection_pool_kw['ssl_context']
+    assert isinstance(context, _ResumingSSLContext)
+
+    pool = request._con_pool.connection_from_url('https://api.telegram.org')
+    conn = pool._get_conn()
+    conn.sock = type('FakeSocket', (), {'session': 'session', 'close': lambda self: None})()
+    pool._put_conn(conn)
+    assert context.sessions == {'api.telegram.org': 'session'}
+
+    context.wrap_socket(None, server_hostname='api.telegram.org')
+    context.wrap_socket(None, server_hostname='example.com')
+    assert wrapped == [('api.telegram.org', 'session'), ('example.com', None)]
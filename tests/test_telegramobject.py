@@ -17,7 +17,12 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
+import gc
+import inspect
 import json as json_lib
+import pickle
+import sys
+from datetime import datetime, timezone
 
 import pytest
 
@@ -26,7 +31,8 @@ try:
 except ImportError:
     ujson = None
 
-from telegram import TelegramObject
+import telegram
+from telegram import TelegramObject, Message, User, Chat, Bot
 
 
 class TestTelegramObject:
@@ -83,3 +89,88 @@ class TestTelegramObject:
 
         subclass_instance = TelegramObjectSubclass()
         assert subclass_instance.to_dict() == {'a': 1}
+
+    def test_to_dict_field_kinds(self):
+        class TelegramObjectSubclass(TelegramObject):
+            __slots__ = ('from_user', 'users', 'rows', 'date', 'text', 'empty', 'bot', '_private')
+
+            _FIELD_KINDS = {'users': 'list', 'rows': 'lists', 'date': 'timestamp'}
+
+            def __init__(self):
+                self.from_user = User(1, 'a', False)
+                self.users = [User(2, 'b', False)]
+                self.rows = [['str', User(3, 'c', False)], []]
+                self.date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+                self.text = 'text'
+                self.empty = None
+                self.bot = 'bot'
+                self._private = 'private'
+
+        subclass_instance = TelegramObjectSubclass()
+        subclass_instance.custom = User(4, 'd', False)
+        assert subclass_instance.to_dict() == {
+            'from': {'id': 1, 'first_name': 'a', 'is_bot': False},
+            'users': [{'id': 2, 'first_name': 'b', 'is_bot': False}],
+            'rows': [['str', {'id': 3, 'first_name': 'c', 'is_bot': False}], []],
+            'date': 1577836800,
+            'text': 'text',
+            'custom': {'id': 4, 'first_name': 'd', 'is_bot': False}
+        }
+
+        # Unset attributes are left out
+        del subclass_instance.text
+        assert 'text' not in subclass_instance.to_dict()
+
+    def test_slots(self):
+        for name, cls in inspect.getmembers(telegram, inspect.isclass):
+            if issubclass(cls, TelegramObject) and cls is not Bot:
+                assert '__slots__' in cls.__dict__, name
+
+        message = Message(1, User(1, 'a', False), datetime.now(), Chat(1, 'private'), text='Hi')
+        message.to_dict()
+        if sys.version_info >= (3, 11):
+            # Reading __dict__ would create it
+            assert not any(type(referent) is dict for referent in gc.get_referents(message))
+        assert message.__dict__ == {}
+        message.custom = 'custom'
+        message._private = 'private'
+        assert message.to_dict()['custom'] == 'custom'
+        assert '_private' not in message.to_dict()
+
+    def test_getitem(self):
+        user = User(1, 'a', False)
+        assert user['first_name'] == 'a'
+        with pytest.raises(KeyError):
+            user['custom']
+        assert not any(type(referent) is dict for referent in gc.get_referents(user))
+
+        user.custom = 'custom'
+        assert user['first_name'] == 'a'
+        assert user['custom'] == 'custom'
+        with pytest.raises(KeyError):
+            user['unknown']
+        with pytest.raises(KeyError):
+            user['to_dict']
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason='__dict__ is created before 3.11')
+    def test_pickle_without_dict(self):
+        user = User(1, 'a', False, last_name='b')
+        unpickled = pickle.loads(pickle.dumps(user))
+        assert unpickled == user
+        for obj in (user, unpickled):
+            assert not any(type(referent) is dict for referent in gc.get_referents(obj))
+
+    def test_pickle(self):
+        user = User(1, 'a', False, last_name='b')
+        user.custom = 'custom'
+        unpickled = pickle.loads(pickle.dumps(user))
+        assert unpickled == user
+        assert unpickled.last_name == 'b'
+        assert unpickled.custom == 'custom'
+
+        # State of objects pickled before __slots__ were used
+        legacy = User.__new__(User)
+        legacy.__setstate__({'id': 1, 'first_name': 'a', 'is_bot': False, '_id_attrs': (1,)})
+        assert legacy == user
+        assert legacy.first_name == 'a'
+        assert legacy.__dict__ == {}
@@ -21,7 +21,8 @@ from queue import Queue
 
 import pytest
 
-from telegram import Bot
+from telegram import Bot, Update, Message, User, Chat
+from telegram.base import _freeze
 from telegram.ext import TypeHandler, CallbackContext, JobQueue
 
 
@@ -68,6 +69,17 @@ class TestTypeHandler:
         assert handler.check_update({'a': 1, 'b': 2})
         assert not handler.check_update(o)
 
+    @pytest.mark.parametrize('lazy_updates', [False, True])
+    def test_strict_update(self, monkeypatch, bot, lazy_updates):
+        monkeypatch.setattr(bot, 'lazy_updates', lazy_updates)
+        message = Message(1, User(1, 'a', False), None, Chat(1, 'private'), text='Text')
+        update = Update.de_json({'update_id': 1, 'message': message.to_dict()}, bot)
+        assert TypeHandler(Update, self.callback_basic, strict=True).check_update(update)
+
+        user = _freeze(User(1, 'a', False))
+        assert TypeHandler(User, self.callback_basic, strict=True).check_update(user)
+        assert not TypeHandler(Message, self.callback_basic, strict=True).check_update(user)
+
     def test_pass_job_or_update_queue(self, dp):
         handler = TypeHandler(dict, self.callback_queue_1, pass_job_queue=True)
         dp.add_handler(handler)
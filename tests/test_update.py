@@ -16,12 +16,17 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import copy
+import json
+import pickle
 
 import pytest
 
 from telegram import (Message, User, Update, Chat, CallbackQuery, InlineQuery,
-                      ChosenInlineResult, ShippingQuery, PreCheckoutQuery, Poll, PollOption)
+                      ChosenInlineResult, ShippingQuery, PreCheckoutQuery, Poll, PollOption,
+                      Credentials)
 from telegram.poll import PollAnswer
+from tests.test_passport import RAW_PASSPORT_DATA
 
 message = Message(1, User(1, '', False), None, Chat(1, ''), text='Text')
 
@@ -72,18 +77,158 @@ class TestUpdate:
                 assert getattr(update, type) == paramdict[type]
         assert i == 1
 
+    @pytest.mark.parametrize('paramdict', argvalues=params, ids=ids)
+    def test_de_json_lazy(self, monkeypatch, bot, paramdict):
+        json_dict = {'update_id': TestUpdate.update_id}
+        json_dict.update({k: v.to_dict() for k, v in paramdict.items()})
+        eager = Update.de_json(copy.deepcopy(json_dict), bot)
+        monkeypatch.setattr(bot, 'lazy_updates', True)
+        lazy = Update.de_json(json_dict, bot)
+
+        assert lazy == eager
+        assert eager == lazy
+        assert hash(lazy) == hash(eager)
+        assert isinstance(lazy, Update)
+        assert lazy.to_dict() == eager.to_dict()
+        for type in all_types:
+            assert getattr(lazy, type) == getattr(eager, type)
+        assert lazy.effective_chat == eager.effective_chat
+        assert lazy.effective_user == eager.effective_user
+        assert lazy.effective_message == eager.effective_message
+
+    def test_de_json_lazy_on_access(self, monkeypatch, bot):
+        decoded = []
+
+        def de_json(data, bot):
+            decoded.append(data['id'])
+            return User(data['id'], data['first_name'], data['is_bot'])
+
+        monkeypatch.setattr(User, 'de_json', de_json)
+        monkeypatch.setattr(bot, 'lazy_updates', True)
+        reply = Message(2, User(2, 'reply', False), None, Chat(1, ''), text='Reply')
+        json_dict = {'update_id': TestUpdate.update_id,
+                     'message': Message(3, User(3, 'from', False), None, Chat(1, ''), text='Text',
+                                        forward_from=User(4, 'forward', False),
+                                        reply_to_message=reply).to_dict()}
+        update = Update.de_json(json_dict, bot)
+
+        assert update.message.text == 'Text'
+        assert update.message.default_quote is None
+        assert decoded == []
+        assert update.message.from_user.id == 3
+        assert update.message.from_user is update.message.from_user
+        assert decoded == [3]
+        assert update.message.reply_to_message.text == 'Reply'
+        assert decoded == [3]
+        assert update.message.reply_to_message.from_user.id == 2
+        assert decoded == [3, 2]
+
+    def test_de_json_lazy_pickle(self, monkeypatch, bot):
+        json_dict = {'update_id': TestUpdate.update_id, 'message': message.to_dict()}
+        eager = Update.de_json(copy.deepcopy(json_dict), bot)
+        monkeypatch.setattr(bot, 'lazy_updates', True)
+        lazy = Update.de_json(json_dict, bot)
+        # Pickling the bot is not of interest here
+        lazy.message.bot = eager.message.bot = None
+
+        unpickled = pickle.loads(pickle.dumps(lazy))
+        assert type(unpickled) is Update
+        assert type(unpickled.message) is Message
+        assert type(copy.copy(lazy)) is Update
+        assert unpickled.to_dict() == eager.to_dict()
+        assert unpickled.message.chat == eager.message.chat
+        assert pickle.dumps(unpickled) == pickle.dumps(eager)
+
+    @pytest.mark.parametrize('lazy_updates', [False, True])
+    def test_de_json_keep_raw(self, monkeypatch, bot, lazy_updates):
+        json_dict = {'update_id': TestUpdate.update_id, 'message': message.to_dict()}
+        monkeypatch.setattr(bot, 'lazy_updates', lazy_updates)
+        update = Update.de_json(json_dict, bot)
+        assert update.raw_data is None
+        assert update.raw_json is None
+
+        monkeypatch.setattr(bot, 'keep_raw_updates', True)
+        update = Update.de_json(json_dict, bot)
+        assert update.raw_data is json_dict
+        assert json.loads(update.raw_json.decode()) == json_dict
+        assert update.message.chat == message.chat
+        assert update.raw_data == {'update_id': TestUpdate.update_id,
+                                   'message': message.to_dict()}
+
+    @pytest.mark.parametrize('lazy_updates', [False, True])
+    @pytest.mark.parametrize('thumb', [None, {'file_id': 'thumb_id', 'file_unique_id': 'thumb',
+                                              'width': 90, 'height': 90}])
+    def test_de_json_keep_raw_nested(self, monkeypatch, bot, lazy_updates, thumb):
+        audio = {'file_id': 'audio_id', 'file_unique_id': 'audio', 'duration': 3}
+        if thumb:
+            audio['thumb'] = thumb
+        json_dict = {'update_id': TestUpdate.update_id,
+                     'message': dict(message.to_dict(), audio=audio)}
+        original = copy.deepcopy(json_dict)
+        monkeypatch.setattr(bot, 'lazy_updates', lazy_updates)
+        monkeypatch.setattr(bot, 'keep_raw_updates', True)
+
+        update = Update.de_json(json_dict, bot)
+        assert update.message.audio.file_id == 'audio_id'
+        assert (update.message.audio.thumb is None) is (thumb is None)
+        assert update.raw_data == original
+        assert json.loads(update.raw_json.decode()) == original
+
     def test_update_de_json_empty(self, bot):
         update = Update.de_json(None, bot)
 
         assert update is None
 
-    def test_de_json_default_quote(self, bot):
+    @pytest.mark.parametrize('lazy_updates', [False, True])
+    def test_de_json_does_not_change_data(self, monkeypatch, bot, lazy_updates):
+        thumb = {'file_id': 'thumb_id', 'file_unique_id': 'thumb', 'width': 90, 'height': 90}
+        user = {'id': 2, 'is_bot': False, 'first_name': 'user'}
+        address = {'country_code': 'DE', 'state': '', 'city': 'Berlin', 'street_line1': 'a',
+                   'street_line2': '', 'post_code': '12345'}
+        json_dict = {'update_id': TestUpdate.update_id, 'message': dict(
+            message.to_dict(), date=1573431976, edit_date=1573431977,
+            entities=[{'type': 'text_mention', 'offset': 0, 'length': 4, 'user': user}],
+            reply_to_message=dict(message.to_dict(), forward_from=user),
+            audio={'file_id': 'audio_id', 'file_unique_id': 'audio', 'duration': 3,
+                   'thumb': thumb},
+            document={'file_id': 'document_id', 'file_unique_id': 'document', 'thumb': thumb},
+            sticker={'file_id': 'sticker_id', 'file_unique_id': 'sticker', 'width': 1,
+                     'height': 1, 'is_animated': False, 'thumb': thumb,
+                     'mask_position': {'point': 'eyes', 'x_shift': 0, 'y_shift': 0,
+                                       'scale': 1}},
+            venue={'location': {'longitude': 1., 'latitude': 2.}, 'title': 'venue',
+                   'address': 'here'},
+            game={'title': 'game', 'description': 'a game', 'photo': [thumb],
+                  'text_entities': [{'type': 'bold', 'offset': 0, 'length': 1}]},
+            successful_payment={'currency': 'EUR', 'total_amount': 1, 'invoice_payload': 'p',
+                                'telegram_payment_charge_id': 't',
+                                'provider_payment_charge_id': 'p',
+                                'order_info': {'shipping_address': address}},
+            passport_data=RAW_PASSPORT_DATA,
+            reply_markup={'inline_keyboard': [[{'text': 'button', 'callback_data': 'data'}]]})}
+        original = copy.deepcopy(json_dict)
+        monkeypatch.setattr(bot, 'lazy_updates', lazy_updates)
+
+        update = Update.de_json(json_dict, bot)
+        assert update.to_dict() == original
+        passport_data = update.message.passport_data
+        assert passport_data.decrypted_data
+        assert json_dict == original
+
+        credentials = passport_data.decrypted_credentials.to_dict()
+        original = copy.deepcopy(credentials)
+        assert Credentials.de_json(credentials, bot) == passport_data.decrypted_credentials
+        assert credentials == original
+
+    @pytest.mark.parametrize('default_bot', [{'quote': True}], indirect=True)
+    def test_de_json_default_quote(self, default_bot):
         json_dict = {'update_id': TestUpdate.update_id}
         json_dict['message'] = message.to_dict()
-        json_dict['default_quote'] = True
-        update = Update.de_json(json_dict, bot)
+        update = Update.de_json(json_dict, default_bot)
 
         assert update.message.default_quote is True
+        # The defaults are not written into the data
+        assert json_dict == {'update_id': TestUpdate.update_id, 'message': message.to_dict()}
 
     def test_to_dict(self, update):
         update_dict = update.to_dict()
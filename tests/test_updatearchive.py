@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+from io import BytesIO
+
+import pytest
+
+from telegram import Bot, Update
+from telegram.ext import UpdateArchive
+
+
+@pytest.fixture(scope='function')
+def raw_bot(bot):
+    return Bot(bot.token, keep_raw_updates=True)
+
+
+class TestUpdateArchive:
+    update_data = {'update_id': 1,
+                   'message': {'message_id': 2, 'date': 1441644592,
+                               'chat': {'id': 3, 'type': 'private', 'first_name': 'first'},
+                               'from': {'id': 3, 'is_bot': False, 'first_name': 'first'},
+                               'text': 'text'}}
+
+    def test_write_raw_json(self, raw_bot):
+        body = b'{"update_id": 1,\n "message": {"message_id": 2, "date": 1441644592}}'
+        update = Update.de_json(json.loads(body.decode()), raw_bot)
+        update._raw_json = body
+        file = BytesIO()
+        archive = UpdateArchive(file)
+
+        archive.write(update)
+        assert file.getvalue() == body.replace(b'\n', b' ') + b'\n'
+        assert archive.written == 1
+        assert archive.encoded == 0
+
+    def test_write_raw_data(self, raw_bot):
+        file = BytesIO()
+        archive = UpdateArchive(file)
+
+        archive.write(Update.de_json(self.update_data, raw_bot))
+        archive.write(Update.de_json(self.update_data, raw_bot))
+        lines = file.getvalue().splitlines()
+        assert len(lines) == 2
+        # Written as received, i.e. with 'from' instead of 'from_user'
+        assert json.loads(lines[0].decode()) == self.update_data
+        assert archive.encoded == 0
+
+    def test_write_without_raw_data(self, bot):
+        file = BytesIO()
+        archive = UpdateArchive(file)
+        update = Update.de_json(self.update_data, bot)
+
+        archive.callback(update, None)
+        assert json.loads(file.getvalue().decode()) == update.to_dict()
+        assert archive.written == 1
+        assert archive.encoded == 1
+
+    def test_file_name(self, raw_bot, tmpdir):
+        filename = str(tmpdir.join('updates.jsonl'))
+        archive = UpdateArchive(filename)
+        archive.write(Update.de_json(self.update_data, raw_bot))
+        archive.close()
+        archive = UpdateArchive(filename)
+        archive.write(Update.de_json(self.update_data, raw_bot))
+        archive.close()
+
+        with open(filename, 'rb') as file:
+            lines = file.read().splitlines()
+        assert [json.loads(line.decode()) for line in lines] == [self.update_data] * 2
@@ -35,7 +35,9 @@ import pytest
 
 from telegram import TelegramError, Message, User, Chat, Update, Bot
 from telegram.error import Unauthorized, InvalidToken, TimedOut, RetryAfter
-from telegram.ext import Updater, Dispatcher, DictPersistence
+from telegram.ext import Updater, Dispatcher, DictPersistence, Defaults
+from telegram.utils.deprecate import TelegramDeprecationWarning
+from telegram.utils.webhookhandler import WebhookAppClass, WebhookHandler
 
 signalskip = pytest.mark.skipif(sys.platform == 'win32',
                                 reason='Can\'t send signals without stopping '
@@ -225,6 +227,17 @@ class TestUpdater:
             tg_err = True
         assert tg_err
 
+    def test_webhook_default_quote_deprecated(self, bot):
+        queue = Queue()
+        with pytest.warns(TelegramDeprecationWarning, match='default_quote'):
+            app = WebhookAppClass('/TOKEN', bot, queue, default_quote=True)
+        assert app.shared_objects == {'bot': bot, 'update_queue': queue}
+
+        handler = object.__new__(WebhookHandler)
+        with pytest.warns(TelegramDeprecationWarning, match='default_quote'):
+            handler.initialize(bot, queue, default_quote=True)
+        assert handler.bot is bot
+
     def test_webhook_no_ssl(self, monkeypatch, updater):
         q = Queue()
         monkeypatch.setattr(updater.bot, 'set_webhook', lambda *args, **kwargs: True)
@@ -245,7 +258,7 @@ class TestUpdater:
         updater.stop()
 
     def test_webhook_default_quote(self, monkeypatch, updater):
-        updater._default_quote = True
+        monkeypatch.setattr(updater.bot, 'defaults', Defaults(quote=True))
         q = Queue()
         monkeypatch.setattr(updater.bot, 'set_webhook', lambda *args, **kwargs: True)
         monkeypatch.setattr(updater.bot, 'delete_webhook', lambda *args, **kwargs: True)
@@ -268,10 +281,33 @@ class TestUpdater:
         assert q.get(False).message.default_quote is True
         updater.stop()
 
+    def test_webhook_keep_raw_updates(self, monkeypatch, updater):
+        monkeypatch.setattr(updater.bot, 'keep_raw_updates', True)
+        q = Queue()
+        monkeypatch.setattr(updater.bot, 'set_webhook', lambda *args, **kwargs: True)
+        monkeypatch.setattr(updater.bot, 'delete_webhook', lambda *args, **kwargs: True)
+        monkeypatch.setattr('telegram.ext.Dispatcher.process_update', lambda _, u: q.put(u))
+
+        ip = '127.0.0.1'
+        port = randrange(1024, 49152)  # Select random port
+        updater.start_webhook(
+            ip,
+            port,
+            url_path='TOKEN')
+        sleep(.2)
+
+        update = Update(1, message=Message(1, User(1, '', False), None, Chat(1, ''),
+                                           text='Webhook'))
+        self._send_webhook_msg(ip, port, update.to_json(), 'TOKEN')
+        sleep(.2)
+        received = q.get(False)
+        assert received.raw_json == update.to_json().encode()
+        assert received.raw_data == update.to_dict()
+        updater.stop()
+
     @pytest.mark.skipif(not (sys.platform.startswith("win") and sys.version_info >= (3, 8)),
                         reason="only relevant on win with py>=3.8")
     def test_webhook_tornado_win_py38_workaround(self, updater, monkeypatch):
-        updater._default_quote = True
         q = Queue()
         monkeypatch.setattr(updater.bot, 'set_webhook', lambda *args, **kwargs: True)
         monkeypatch.setattr(updater.bot, 'delete_webhook', lambda *args, **kwargs: True)
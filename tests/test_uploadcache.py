@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2020
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from io import BytesIO
+
+import pytest
+
+from telegram import Bot, InputFile, InputMediaPhoto
+from telegram.error import BadRequest
+from telegram.ext import UploadCache
+
+
+@pytest.fixture(scope='function')
+def upload_bot():
+    return Bot('123:abcd', upload_cache=UploadCache())
+
+
+class TestUploadCache:
+    @staticmethod
+    def message(field, file_id):
+        attachment = {'file_id': file_id, 'file_unique_id': 'u' + file_id, 'width': 1,
+                      'height': 1, 'duration': 1, 'is_animated': False}
+        if field == 'photo':
+            attachment = [dict(attachment, file_id='small'), attachment]
+        return {'message_id': 1, 'date': 0, 'chat': {'id': 1, 'type': 'private'},
+                field: attachment}
+
+    def test_send_document(self, monkeypatch, upload_bot):
+        sent = []
+
+        def post(_, url, data, timeout=None):
+            sent.append(data['document'])
+            return self.message('document', 'doc_id')
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+
+        upload_bot.send_document(1, BytesIO(b'content'), filename='a.txt')
+        assert isinstance(sent[0], InputFile)
+        message = upload_bot.send_document(2, BytesIO(b'content'), filename='b.txt')
+        assert sent[1] == 'doc_id'
+        assert message.document.file_id == 'doc_id'
+        upload_bot.send_document(2, BytesIO(b'other content'))
+        assert isinstance(sent[2], InputFile)
+        assert len(upload_bot.upload_cache) == 2
+
+    def test_kind_and_bot_in_key(self, monkeypatch, upload_bot):
+        sent = []
+
+        def post(_, url, data, timeout=None):
+            field = 'photo' if 'photo' in data else 'sticker'
+            sent.append(data[field])
+            return self.message(field, field + '_id')
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+
+        upload_bot.send_photo(1, BytesIO(b'image'))
+        upload_bot.send_sticker(1, BytesIO(b'image'))
+        other_bot = Bot('456:abcd', upload_cache=upload_bot.upload_cache)
+        other_bot.send_photo(1, BytesIO(b'image'))
+        upload_bot.send_photo(1, BytesIO(b'image'))
+        assert [isinstance(value, InputFile) for value in sent] == [True, True, True, False]
+        # The largest photo size is remembered
+        assert sent[3] == 'photo_id'
+
+    def test_media_group(self, monkeypatch, upload_bot):
+        sent = []
+
+        def post(_, url, data, timeout=None):
+            sent.append([media.media for media in data['media']])
+            return [self.message('photo', 'id{}'.format(i)) for i in range(len(data['media']))]
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+
+        first = InputMediaPhoto(BytesIO(b'first'))
+        upload_bot.send_media_group(1, [first, InputMediaPhoto(BytesIO(b'second'))])
+        upload_bot.send_media_group(1, [InputMediaPhoto(BytesIO(b'new')),
+                                        InputMediaPhoto(BytesIO(b'second'))])
+        assert isinstance(sent[1][0], InputFile)
+        assert sent[1][1] == 'id1'
+        # The objects passed by the user are not modified
+        assert isinstance(first.media, InputFile)
+
+    def test_rejected_file_id(self, monkeypatch, upload_bot):
+        sent = []
+
+        def post(_, url, data, timeout=None):
+            sent.append(data['voice'])
+            if data['voice'] == 'stale_id':
+                raise BadRequest('Wrong file identifier/http url specified')
+            return self.message('voice', 'fresh_id')
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+
+        key = '123:voice:' + UploadCache.digest(InputFile(BytesIO(b'voice')))
+        upload_bot.upload_cache.put(key, 'stale_id')
+        upload_bot.send_voice(1, BytesIO(b'voice'))
+        assert sent[0] == 'stale_id'
+        assert isinstance(sent[1], InputFile)
+        assert upload_bot.upload_cache.get(key) == 'fresh_id'
+
+    def test_other_errors_not_retried(self, monkeypatch, upload_bot):
+        calls = []
+
+        def post(_, url, data, timeout=None):
+            calls.append(data['audio'])
+            raise BadRequest('Message caption is too long')
+
+        monkeypatch.setattr('telegram.utils.request.Request.post', post)
+
+        upload_bot.upload_cache.put('123:audio:' + UploadCache.digest(
+            InputFile(BytesIO(b'audio'))), 'audio_id')
+        with pytest.raises(BadRequest):
+            upload_bot.send_audio(1, BytesIO(b'audio'))
+        assert calls == ['audio_id']
+
+    def test_lru_and_persistence(self, tmpdir):
+        filename = str(tmpdir.join('uploads.json'))
+        cache = UploadCache(filename, max_entries=2)
+        cache.put('a', '1')
+        cache.put('b', '2')
+        assert cache.get('a') == '1'
+        cache.put('c', '3')
+        assert cache.get('b') is None
+
+        cache = UploadCache(filename, max_entries=2)
+        assert cache.get('a') == '1'
+        assert cache.get('c') == '3'
+        cache.invalidate('a')
+        assert UploadCache(filename).get('a') is None